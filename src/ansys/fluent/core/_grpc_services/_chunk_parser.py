@@ -22,7 +22,7 @@
 
 """Parses field data stream received from Fluent"""
 
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
 from functools import reduce
 from typing import Any
 import warnings
@@ -38,6 +38,64 @@ from ansys.fluent.core._grpc_services.field_data_service_v0 import (
 )
 
 
+class _FieldArena:
+    """Preallocated storage for the values of one (tag, surface, field) entry.
+
+    Each payload announces its size, and the space is reserved up front so that
+    the payload is written in place. When a field arrives in several payloads,
+    the buffer grows geometrically, which keeps assembly linear in the total
+    field size.
+    """
+
+    __slots__ = ("_buffer", "_size")
+
+    def __init__(self, dtype: npt.DTypeLike):
+        self._buffer = np.empty(0, dtype=dtype)
+        self._size = 0
+
+    def reserve(self, count: int) -> npt.NDArray[Any]:
+        """Reserve ``count`` values and return a writable view of them."""
+        required = self._size + count
+        if required > len(self._buffer):
+            if self._size == 0:
+                buffer = np.empty(required, dtype=self._buffer.dtype)
+            else:
+                buffer = np.empty(
+                    max(required, 2 * len(self._buffer)), dtype=self._buffer.dtype
+                )
+                buffer[: self._size] = self._buffer[: self._size]
+            self._buffer = buffer
+        view = self._buffer[self._size : required]
+        self._size = required
+        return view
+
+    def __len__(self) -> int:
+        return self._size
+
+    def release(self, count: int) -> None:
+        """Release the last ``count`` reserved values."""
+        self._size -= count
+
+    def array(self) -> npt.NDArray[Any]:
+        """Return the assembled field."""
+        if len(self._buffer) != self._size:
+            # Drop the spare capacity in place; no views of the buffer remain.
+            self._buffer.resize(self._size, refcheck=False)
+        return self._buffer
+
+
+def _assemble_fields(
+    arenas: dict[tuple[Any, int, str], _FieldArena],
+) -> dict[Any, dict[int, dict[str, npt.NDArray[Any]]]]:
+    """Assemble the nested ``tag -> surface -> field`` result from the arenas."""
+    fields_data = {}
+    for (payload_tag_id, surface_id, field_name), arena in arenas.items():
+        fields_data.setdefault(payload_tag_id, {}).setdefault(surface_id, {})[
+            field_name
+        ] = arena.array()
+    return fields_data
+
+
 class ChunkParserV0:
     """Class for parsing field data stream received from Fluent.
 
@@ -53,6 +111,8 @@ class ChunkParserV0:
         field : numpy array
     """
 
+    _np_data_types = _FieldDataConstantsV0.proto_field_type_to_np_data_type
+
     def __init__(self, callbacks_provider: object = None):
         """__init__ method of ChunkParserV0 class."""
         self._callbacks_provider = callbacks_provider
@@ -62,6 +122,64 @@ class ChunkParserV0:
 
         if callbacks_provider is set then callbacks are triggered with extracted data.
         """
+        arenas: dict[tuple[Any, int, str], _FieldArena] = {}
+        for (
+            payload_tag_id,
+            surface_id,
+            field_name,
+            field_type,
+            field_size,
+        ) in self._iter_payloads(chunk_iterator):
+            if self._callbacks_provider is not None:
+                field: npt.NDArray[Any] | None = None
+                if payload_tag_id is not None:
+                    field = self._read_field(
+                        field_type, field_size, surface_id, chunk_iterator
+                    )
+                for callback_data in self._callbacks_provider.callbacks():
+                    callback, args, kwargs = callback_data
+                    callback(surface_id, field_name, field, *args, **kwargs)
+            else:
+                self._read_field_into_arena(
+                    arenas,
+                    (payload_tag_id, surface_id, field_name),
+                    field_type,
+                    field_size,
+                    chunk_iterator,
+                )
+        return _assemble_fields(arenas)
+
+    def iter_fields(
+        self, chunk_iterator
+    ) -> Iterator[tuple[Any, int, str, npt.NDArray[Any]]]:
+        """Yields field data received from Fluent as each payload is decoded.
+
+        Yields
+        ------
+        tuple
+            ``(payload_tag_id, surface_id, field_name, field)`` for each payload.
+            A field sent in several payloads is yielded once per payload.
+        """
+        for (
+            payload_tag_id,
+            surface_id,
+            field_name,
+            field_type,
+            field_size,
+        ) in self._iter_payloads(chunk_iterator):
+            if payload_tag_id is not None:
+                yield payload_tag_id, surface_id, field_name, self._read_field(
+                    field_type, field_size, surface_id, chunk_iterator
+                )
+
+    def _iter_payloads(
+        self, chunk_iterator
+    ) -> Iterator[tuple[Any, int, str, Any, int]]:
+        """Yields the tag and header of each payload.
+
+        The payload values are read from ``chunk_iterator`` by the consumer
+        before the next header is requested.
+        """
 
         def _get_tag_for_surface_request() -> tuple[tuple[str, str]]:
             return (("type", "surface-data"),)
@@ -94,43 +212,8 @@ class ChunkParserV0:
                 ("field", pathlines_field_request.field),
             )
 
-        def _extract_field(
-            field_datatype: npt.DTypeLike, field_size: int, chunk_iterator
-        ) -> npt.NDArray[Any] | None:
-            field_arr = np.empty(field_size, dtype=field_datatype)
-            field_datatype_item_size = np.dtype(field_datatype).itemsize
-            index = 0
-            for chunk in chunk_iterator:
-                if chunk.bytePayload:
-                    count = min(
-                        len(chunk.bytePayload) // field_datatype_item_size,
-                        field_size - index,
-                    )
-                    field_arr[index : index + count] = np.frombuffer(
-                        chunk.bytePayload, field_datatype, count=count
-                    )
-                    index += count
-                    if index == field_size:
-                        return field_arr
-                else:
-                    payload: Sequence[float] = (
-                        chunk.floatPayload.payload
-                        or chunk.intPayload.payload
-                        or chunk.doublePayload.payload
-                        or chunk.longPayload.payload
-                    )
-                    count = len(payload)
-                    field_arr[index : index + count] = np.fromiter(
-                        payload, dtype=field_datatype
-                    )
-                    index += count
-                    if index == field_size:
-                        return field_arr
-
-        fields_data = dict[Any, dict[str, npt.NDArray[Any]]]()
         for chunk in chunk_iterator:
             payload_info = chunk.payloadInfo
-            surface_id = payload_info.surfaceId
             field_request_info = payload_info.fieldRequestInfo
             request_type = field_request_info.WhichOneof("request")
             if request_type is not None:
@@ -167,50 +250,92 @@ class ChunkParserV0:
                     )
                 else:
                     payload_tag_id = None
-            field: npt.NDArray[Any] | None = None
-            if payload_tag_id is not None:
-                if payload_info.fieldSize > 0:
-                    field = _extract_field(
-                        _FieldDataConstantsV0.proto_field_type_to_np_data_type[
-                            payload_info.fieldType
-                        ],
-                        payload_info.fieldSize,
-                        chunk_iterator,
-                    )
-                else:
-                    warnings.warn(
-                        f"Field data is not available for surface: {surface_id}"
-                    )
-                    field = np.array([])
+            yield (
+                payload_tag_id,
+                payload_info.surfaceId,
+                payload_info.fieldName,
+                payload_info.fieldType,
+                payload_info.fieldSize,
+            )
 
-            if self._callbacks_provider is not None:
-                for callback_data in self._callbacks_provider.callbacks():
-                    callback, args, kwargs = callback_data
-                    # print('cb', surface_id, payload_info.fieldName)
-                    callback(surface_id, payload_info.fieldName, field, *args, **kwargs)
+    @staticmethod
+    def _extract_field(
+        field_arr: npt.NDArray[Any], field_datatype: np.dtype, chunk_iterator
+    ) -> int:
+        field_size = len(field_arr)
+        index = 0
+        for chunk in chunk_iterator:
+            byte_payload = chunk.bytePayload
+            if byte_payload:
+                count = min(
+                    len(byte_payload) // field_datatype.itemsize,
+                    field_size - index,
+                )
+                # Zero-copy view of the payload, written once into place.
+                field_arr[index : index + count] = np.frombuffer(
+                    byte_payload, field_datatype, count=count
+                )
             else:
-                payload_data = fields_data.get(payload_tag_id)
-                if not payload_data:
-                    payload_data = fields_data[payload_tag_id] = {}
-                surface_data = payload_data.get(surface_id)
-                if surface_data:
-                    if payload_info.fieldName in surface_data:
-                        surface_data[payload_info.fieldName] = np.concatenate(
-                            (surface_data[payload_info.fieldName], field)
-                        )
-                    else:
-                        surface_data[payload_info.fieldName] = field
-                else:
-                    payload_data[surface_id] = {payload_info.fieldName: field}
-        return fields_data
+                payload: Sequence[float] = (
+                    chunk.floatPayload.payload
+                    or chunk.intPayload.payload
+                    or chunk.doublePayload.payload
+                    or chunk.longPayload.payload
+                )
+                count = min(len(payload), field_size - index)
+                field_arr[index : index + count] = np.fromiter(
+                    payload, dtype=field_datatype, count=count
+                )
+            index += count
+            if index == field_size:
+                break
+        return index
+
+    def _read_field(
+        self,
+        field_type,
+        field_size: int,
+        surface_id: int,
+        chunk_iterator,
+    ) -> npt.NDArray[Any]:
+        if field_size > 0:
+            field_datatype = np.dtype(self._np_data_types[field_type])
+            field = np.empty(field_size, dtype=field_datatype)
+            return field[: self._extract_field(field, field_datatype, chunk_iterator)]
+        warnings.warn(f"Field data is not available for surface: {surface_id}")
+        return np.array([])
+
+    def _read_field_into_arena(
+        self,
+        arenas: dict[tuple[Any, int, str], _FieldArena],
+        key: tuple[Any, int, str],
+        field_type,
+        field_size: int,
+        chunk_iterator,
+    ) -> None:
+        payload_tag_id, surface_id, _ = key
+        if payload_tag_id is None:
+            return
+        if field_size > 0:
+            field_datatype = np.dtype(self._np_data_types[field_type])
+            arena = arenas.get(key)
+            if arena is None or not len(arena):
+                arena = arenas[key] = _FieldArena(field_datatype)
+            filled = self._extract_field(
+                arena.reserve(field_size), field_datatype, chunk_iterator
+            )
+            arena.release(field_size - filled)
+        else:
+            warnings.warn(f"Field data is not available for surface: {surface_id}")
+            arenas.setdefault(key, _FieldArena(np.float64))
 
 
 class ChunkParser(ChunkParserV0):
     """Class for parsing field data stream received from Fluent."""
 
-    def extract_fields(self, chunk_iterator) -> dict[Any, dict[str, npt.NDArray[Any]]]:
-        """Extracts field data received from Fluent."""
+    _np_data_types = _FieldDataConstants.proto_field_type_to_np_data_type
 
+    def _iter_payloads(self, chunk_iterator):
         def _get_tag_for_surface_request():
             return (("type", "surface-data"),)
 
@@ -238,41 +363,8 @@ class ChunkParser(ChunkParserV0):
                 ("field", pathlines_field_request.field),
             )
 
-        def _extract_field(field_datatype, field_size, chunk_iterator):
-            field_arr = np.empty(field_size, dtype=field_datatype)
-            field_datatype_item_size = np.dtype(field_datatype).itemsize
-            index = 0
-            for chunk in chunk_iterator:
-                if chunk.byte_payload:
-                    count = min(
-                        len(chunk.byte_payload) // field_datatype_item_size,
-                        field_size - index,
-                    )
-                    field_arr[index : index + count] = np.frombuffer(
-                        chunk.byte_payload, field_datatype, count=count
-                    )
-                    index += count
-                    if index == field_size:
-                        return field_arr
-                else:
-                    payload = (
-                        chunk.float_payload.payload
-                        or chunk.int_payload.payload
-                        or chunk.double_payload.payload
-                        or chunk.long_payload.payload
-                    )
-                    count = len(payload)
-                    field_arr[index : index + count] = np.fromiter(
-                        payload, dtype=field_datatype
-                    )
-                    index += count
-                    if index == field_size:
-                        return field_arr
-
-        fields_data = {}
         for chunk in chunk_iterator:
             payload_info = chunk.payload_info
-            surface_id = payload_info.surface_id
             field_request_info = payload_info.field_request_info
             request_type = field_request_info.WhichOneof("request")
             if request_type is not None:
@@ -309,44 +401,41 @@ class ChunkParser(ChunkParserV0):
                     )
                 else:
                     payload_tag_id = None
-            field = None
-            if payload_tag_id is not None:
-                if payload_info.field_size > 0:
-                    field = _extract_field(
-                        _FieldDataConstants.proto_field_type_to_np_data_type[
-                            payload_info.field_type
-                        ],
-                        payload_info.field_size,
-                        chunk_iterator,
-                    )
-                else:
-                    warnings.warn(
-                        f"Field data is not available for surface: {surface_id}"
-                    )
-                    field = np.array([])
+            yield (
+                payload_tag_id,
+                payload_info.surface_id,
+                payload_info.field_name,
+                payload_info.field_type,
+                payload_info.field_size,
+            )
 
-            if self._callbacks_provider is not None:
-                for callback_data in self._callbacks_provider.callbacks():
-                    callback, args, kwargs = callback_data
-                    callback(
-                        surface_id, payload_info.field_name, field, *args, **kwargs
-                    )
+    @staticmethod
+    def _extract_field(field_arr, field_datatype, chunk_iterator):
+        field_size = len(field_arr)
+        index = 0
+        for chunk in chunk_iterator:
+            byte_payload = chunk.byte_payload
+            if byte_payload:
+                count = min(
+                    len(byte_payload) // field_datatype.itemsize,
+                    field_size - index,
+                )
+                # Zero-copy view of the payload, written once into place.
+                field_arr[index : index + count] = np.frombuffer(
+                    byte_payload, field_datatype, count=count
+                )
             else:
-                payload_data = fields_data.get(payload_tag_id)
-                if not payload_data:
-                    payload_data = fields_data[payload_tag_id] = {}
-                surface_data = payload_data.get(surface_id)
-                if surface_data:
-                    if payload_info.field_name in surface_data:
-                        surface_data.update(
-                            {
-                                payload_info.field_name: np.concatenate(
-                                    (surface_data[payload_info.field_name], field)
-                                )
-                            }
-                        )
-                    else:
-                        surface_data.update({payload_info.field_name: field})
-                else:
-                    payload_data[surface_id] = {payload_info.field_name: field}
-        return fields_data
+                payload = (
+                    chunk.float_payload.payloads
+                    or chunk.int_payload.payloads
+                    or chunk.double_payload.payloads
+                    or chunk.long_payload.payloads
+                )
+                count = min(len(payload), field_size - index)
+                field_arr[index : index + count] = np.fromiter(
+                    payload, dtype=field_datatype, count=count
+                )
+            index += count
+            if index == field_size:
+                break
+        return index
@@ -0,0 +1,202 @@
+# Copyright (C) 2021 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Bulk encoding of homogeneous numeric lists in settings ``Value`` messages.
+
+The settings protos hold a list as a ``ValueList`` of one nested ``Value``
+message per element, which makes building or reading a long list dominated by
+protobuf object creation. The wire bytes of such a list are regular though, so
+homogeneous real, integer and Boolean lists are encoded and decoded here with
+NumPy directly in the wire format and merged into (or serialized out of) the
+``ValueList`` message in one call.
+
+The v0 and v1 protos share the field numbers used below.
+"""
+
+from collections.abc import Sequence
+from typing import Any
+
+import numpy as np
+
+# Lists shorter than this go through the generic per-element path.
+_PACKED_MIN_LENGTH = 64
+
+# Wire-format tags: ValueList.lst(s) = 1, Value.boolean = 2, Value.integer = 3
+# and Value.real = 4.
+_LIST_ITEM_TAG = 0x0A
+_BOOLEAN_TAG = 0x10
+_INTEGER_TAG = 0x18
+_REAL_TAG = 0x21
+
+_REAL_ITEM = np.dtype([("header", "u1", 3), ("value", "<f8")])
+_BOOLEAN_ITEM = np.dtype([("header", "u1", 3), ("value", "u1")])
+
+_INT64_MAX = np.iinfo(np.int64).max
+
+
+def _as_numeric_array(value: Any) -> np.ndarray | None:
+    """Return ``value`` as a 1D real, integer or Boolean array if it is one."""
+    if isinstance(value, np.ndarray):
+        if value.ndim != 1 or len(value) < _PACKED_MIN_LENGTH:
+            return None
+        kind = value.dtype.kind
+        if kind == "f":
+            return value.astype("<f8", copy=False)
+        if kind == "i":
+            return value.astype(np.int64, copy=False)
+        if kind == "u":
+            return value.astype(np.int64) if value.max() <= _INT64_MAX else None
+        if kind == "b":
+            return value
+        return None
+    if not isinstance(value, (list, tuple)) or len(value) < _PACKED_MIN_LENGTH:
+        return None
+    item_type = type(value[0])
+    if item_type not in (float, int, bool):
+        return None
+    if not all(type(v) is item_type for v in value):
+        return None
+    try:
+        return np.array(value, dtype=(np.int64 if item_type is int else item_type))
+    except OverflowError:
+        return None
+
+
+def _encode_varints(values: np.ndarray) -> bytes:
+    """Encode int64 values as ``ValueList`` items holding ``Value.integer``."""
+    unsigned = values.view(np.uint64)
+    # Byte length of each varint; negative values always take 10 bytes.
+    lengths = np.ones(len(unsigned), dtype=np.intp)
+    for i in range(1, 10):
+        lengths += (unsigned >> np.uint64(7 * i)) != 0
+    item_lengths = lengths + 3
+    starts = np.cumsum(item_lengths) - item_lengths
+    out = np.empty(int(item_lengths.sum()), dtype=np.uint8)
+    out[starts] = _LIST_ITEM_TAG
+    out[starts + 1] = lengths + 1
+    out[starts + 2] = _INTEGER_TAG
+    for i in range(10):
+        has_byte = lengths > i
+        if not has_byte.any():
+            break
+        group = (unsigned[has_byte] >> np.uint64(7 * i)) & np.uint64(0x7F)
+        more = (lengths[has_byte] > i + 1).astype(np.uint64) << np.uint64(7)
+        out[starts[has_byte] + 3 + i] = group | more
+    return out.tobytes()
+
+
+def pack_value_list(value: Any) -> bytes | None:
+    """Encode a homogeneous numeric sequence as serialized ``ValueList`` bytes.
+
+    Parameters
+    ----------
+    value : Any
+        List, tuple or 1D NumPy array.
+
+    Returns
+    -------
+    bytes | None
+        Bytes to merge into ``Value.value_list``, or ``None`` if ``value`` is
+        short or not a homogeneous real, integer or Boolean sequence.
+    """
+    array = _as_numeric_array(value)
+    if array is None:
+        return None
+    kind = array.dtype.kind
+    if kind == "f":
+        items = np.empty(len(array), dtype=_REAL_ITEM)
+        items["header"] = (_LIST_ITEM_TAG, 9, _REAL_TAG)
+        items["value"] = array
+        return items.tobytes()
+    if kind == "b":
+        items = np.empty(len(array), dtype=_BOOLEAN_ITEM)
+        items["header"] = (_LIST_ITEM_TAG, 2, _BOOLEAN_TAG)
+        items["value"] = array
+        return items.tobytes()
+    return _encode_varints(array)
+
+
+def _decode_varints(data: np.ndarray, count: int) -> np.ndarray | None:
+    """Decode ``ValueList`` bytes made only of ``Value.integer`` items."""
+    # Every item is tag, length, integer tag and a varint whose bytes all have
+    # the high bit set except the last one. So each item holds exactly four
+    # bytes with a clear high bit and these delimit its parts.
+    markers = np.flatnonzero(data < 0x80)
+    if len(markers) != 4 * count:
+        return None
+    markers = markers.reshape(count, 4)
+    item_starts, length_pos, tag_pos, ends = markers.T
+    if (
+        item_starts[0] != 0
+        or ends[-1] != len(data) - 1
+        or not np.array_equal(item_starts[1:], ends[:-1] + 1)
+        or not np.array_equal(length_pos, item_starts + 1)
+        or not np.array_equal(tag_pos, item_starts + 2)
+        or not (data[item_starts] == _LIST_ITEM_TAG).all()
+        or not (data[tag_pos] == _INTEGER_TAG).all()
+        or not np.array_equal(data[length_pos], ends - length_pos)
+    ):
+        return None
+    lengths = ends - tag_pos
+    if lengths.max() > 10:
+        return None
+    is_varint = np.ones(len(data), dtype=bool)
+    is_varint[item_starts] = False
+    is_varint[length_pos] = False
+    is_varint[tag_pos] = False
+    groups = data[is_varint].astype(np.uint64) & np.uint64(0x7F)
+    varint_starts = np.cumsum(lengths) - lengths
+    shifts = np.arange(len(groups)) - np.repeat(varint_starts, lengths)
+    groups <<= (7 * shifts).astype(np.uint64)
+    return np.bitwise_or.reduceat(groups, varint_starts).view(np.int64)
+
+
+def unpack_value_list(value_list: Any, items: Sequence) -> np.ndarray | None:
+    """Decode a ``ValueList`` holding only reals, integers or Booleans.
+
+    Parameters
+    ----------
+    value_list : Any
+        ``Value.value_list`` message.
+    items : Sequence
+        Its repeated items field.
+
+    Returns
+    -------
+    np.ndarray | None
+        Decoded values, or ``None`` if the list is short or holds anything else
+        than reals only, integers only or Booleans only.
+    """
+    count = len(items)
+    if count < _PACKED_MIN_LENGTH:
+        return None
+    data = np.frombuffer(value_list.SerializeToString(), dtype=np.uint8)
+    if len(data) == count * _REAL_ITEM.itemsize:
+        decoded = data.view(_REAL_ITEM)
+        if (decoded["header"] == (_LIST_ITEM_TAG, 9, _REAL_TAG)).all():
+            return decoded["value"].copy()
+    if len(data) == count * _BOOLEAN_ITEM.itemsize:
+        decoded = data.view(_BOOLEAN_ITEM)
+        if (decoded["header"] == (_LIST_ITEM_TAG, 2, _BOOLEAN_TAG)).all():
+            return decoded["value"] != 0
+    return _decode_varints(data, count)
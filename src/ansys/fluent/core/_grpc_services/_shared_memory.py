@@ -0,0 +1,188 @@
+# Copyright (C) 2021 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Shared-memory transport of the bulk arrays of the SVAR and field data services.
+
+When PyFluent and Fluent run on the same node, the arrays can go through a
+shared memory region instead of the gRPC channel, which then only carries their
+metadata. The transport is negotiated through gRPC metadata on the existing
+calls, so that a server which does not support it is not affected:
+
+* The client offers the transport by sending the ``pyfluent-shared-memory``
+  metadata key with the value ``offer``.
+* A server which accepts it for a call returning arrays writes them to a shared
+  memory region, sends the name of the region as the value of the same key in
+  its initial metadata, and sends a descriptor of each array in place of its
+  bytes in the byte payloads. The region then belongs to the client, which
+  unlinks it once attached, as the call may end before the client reads it.
+* Once a server has accepted the transport, the client also sends arrays
+  through a region which it creates, with the name of the region as the value
+  of the key in the request metadata and descriptors in the byte payloads. The
+  client unlinks the region when the call returns.
+
+A descriptor holds the offset and the size in bytes of an array in the region,
+as two little-endian unsigned 64-bit integers.
+"""
+
+from collections.abc import Iterable, Iterator
+import logging
+from multiprocessing import shared_memory
+import struct
+from typing import Any
+
+import numpy as np
+
+SHARED_MEMORY_KEY = "pyfluent-shared-memory"
+SHARED_MEMORY_OFFER = "offer"
+
+_DESCRIPTOR = struct.Struct("<QQ")
+_BYTE_PAYLOAD_NAMES = ("byte_payload", "bytePayload")
+# Offsets of the arrays in a region are aligned for any dtype.
+_ALIGNMENT = 64
+
+logger = logging.getLogger("pyfluent.field_data")
+
+
+def offer_metadata(metadata: list[tuple[str, str]]) -> list[tuple[str, str]]:
+    """Add the offer of the shared-memory transport to the metadata of a call."""
+    return [*(metadata or ()), (SHARED_MEMORY_KEY, SHARED_MEMORY_OFFER)]
+
+
+def get_region_name(metadata: Iterable[tuple[str, str]] | None) -> str | None:
+    """Get the name of the shared memory region from the metadata of a call."""
+    for key, value in metadata or ():
+        if key == SHARED_MEMORY_KEY and value != SHARED_MEMORY_OFFER:
+            return value
+    return None
+
+
+def pack_descriptor(offset: int, size: int) -> bytes:
+    """Pack the descriptor of an array in a region."""
+    return _DESCRIPTOR.pack(offset, size)
+
+
+def unpack_descriptor(descriptor: bytes) -> tuple[int, int]:
+    """Unpack the offset and the size of an array in a region from its descriptor."""
+    return _DESCRIPTOR.unpack(descriptor)
+
+
+def close_region(region: shared_memory.SharedMemory) -> None:
+    """Close a shared memory region."""
+    try:
+        region.close()
+    except BufferError:
+        # Views of the region are still alive, it is closed when they are released.
+        logger.debug(f"Shared memory region {region.name} is closed later.")
+
+
+class _SharedMemoryMessage:
+    """Response whose byte payloads are read from a shared memory region."""
+
+    __slots__ = ("_message", "_buffer")
+
+    def __init__(self, message: Any, buffer: memoryview):
+        self._message = message
+        self._buffer = buffer
+
+    def __getattr__(self, name: str) -> Any:
+        value = getattr(self._message, name)
+        if name in _BYTE_PAYLOAD_NAMES:
+            if value:
+                offset, size = unpack_descriptor(value)
+                return self._buffer[offset : offset + size]
+        elif name == "payload":
+            return _SharedMemoryMessage(value, self._buffer)
+        return value
+
+
+def read_responses(responses: Iterable[Any], region_name: str) -> Iterator[Any]:
+    """Read the byte payloads of streamed responses from a shared memory region.
+
+    Parameters
+    ----------
+    responses : Iterable[Any]
+        Responses whose byte payloads hold descriptors.
+    region_name : str
+        Name of the region sent by the server.
+
+    Yields
+    ------
+    Any
+        Responses whose byte payloads are views of the region.
+    """
+    region = shared_memory.SharedMemory(name=region_name)
+    try:
+        region.unlink()
+        for response in responses:
+            yield _SharedMemoryMessage(response, region.buf)
+    finally:
+        close_region(region)
+
+
+def read_call(call: Any) -> Iterator[Any]:
+    """Read the responses of a streaming call, from shared memory if the server sent them there.
+
+    The initial metadata of the call is only waited for when the first response
+    is requested, so that several calls can be started before any is read.
+    """
+    region_name = get_region_name(call.initial_metadata())
+    if region_name is None:
+        yield from call
+    else:
+        yield from read_responses(call, region_name)
+
+
+class OutgoingRegion:
+    """Shared memory region created by the client to send arrays.
+
+    Parameters
+    ----------
+    arrays : list[np.ndarray]
+        Contiguous arrays, which are copied into the region.
+    """
+
+    def __init__(self, arrays: list[np.ndarray]):
+        offsets = []
+        size = 0
+        for array in arrays:
+            offsets.append(size)
+            size += -(-array.nbytes // _ALIGNMENT) * _ALIGNMENT
+        self._region = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        self.descriptors = []
+        for array, offset in zip(arrays, offsets):
+            self._region.buf[offset : offset + array.nbytes] = array.reshape(-1).view(
+                np.uint8
+            )
+            self.descriptors.append(pack_descriptor(offset, array.nbytes))
+
+    @property
+    def name(self) -> str:
+        """Name of the region."""
+        return self._region.name
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb) -> None:
+        self._region.unlink()
+        close_region(self._region)
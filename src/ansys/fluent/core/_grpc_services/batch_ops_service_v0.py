@@ -119,6 +119,10 @@ class BatchOpsService(ServiceProtocol):
         response_cls = self._get_response_cls(package, service, method)
         return response_cls is not None, response_cls
 
+    def get_status_name(self, status: int) -> str:
+        """Return the name of an ``ExecuteStatus`` value."""
+        return self._proto_module.ExecuteStatus.Name(status)
+
     def execute(self, ops: list) -> list[tuple]:
         """Execute a batch of queued operations and return ``(status, result)`` pairs.
 
@@ -26,7 +26,9 @@ import grpc
 import numpy as np
 
 from ansys.api.fluent.v1 import field_data_pb2, field_data_pb2_grpc
+from ansys.fluent.core._grpc_services import _shared_memory
 from ansys.fluent.core._grpc_services.streaming_service import StreamingService
+from ansys.fluent.core.module_config import config
 from ansys.fluent.core.services._protocols import ServiceProtocol
 from ansys.fluent.core.services.interceptors import (
     BatchInterceptor,
@@ -325,11 +327,21 @@ class FieldDataService(  # pyright: ignore[reportUnsafeMultipleInheritance]
         RuntimeError
             If an empty chunk encountered during field extraction.
         """
-        chunk_iterator = self._stub.GetFields(request, metadata=self._metadata)
+        use_shared_memory = config.use_shared_memory_transport
+        chunk_iterator = self._stub.GetFields(
+            request,
+            metadata=(
+                _shared_memory.offer_metadata(self._metadata)
+                if use_shared_memory
+                else self._metadata
+            ),
+        )
         if not chunk_iterator.is_active():
             raise RuntimeError(
                 "Unexpectedly encountered empty chunk during field extraction."
             )
+        if use_shared_memory:
+            return _shared_memory.read_call(chunk_iterator)
         return chunk_iterator
 
     def is_data_available(
@@ -344,44 +356,50 @@ class FieldDataService(  # pyright: ignore[reportUnsafeMultipleInheritance]
         response = self.is_data_available(request)
         return response.is_data_available
 
-    def get_solver_mesh_nodes_float(
-        self, domain_id: int, thread_id: int
-    ) -> list[float]:
-        """Get mesh node -> floating point precision."""
+    def iter_solver_mesh_nodes_float(self, domain_id: int, thread_id: int):
+        """Iterate over streamed mesh nodes -> floating point precision."""
         request = field_data_pb2.GetSolverMeshNodesRequest(
             domain_id=domain_id, thread_id=thread_id
         )
         responses = self._stub.GetSolverMeshNodesFloat(request, metadata=self._metadata)
-        nested_nodes = []
         for response in responses:
-            nested_nodes.append(response.nodes)
-        return nested_nodes
+            yield response.nodes
 
-    def get_solver_mesh_nodes_double(
-        self, domain_id: int, thread_id: int
-    ) -> list[float]:
-        """Get mesh node -> double precision."""
+    def iter_solver_mesh_nodes_double(self, domain_id: int, thread_id: int):
+        """Iterate over streamed mesh nodes -> double precision."""
         request = field_data_pb2.GetSolverMeshNodesRequest(
             domain_id=domain_id, thread_id=thread_id
         )
         responses = self._stub.GetSolverMeshNodesDouble(
             request, metadata=self._metadata
         )
-        nested_nodes = []
         for response in responses:
-            nested_nodes.append(response.nodes)
-        return nested_nodes
+            yield response.nodes
 
-    def get_solver_mesh_elements(self, domain_id: int, thread_id: int) -> list[float]:
-        """Get mesh elements."""
+    def iter_solver_mesh_elements(self, domain_id: int, thread_id: int):
+        """Iterate over streamed mesh elements."""
         request = field_data_pb2.GetSolverMeshElementsRequest(
             domain_id=domain_id, thread_id=thread_id
         )
         responses = self._stub.GetSolverMeshElements(request, metadata=self._metadata)
-        elementss = []
         for response in responses:
-            elementss.append(response.elements)
-        return elementss
+            yield response.elements
+
+    def get_solver_mesh_nodes_float(
+        self, domain_id: int, thread_id: int
+    ) -> list[float]:
+        """Get mesh node -> floating point precision."""
+        return list(self.iter_solver_mesh_nodes_float(domain_id, thread_id))
+
+    def get_solver_mesh_nodes_double(
+        self, domain_id: int, thread_id: int
+    ) -> list[float]:
+        """Get mesh node -> double precision."""
+        return list(self.iter_solver_mesh_nodes_double(domain_id, thread_id))
+
+    def get_solver_mesh_elements(self, domain_id: int, thread_id: int) -> list[float]:
+        """Get mesh elements."""
+        return list(self.iter_solver_mesh_elements(domain_id, thread_id))
 
 
 class _FetchFieldData:
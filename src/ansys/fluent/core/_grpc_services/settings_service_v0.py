@@ -23,11 +23,16 @@
 """Wrapper over the settings gRPC service of Fluent (v0 proto API)."""
 
 import collections.abc
+import numbers
 from typing import Any
 
 import grpc
 
 from ansys.api.fluent.v0 import settings_pb2, settings_pb2_grpc
+from ansys.fluent.core._grpc_services._packed_values import (
+    pack_value_list,
+    unpack_value_list,
+)
 from ansys.fluent.core.services._protocols import ServiceProtocol
 from ansys.fluent.core.services.interceptors import (
     BatchInterceptor,
@@ -66,22 +71,28 @@ class SettingsService(ServiceProtocol):
             return
         if isinstance(value, bool):
             state.boolean = value
-        elif isinstance(value, int):
-            state.integer = value
-        elif isinstance(value, float):
-            state.real = value
+        elif isinstance(value, numbers.Integral):
+            state.integer = int(value)
+        elif isinstance(value, numbers.Real):
+            state.real = float(value)
         elif isinstance(value, str):
             state.string = value
         elif isinstance(value, collections.abc.Mapping):
             for k, v in value.items():
                 self._set_state_from_value(state.value_map.m[k], v)
         elif isinstance(value, collections.abc.Iterable):
+            packed = pack_value_list(value)
+            if packed is not None:
+                state.value_list.MergeFromString(packed)
+                return
             for v in value:
                 self._set_state_from_value(getattr(state.value_list, "lst").add(), v)
         else:  # fall back to string (for example, pathlib.Path)
             state.string = str(value)
 
-    def _get_state_from_value(self, state: settings_pb2.Value) -> Any:
+    def _get_state_from_value(
+        self, state: settings_pb2.Value, as_array: bool = False
+    ) -> Any:
         t = state.WhichOneof("value")
         if t == "boolean":
             return state.boolean
@@ -92,12 +103,14 @@ class SettingsService(ServiceProtocol):
         elif t == "string":
             return state.string
         elif t == "value_list":
-            return [
-                self._get_state_from_value(v) for v in getattr(state.value_list, "lst")
-            ]
+            items = getattr(state.value_list, "lst")
+            values = unpack_value_list(state.value_list, items)
+            if values is not None:
+                return values if as_array else values.tolist()
+            return [self._get_state_from_value(v, as_array) for v in items]
         elif t == "value_map":
             return {
-                k: self._get_state_from_value(v)
+                k: self._get_state_from_value(v, as_array)
                 for k, v in sorted(state.value_map.m.items())
             }
         else:
@@ -109,11 +122,15 @@ class SettingsService(ServiceProtocol):
         self._set_state_from_value(request.value, value)
         self._stub.SetVar(request, metadata=self._metadata)
 
-    def get_var(self, path: str) -> Any:
-        """Get the value for the given path."""
+    def get_var(self, path: str, as_array: bool = False) -> Any:
+        """Get the value for the given path.
+
+        Long homogeneous numeric lists are returned as NumPy arrays if
+        ``as_array`` is ``True``.
+        """
         request = _get_request_instance_for_path(settings_pb2.GetVarRequest, path)
         response = self._stub.GetVar(request, metadata=self._metadata)
-        return self._get_state_from_value(response.value)
+        return self._get_state_from_value(response.value, as_array)
 
     def rename(self, path: str, new: str, old: str) -> None:
         """Rename the object at the given path."""
@@ -22,7 +22,6 @@
 
 """Wrapper over the solution variable gRPC service of Fluent (v0 proto API)."""
 
-import math
 from typing import Any, Sequence
 
 import grpc
@@ -30,8 +29,11 @@ import numpy as np
 import numpy.typing as npt
 
 from ansys.api.fluent.v0 import field_data_pb2, svar_pb2, svar_pb2_grpc
+from ansys.fluent.core._grpc_services import _shared_memory
 from ansys.fluent.core._grpc_services.field_data_service_v0 import _FieldDataConstants
+from ansys.fluent.core.module_config import config
 from ansys.fluent.core.services._protocols import ServiceProtocol
+from ansys.fluent.core.services.batch_ops import flush_coalesced_writes
 from ansys.fluent.core.services.interceptors import (
     GrpcErrorInterceptor,
     TracingInterceptor,
@@ -160,6 +162,47 @@ class ZonesInfo:
         return self._domains_info.get(domain_name, None)
 
 
+_TYPED_PAYLOADS = {
+    np.float32: ("floatPayload", field_data_pb2.FloatPayload),
+    np.float64: ("doublePayload", field_data_pb2.DoublePayload),
+    np.int32: ("intPayload", field_data_pb2.IntPayload),
+    np.int64: ("longPayload", field_data_pb2.LongPayload),
+}
+
+
+def _as_native_array(data: np.ndarray) -> np.ndarray:
+    """Get an array as a flat contiguous array in native byte order."""
+    return np.ascontiguousarray(data, dtype=data.dtype.newbyteorder("=")).reshape(-1)
+
+
+def _iter_payload_chunks(data: np.ndarray):
+    """Split an array into payload chunks of at most ``chunk_size`` bytes.
+
+    The chunks are bytes copied from memoryview slices of the array when byte
+    payloads are streamed, and array views otherwise.
+    """
+    data = _as_native_array(data)
+    chunk_length = max(1, _FieldDataConstants.chunk_size // data.dtype.itemsize)
+    if _FieldDataConstants.bytes_stream:
+        data_bytes = memoryview(data).cast("B")
+        chunk_size = chunk_length * data.dtype.itemsize
+        for start in range(0, len(data_bytes), chunk_size):
+            yield bytes(data_bytes[start : start + chunk_size])
+    else:
+        for start in range(0, data.size, chunk_length):
+            yield data[start : start + chunk_length]
+
+
+def _get_payload(chunk: bytes | np.ndarray) -> svar_pb2.Payload:
+    """Get the payload message of a chunk."""
+    if isinstance(chunk, bytes):
+        return svar_pb2.Payload(bytePayload=chunk)
+    field_name, payload_cls = _TYPED_PAYLOADS.get(
+        chunk.dtype.type, _TYPED_PAYLOADS[np.int64]
+    )
+    return svar_pb2.Payload(**{field_name: payload_cls(payload=chunk)})
+
+
 class SolutionVariableService(ServiceProtocol):
     """SVAR service of Fluent."""
 
@@ -172,8 +215,25 @@ class SolutionVariableService(ServiceProtocol):
         )
         self._stub = svar_pb2_grpc.svarStub(intercept_channel)
         self._metadata = metadata
+        self._shared_memory_accepted = False
         del fluent_error_state  # unused variable
 
+    def _get_data_metadata(self):
+        """Get the metadata of a call getting data, offering the shared-memory transport if enabled."""
+        if config.use_shared_memory_transport:
+            return _shared_memory.offer_metadata(self._metadata)
+        return self._metadata
+
+    def _read_responses(self, responses):
+        """Read the payloads of responses from shared memory if Fluent sent them there."""
+        if not config.use_shared_memory_transport:
+            return responses
+        region_name = _shared_memory.get_region_name(responses.initial_metadata())
+        if region_name is None:
+            return responses
+        self._shared_memory_accepted = True
+        return _shared_memory.read_responses(responses, region_name)
+
     def get_data(
         self,
         variable_name: str,
@@ -221,9 +281,99 @@ class SolutionVariableService(ServiceProtocol):
             zone_id_name_map[zone_id] = zone_name
             svars_request.zones.append(zone_id)
 
-        return zone_id_name_map, extract_svars(
-            self._stub.GetSvarData(svars_request, metadata=self._metadata)
+        flush_coalesced_writes()
+        responses = self._stub.GetSvarData(
+            svars_request, metadata=self._get_data_metadata()
         )
+        return zone_id_name_map, extract_svars(self._read_responses(responses))
+
+    def get_data_many(
+        self,
+        variable_names: list[str],
+        zone_names: list[str],
+        domain_names: list[str],
+        allowed_solution_variable_names,
+        allowed_domain_names,
+        allowed_zone_names,
+        out: dict[str, dict[str, dict[str, npt.NDArray[Any]]]] | None = None,
+    ) -> tuple[dict[int, str], dict[str, dict[str, dict[int, npt.NDArray[Any]]]]]:
+        """Get the data of several SVARs in several domains on zones.
+
+        The requests of all the SVARs are sent before their data is read, so
+        that Fluent processes them while the previous data is received.
+
+        Parameters
+        ----------
+        variable_names : List[str]
+            Names of the solution variables.
+        zone_names: List[str]
+            Zone names list for solution variable data.
+        domain_names : List[str]
+            Domain names.
+        allowed_solution_variable_names: AllowedSolutionVariableNames
+            AllowedSolutionVariableNames object to validate solution variable names.
+        allowed_domain_names: AllowedDomainNames
+            AllowedDomainNames object to validate domain names.
+        allowed_zone_names: AllowedZoneNames
+            AllowedZoneNames object to validate zone names.
+        out : dict[str, dict[str, dict[str, npt.NDArray[Any]]]], optional
+            Arrays by domain name, solution variable name and zone name into
+            which the data is written. The arrays of the missing entries are
+            allocated and added.
+
+        Returns
+        -------
+        tuple[dict[int, str], dict[str, dict[str, dict[int, npt.NDArray[Any]]]]]
+            Zone names by zone ID, and SVAR data by domain name, solution
+            variable name and zone ID.
+        """
+        zone_id_name_map = {
+            allowed_zone_names.valid_name(zone_name): zone_name
+            for zone_name in zone_names
+        }
+        if out is None:
+            out = {}
+        flush_coalesced_writes()
+        calls = []
+        svar_data = {}
+        try:
+            for domain_name in domain_names:
+                domain_id = allowed_domain_names.valid_name(domain_name)
+                for variable_name in allowed_solution_variable_names.valid_names(
+                    variable_names, zone_names, domain_name
+                ):
+                    request = svar_pb2.GetSvarDataRequest(
+                        provideBytesStream=_FieldDataConstants.bytes_stream,
+                        chunkSize=_FieldDataConstants.chunk_size,
+                        name=variable_name,
+                        domainId=domain_id,
+                        zones=zone_id_name_map,
+                    )
+                    responses = self._stub.GetSvarData(
+                        request, metadata=self._get_data_metadata()
+                    )
+                    calls.append((domain_name, variable_name, responses))
+            for domain_name, variable_name, responses in calls:
+                variable_out = out.setdefault(domain_name, {}).setdefault(
+                    variable_name, {}
+                )
+                zone_data = extract_svars(
+                    self._read_responses(responses),
+                    {
+                        zone_id: variable_out[zone_name]
+                        for zone_id, zone_name in zone_id_name_map.items()
+                        if zone_name in variable_out
+                    },
+                )
+                for zone_id, zone_array in zone_data.items():
+                    variable_out[zone_id_name_map[zone_id]] = zone_array
+                svar_data.setdefault(domain_name, {})[variable_name] = zone_data
+        except BaseException:
+            # The calls which are not read yet would otherwise keep streaming.
+            for _, _, responses in calls:
+                responses.cancel()
+            raise
+        return zone_id_name_map, svar_data
 
     def set_data(
         self,
@@ -266,74 +416,48 @@ class SolutionVariableService(ServiceProtocol):
             for zone_name, solution_variable_data in zone_names_to_data.items()
         }
 
-        def generate_set_data_requests():
-            set_data_requests = []
-
-            set_data_requests.append(
-                svar_pb2.SetSvarDataRequest(
-                    header=svar_pb2.SvarHeader(name=variable_name, domainId=domain_id)
-                )
+        def generate_set_data_requests(descriptors=None):
+            # The requests are built lazily, as gRPC sends them, so that only
+            # the chunks being sent are held in memory.
+            yield svar_pb2.SetSvarDataRequest(
+                header=svar_pb2.SvarHeader(name=variable_name, domainId=domain_id)
             )
-
-            for zone_id, solution_variable_data in zone_ids_to_svar_data.items():
-                max_array_size = (
-                    _FieldDataConstants.chunk_size
-                    / np.dtype(solution_variable_data.dtype).itemsize
-                )
-                solution_variable_data_list = np.array_split(
-                    solution_variable_data,
-                    math.ceil(solution_variable_data.size / max_array_size),
-                )
-                set_data_requests.append(
-                    svar_pb2.SetSvarDataRequest(
-                        payloadInfo=svar_pb2.Info(
-                            fieldType=_FieldDataConstants.np_data_type_to_proto_field_type[
-                                solution_variable_data.dtype.type
-                            ],
-                            fieldSize=solution_variable_data.size,
-                            zone=zone_id,
-                        )
+            for i, (zone_id, solution_variable_data) in enumerate(
+                zone_ids_to_svar_data.items()
+            ):
+                yield svar_pb2.SetSvarDataRequest(
+                    payloadInfo=svar_pb2.Info(
+                        fieldType=_FieldDataConstants.np_data_type_to_proto_field_type[
+                            solution_variable_data.dtype.type
+                        ],
+                        fieldSize=solution_variable_data.size,
+                        zone=zone_id,
                     )
                 )
-                set_data_requests += [
-                    svar_pb2.SetSvarDataRequest(
-                        payload=(
-                            svar_pb2.Payload(
-                                floatPayload=field_data_pb2.FloatPayload(
-                                    payload=solution_variable_data
-                                )
-                            )
-                            if solution_variable_data.dtype.type == np.float32
-                            else (
-                                svar_pb2.Payload(
-                                    doublePayload=field_data_pb2.DoublePayload(
-                                        payload=solution_variable_data
-                                    )
-                                )
-                                if solution_variable_data.dtype.type == np.float64
-                                else (
-                                    svar_pb2.Payload(
-                                        intPayload=field_data_pb2.IntPayload(
-                                            payload=solution_variable_data
-                                        )
-                                    )
-                                    if solution_variable_data.dtype.type == np.int32
-                                    else svar_pb2.Payload(
-                                        longPayload=field_data_pb2.LongPayload(
-                                            payload=solution_variable_data
-                                        )
-                                    )
-                                )
-                            )
-                        )
+                if descriptors is not None:
+                    yield svar_pb2.SetSvarDataRequest(
+                        payload=svar_pb2.Payload(bytePayload=descriptors[i])
                     )
-                    for solution_variable_data in solution_variable_data_list
-                    if solution_variable_data.size > 0
-                ]
-
-            yield from set_data_requests
-
-        self._stub.SetSvarData(generate_set_data_requests(), metadata=self._metadata)
+                    continue
+                for chunk in _iter_payload_chunks(solution_variable_data):
+                    yield svar_pb2.SetSvarDataRequest(payload=_get_payload(chunk))
+
+        flush_coalesced_writes()
+        if not (config.use_shared_memory_transport and self._shared_memory_accepted):
+            self._stub.SetSvarData(
+                generate_set_data_requests(), metadata=self._metadata
+            )
+            return
+        with _shared_memory.OutgoingRegion(
+            [_as_native_array(data) for data in zone_ids_to_svar_data.values()]
+        ) as region:
+            self._stub.SetSvarData(
+                generate_set_data_requests(region.descriptors),
+                metadata=[
+                    *self._metadata,
+                    (_shared_memory.SHARED_MEMORY_KEY, region.name),
+                ],
+            )
 
     def get_variables_info(
         self,
@@ -390,13 +514,41 @@ class SolutionVariableService(ServiceProtocol):
         return ZonesInfo(response.zonesInfo, response.domainsInfo)
 
 
-def extract_svars(solution_variables_data):
-    """Extracts SVAR data via a server call."""
+def _get_out_array_view(
+    out_arr: npt.NDArray[Any], field_datatype: npt.DTypeLike, field_size: int
+) -> npt.NDArray[Any]:
+    """Get a flat view of an output array after checking it fits the SVAR data."""
+    if (
+        out_arr.dtype != field_datatype
+        or out_arr.size != field_size
+        or not out_arr.flags.c_contiguous
+    ):
+        raise ValueError(
+            f"Output array must be a contiguous {np.dtype(field_datatype)} array "
+            f"of size {field_size}, got a {out_arr.dtype} array of shape "
+            f"{out_arr.shape}."
+        )
+    return out_arr.reshape(-1)
+
+
+def extract_svars(
+    solution_variables_data, out: dict[int, npt.NDArray[Any]] | None = None
+):
+    """Extracts SVAR data via a server call.
+
+    The data of the zones in ``out`` is written in place into their arrays.
+    """
 
     def _extract_svar(
-        field_datatype: npt.DTypeLike, field_size: int, solution_variables_data
+        field_datatype: npt.DTypeLike,
+        field_size: int,
+        solution_variables_data,
+        out_arr: npt.NDArray[Any] | None,
     ) -> npt.NDArray[np.float64] | None:
-        field_arr = np.empty(field_size, dtype=field_datatype)
+        if out_arr is None:
+            out_arr = field_arr = np.empty(field_size, dtype=field_datatype)
+        else:
+            field_arr = _get_out_array_view(out_arr, field_datatype, field_size)
         field_datatype_item_size = np.dtype(field_datatype).itemsize
         index = 0
         for solution_variable_data in solution_variables_data:
@@ -411,7 +563,7 @@ def extract_svars(solution_variables_data):
                 )
                 index += count
                 if index == field_size:
-                    return field_arr
+                    return out_arr
             else:
                 payload: Sequence[float] = (
                     chunk.floatPayload.payload
@@ -425,7 +577,7 @@ def extract_svars(solution_variables_data):
                 )
                 index += count
                 if index == field_size:
-                    return field_arr
+                    return out_arr
 
     zones_svar_data = dict[Any, npt.NDArray[Any] | None]()
     for array in solution_variables_data:
@@ -436,6 +588,7 @@ def extract_svars(solution_variables_data):
                 ],
                 array.payloadInfo.fieldSize,
                 solution_variables_data,
+                (out or {}).get(array.payloadInfo.zone),
             )
         elif array.WhichOneof("array") == "header":
             continue
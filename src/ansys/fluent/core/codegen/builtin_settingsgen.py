@@ -52,7 +52,7 @@ def _get_settings_root(version: str):
 
     settings = _load_module(
         f"settings_{version}",
-        config.codegen_outdir / "solver" / f"settings_{version}.py",
+        config.codegen_outdir / "solver" / f"settings_{version}" / "__init__.py",
     )
     return settings.root
 
@@ -37,6 +37,7 @@ from ansys.fluent.core.codegen import StaticInfoType
 from ansys.fluent.core.codegen.data.meshing_utilities_examples import (
     meshing_utility_examples,
 )
+from ansys.fluent.core.data_model_cache import _clear_dict_parameter_paths
 from ansys.fluent.core.services.object_model import (
     PyArgumentsSingletonSubItem,
     arg_class_by_type,
@@ -603,6 +604,7 @@ class DataModelGenerator:
                     if mode in ("solver", "meshing"):
                         key = f"<{mode}_session>"
                         api_tree[key].update(api_tree_val)
+        _clear_dict_parameter_paths()
         return api_tree
 
     def _delete_generated_files(self):
@@ -27,7 +27,9 @@ import argparse
 import hashlib
 from io import StringIO
 import keyword
+from pathlib import Path
 import pickle
+import shutil
 import time
 from typing import IO
 
@@ -215,10 +217,21 @@ def _write_function_stub(name, data, s_stub):
     s_stub.write('        """\n')
 
 
-def _write_data(cls_name: str, python_name: str, data: dict, f: IO, f_stub: IO | None):
+def _write_data(
+    cls_name: str,
+    python_name: str,
+    data: dict,
+    class_sources: dict[str, tuple[str, list[str]]],
+    f_stub: IO | None,
+    child_modules: dict[str, str] | None = None,
+):
     # We are traversing the class tree from root to leaves. But the class definitions must
     # be written to the file from leaves to root. We gather the parent definition within
-    # in a string buffer which is written after writing the child class definitions.
+    # in a string buffer which is stored after storing the child class definitions.
+    # class_sources maps each class name to its definition and the names of the classes
+    # it uses, in the order the definitions must be written.
+    # If child_modules is given, the child classes are imported lazily from the
+    # submodules it maps their names to.
     s = StringIO()
     s_stub = StringIO()
     child_object_name = f"{cls_name}_child" if data["child_object_type"] else None
@@ -265,7 +278,12 @@ def _write_data(cls_name: str, python_name: str, data: dict, f: IO, f_stub: IO |
         s_stub.write("    argument_names: list[str]\n")
     classes_to_write = {}  # values are (class_name, data, hash, should_write_stub)
     if data["child_classes"]:
-        s.write("    _child_classes = dict(\n")
+        if child_modules is None:
+            s.write("    _child_classes = dict(\n")
+        else:
+            s.write("    _child_classes = _ImportedChildClasses(\n")
+            s.write("        __name__,\n")
+            s.write("        dict(\n")
         for k, v in data["child_classes"].items():
             name = v["name"]
             # Retrieving the original python name before get_cls() modifies it.
@@ -279,7 +297,12 @@ def _write_data(cls_name: str, python_name: str, data: dict, f: IO, f_stub: IO |
             if not unique_name:
                 unique_name = _get_unique_name(name)
                 _NAME_BY_HASH[hash_] = unique_name
-            s.write(f"        {k}={unique_name},\n")
+            if child_modules is None:
+                s.write(f"        {k}={unique_name},\n")
+            else:
+                s.write(
+                    f"            {k}=({child_modules[unique_name]!r}, {unique_name!r}),\n"
+                )
             # We include the child-class to write irrespective of the above
             # _NAME_BY_HASH lookup result and later use the global _CLASS_WRITTEN
             # set to avoid duplicate writes. This is necessary because class
@@ -293,7 +316,13 @@ def _write_data(cls_name: str, python_name: str, data: dict, f: IO, f_stub: IO |
             else:
                 s_stub.write(f"    {k}: {unique_name}\n")
                 classes_to_write[unique_name] = (child_python_name, v, hash_, True)
-        s.write("    )\n")
+        if child_modules is None:
+            s.write("    )\n")
+        else:
+            s.write("        ),\n")
+            s.write("    )\n")
+            for k in data["child_classes"]:
+                s.write(f"    {k} = _LazyChild({k!r})\n")
     if child_object_name:
         child_object_type = data["child_object_type"]
         s.write(f"    child_object_type = {child_object_name}\n")
@@ -333,10 +362,14 @@ def _write_data(cls_name: str, python_name: str, data: dict, f: IO, f_stub: IO |
     for name, (python_name, data, hash_, should_write_stub) in classes_to_write.items():
         if name not in _CLASS_WRITTEN:
             _write_data(
-                name, python_name, data, f, f_stub if should_write_stub else None
+                name,
+                python_name,
+                data,
+                class_sources,
+                f_stub if should_write_stub else None,
             )
             _CLASS_WRITTEN.add(name)
-    f.write(s.getvalue())
+    class_sources[cls_name] = (s.getvalue(), list(classes_to_write))
     if f_stub:
         f_stub.write(s_stub.getvalue())
 
@@ -359,8 +392,98 @@ def _check_written_docstrings(version, output_file, verbose):
         )
 
 
+# Functions of the generated package which import its classes on first access.
+_LAZY_PACKAGE_FUNCTIONS = """
+def __getattr__(name):
+    module = _CLASS_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return _import_settings_class(__name__, module, name)
+
+
+def __dir__():
+    return sorted(set(globals()) | _CLASS_MODULES.keys())
+
+
+"""
+
+
+def _get_class_modules(
+    branch_names: list[str], class_sources: dict[str, tuple[str, list[str]]]
+) -> dict[str, str]:
+    """Get the submodule of each class.
+
+    A class goes to the submodule of the top-level branch using it, or to a common
+    submodule if several top-level branches use it.
+    """
+    common_module = "_common"
+    while common_module[1:] in branch_names:
+        common_module += "_"
+    branches_by_class = {}
+    for branch_name in branch_names:
+        names = [branch_name]
+        reached = set()
+        while names:
+            name = names.pop()
+            if name not in reached:
+                reached.add(name)
+                branches_by_class.setdefault(name, []).append(branch_name)
+                names.extend(class_sources[name][1])
+    return {
+        name: f"_{branches[0]}" if len(branches) == 1 else common_module
+        for name, branches in branches_by_class.items()
+    }
+
+
+def _write_package(
+    package_dir: Path,
+    header: str,
+    shash: str,
+    root_source: str,
+    class_sources: dict[str, tuple[str, list[str]]],
+    class_modules: dict[str, str],
+) -> None:
+    names_by_module = {}
+    for name in class_sources:
+        names_by_module.setdefault(class_modules[name], []).append(name)
+    for module, names in names_by_module.items():
+        imported_names = {}
+        for name in names:
+            for dep in class_sources[name][1]:
+                if class_modules[dep] != module:
+                    imported_names.setdefault(class_modules[dep], set()).add(dep)
+        with open(package_dir / f"{module}.py", "w") as f:
+            f.write(header)
+            for dep_module, deps in sorted(imported_names.items()):
+                f.write(f"from .{dep_module} import (\n")
+                for dep in sorted(deps):
+                    f.write(f"    {dep},\n")
+                f.write(")\n\n")
+            for name in names:
+                f.write(class_sources[name][0])
+    with open(package_dir / "__init__.py", "w") as f:
+        f.write(header)
+        f.write("from ansys.fluent.core.solver.flobject import (\n")
+        f.write("    _ImportedChildClasses,\n")
+        f.write("    _LazyChild,\n")
+        f.write("    _import_settings_class,\n")
+        f.write(")\n\n")
+        f.write(f'SHASH = "{shash}"\n\n')
+        f.write("_CLASS_MODULES = {\n")
+        for name in class_sources:
+            f.write(f"    {name!r}: {class_modules[name]!r},\n")
+        f.write("}\n\n")
+        f.write(_LAZY_PACKAGE_FUNCTIONS)
+        f.write(root_source)
+
+
 def generate(version: str, static_infos: dict, verbose: bool = False) -> None:
-    """Generate the classes corresponding to the Fluent settings API."""
+    """Generate the classes corresponding to the Fluent settings API.
+
+    The classes are written as the ``settings_<version>`` package. Each top-level
+    branch of the settings API is written in its own submodule, which is imported
+    the first time the branch or one of its classes is accessed.
+    """
     start_time = time.time()
     api_tree = {}
     sinfo = static_infos.get(StaticInfoType.SETTINGS)
@@ -368,9 +491,15 @@ def generate(version: str, static_infos: dict, verbose: bool = False) -> None:
     if not sinfo:
         return {"<solver_session>": api_tree}
     output_dir = (pyfluent.config.codegen_outdir / "solver").resolve()
-    output_dir.mkdir(parents=True, exist_ok=True)
-    output_file = output_dir / f"settings_{version}.py"
-    output_stub_file = output_dir / f"settings_{version}.pyi"
+    package_dir = output_dir / f"settings_{version}"
+    # Remove the module written by earlier versions of the generator.
+    (output_dir / f"settings_{version}.py").unlink(missing_ok=True)
+    (output_dir / f"settings_{version}.pyi").unlink(missing_ok=True)
+    if package_dir.exists():
+        shutil.rmtree(package_dir)
+    package_dir.mkdir(parents=True)
+    output_file = package_dir / "__init__.py"
+    output_stub_file = package_dir / "__init__.pyi"
     cls, _ = get_cls("", sinfo, version=version)
     # _populate_data() collects all strings to write to the file in a nested dict.
     # which is then written to the file using _write_data().
@@ -378,37 +507,45 @@ def generate(version: str, static_infos: dict, verbose: bool = False) -> None:
     _NAME_BY_HASH.clear()
     _CLASS_WRITTEN.clear()
     if verbose:
-        print(f"{str(output_file)}")
-        print(f"{str(output_stub_file)}")
-    with open(output_file, "w") as f, open(output_stub_file, "w") as f_stub:
-        header = StringIO()
-        header.write("#\n")
-        header.write("# This is an auto-generated file.  DO NOT EDIT!\n")
-        header.write("#\n")
-        header.write("\n")
-        header.write("from ansys.fluent.core.solver.flobject import *\n\n")
-        header.write("from ansys.fluent.core.solver.flobject import (\n")
-        header.write("    ExposureLevel,\n")
-        header.write("    _ChildNamedObjectAccessorMixin,\n")
-        header.write("    _NonCreatableNamedObjectMixin,\n")
-        header.write("    _InputFile,\n")
-        header.write("    _OutputFile,\n")
-        header.write("    _InOutFile,\n")
-        header.write("    _FlStringConstant,\n")
-        header.write(")\n\n")
-        f.write(header.getvalue())
+        print(f"{str(package_dir)}")
+    header = StringIO()
+    header.write("#\n")
+    header.write("# This is an auto-generated file.  DO NOT EDIT!\n")
+    header.write("#\n")
+    header.write("\n")
+    header.write("from ansys.fluent.core.solver.flobject import *\n\n")
+    header.write("from ansys.fluent.core.solver.flobject import (\n")
+    header.write("    ExposureLevel,\n")
+    header.write("    _ChildNamedObjectAccessorMixin,\n")
+    header.write("    _NonCreatableNamedObjectMixin,\n")
+    header.write("    _InputFile,\n")
+    header.write("    _OutputFile,\n")
+    header.write("    _InOutFile,\n")
+    header.write("    _FlStringConstant,\n")
+    header.write(")\n\n")
+    class_sources = {}
+    with open(output_stub_file, "w") as f_stub:
         f_stub.write(header.getvalue())
         f_stub.write("from typing import Any, Final\n\n")
-        f.write(f'SHASH = "{shash}"\n\n')
         name = data["name"]
         _NAME_BY_HASH[_gethash(data)] = name
-        _write_data(name, name, data, f, f_stub)
-    file_size = output_file.stat().st_size / 1024 / 1024
-    file_size_stub = output_stub_file.stat().st_size / 1024 / 1024
-    print(
-        f"\nGenerated {output_file.name} and {output_stub_file.name} in {time.time() - start_time:.2f} seconds."
+        _write_data(name, name, data, class_sources, f_stub)
+    class_modules = _get_class_modules(class_sources.pop(name)[1], class_sources)
+    # The root class is written again to import its child classes lazily.
+    _write_data(name, name, data, class_sources, None, child_modules=class_modules)
+    root_source = class_sources.pop(name)[0]
+    _write_package(
+        package_dir,
+        header.getvalue(),
+        shash,
+        root_source,
+        class_sources,
+        class_modules,
     )
-    print(f"{output_file.name} size: {file_size:.2f} MB")
+    package_size = sum(p.stat().st_size for p in package_dir.glob("*.py")) / 1024 / 1024
+    file_size_stub = output_stub_file.stat().st_size / 1024 / 1024
+    print(f"\nGenerated {package_dir.name} in {time.time() - start_time:.2f} seconds.")
+    print(f"{package_dir.name} size: {package_size:.2f} MB")
     print(f"{output_stub_file.name} size: {file_size_stub:.2f} MB")
     _check_written_docstrings(version, output_file, verbose)
     return {"<solver_session>": api_tree}
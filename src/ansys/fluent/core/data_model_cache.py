@@ -24,7 +24,7 @@
 """Module to manage datamodel cache."""
 
 from collections import abc, defaultdict
-from contextlib import contextmanager
+from contextlib import contextmanager, suppress
 import copy
 from enum import Enum
 from threading import RLock
@@ -107,12 +107,17 @@ class _CacheImpl:
                 d_out[k_in] = v_in
         return d_out
 
-    def update(self, d: dict[str, Any], d1: dict[str, Any]):
+    def update(
+        self,
+        d: dict[str, Any],
+        d1: dict[str, Any],
+        cow: "_CopyOnWrite | None" = None,
+    ):
         """Update dict."""
         for k1, v1 in d1.items():
             k, v = self.find(d, k1, None)
             if isinstance(v, abc.Mapping) and isinstance(v1, abc.Mapping):
-                self.update(v, v1)
+                self.update(v if cow is None else cow.writable(d, k), v1, cow)
             else:
                 if isinstance(v1, abc.Mapping):
                     k = (
@@ -125,39 +130,239 @@ class _CacheImpl:
                 d[k] = v1
 
 
-def _is_dict_parameter_type(version: FluentVersion, rules: str, rules_path: str):
-    """Check if a parameter is a dict type."""
+class _NameIndex:
+    """Secondary indexes of the named objects in a datamodel cache container.
+
+    The named objects are indexed by their type and by both their internal and
+    display names, so that they are found without scanning their siblings
+    whichever name is used as the key in the container.
+    """
+
+    def __init__(self, container: dict[str, Any]):
+        self._keys = {}
+        self._entries = {}
+        for k, v in container.items():
+            self.add(k, v)
+
+    def add(self, key: str, value: Any):
+        """Index the named object stored at key."""
+        self.discard(key)
+        if ":" not in key or not isinstance(value, abc.Mapping):
+            return
+        type_ = key.split(":", maxsplit=1)[0]
+        entries = []
+        for name_key in NameKey:
+            name = value.get(name_key.value)
+            if name is not None:
+                entry = (name_key, type_, name)
+                self._keys[entry] = key
+                entries.append(entry)
+        self._entries[key] = entries
+
+    def discard(self, key: str):
+        """Remove the named object stored at key from the indexes."""
+        for entry in self._entries.pop(key, ()):
+            if self._keys.get(entry) == key:
+                del self._keys[entry]
+
+    def find(
+        self, container: dict[str, Any], name_key: NameKey, type_: str, name: str
+    ) -> str | None:
+        """Find the key of a named object of the indexed container."""
+        key = self._keys.get((name_key, type_, name))
+        if key is not None:
+            value = container.get(key)
+            if isinstance(value, abc.Mapping) and value.get(name_key.value) == name:
+                return key
+        return None
+
+    def copy(self) -> "_NameIndex":
+        """Copy the indexes for a copy of the container."""
+        index = _NameIndex.__new__(_NameIndex)
+        index._keys = self._keys.copy()
+        index._entries = self._entries.copy()
+        return index
+
+
+class _StateDict(dict):
+    """Container of the cache state which holds the name indexes of its items.
+
+    A published state container is never modified, so its name indexes stay
+    valid for as long as the container is referenced. The owner is the token
+    of the writer that copied the container and may still modify it.
+    """
+
+    __slots__ = ("name_index", "owner")
+
+    def __deepcopy__(self, memo):
+        return {k: copy.deepcopy(v, memo) for k, v in self.items()}
+
+
+class _CopyOnWrite:
+    """Path copying of the cache state for the writes between two snapshots.
+
+    A state taken as a snapshot is never modified. The containers on the
+    written paths are copied on their first write after the last snapshot and
+    then modified in place by the following writes, while the other containers
+    are shared with the snapshot.
+    """
+
+    def __init__(self, root: dict[str, Any]):
+        self.keep_name_indexes = True
+        # The copies refer to the token rather than to the writer, so that the
+        # writer does not keep the copies, or the copies the writer, alive.
+        self._token = object()
+        self.root = self.copy(root)
+
+    def start_write(self, keep_name_indexes: bool = True):
+        """Start a write, dropping the name indexes of the written containers if not kept."""
+        self.keep_name_indexes = keep_name_indexes
+        self.copy(self.root)
+
+    def copy(self, container: dict[str, Any]) -> _StateDict:
+        """Get a writable copy of a container."""
+        if getattr(container, "owner", None) is self._token:
+            if not self.keep_name_indexes:
+                with suppress(AttributeError):
+                    del container.name_index
+            return container
+        new_container = _StateDict(container)
+        index = getattr(container, "name_index", None)
+        if index is not None and self.keep_name_indexes:
+            new_container.name_index = index.copy()
+        new_container.owner = self._token
+        return new_container
+
+    def writable(self, parent: dict[str, Any], key: str) -> Any:
+        """Get a writable item of a writable container."""
+        value = parent[key]
+        if isinstance(value, dict):
+            value = parent[key] = self.copy(value)
+        return value
+
+
+class _DictParameterPaths:
+    """Lookup table of the dict-typed parameters of a generated datamodel module.
+
+    The paths of the dict-typed parameters are collected from the module when
+    it is loaded, and the result for any other rules path is memoized after it
+    is first looked up.
+    """
+
+    def __init__(self, root: type):
+        self._root = root
+        self._is_dict = {}
+        self._collect(root, "")
+
+    def _collect(self, cls: type, path: str):
+        from ansys.fluent.core.services.object_model import (
+            PyDictionary,
+            PyMenu,
+            PyNamedObjectContainer,
+        )
+
+        for name, child in vars(cls).items():
+            if not isinstance(child, type):
+                continue
+            child_path = f"{path}/{name}" if path else name
+            if issubclass(child, PyDictionary):
+                self._is_dict[child_path] = True
+            elif issubclass(child, PyNamedObjectContainer):
+                named_object_cls = getattr(child, f"_{name}", None)
+                if named_object_cls is not None:
+                    self._collect(named_object_cls, child_path)
+            elif issubclass(child, PyMenu):
+                self._collect(child, child_path)
+
+    def _walk(self, rules_path: str) -> bool:
+        from ansys.fluent.core.services.object_model import (
+            PyDictionary,
+            PyNamedObjectContainer,
+            PyParameter,
+        )
+
+        cls = self._root
+        comps = rules_path.split("/")
+        for i, comp in enumerate(comps):
+            if hasattr(cls, comp):
+                cls = getattr(cls, comp)
+                if issubclass(cls, PyParameter) and i < len(comps) - 1:
+                    return False
+                if issubclass(cls, PyNamedObjectContainer):
+                    cls = getattr(cls, f"_{comp}")
+        return issubclass(cls, PyDictionary)
+
+    def is_dict(self, rules_path: str) -> bool:
+        """Check whether the parameter at a rules path is a dict type."""
+        try:
+            return self._is_dict[rules_path]
+        except KeyError:
+            return self._is_dict.setdefault(rules_path, self._walk(rules_path))
+
+
+# Lookup tables by version and rules, or None if the module is not generated
+_dict_parameter_paths: dict[tuple[str, str], _DictParameterPaths | None] = {}
+
+
+def _clear_dict_parameter_paths(version: str | None = None, rules: str | None = None):
+    """Drop the lookup tables of the datamodel modules which are generated or loaded.
+
+    Parameters
+    ----------
+    version : str, optional
+        Fluent version number of the module. All lookup tables are dropped if
+        not specified.
+    rules : str, optional
+        datamodel rules of the module
+    """
+    if version is None:
+        _dict_parameter_paths.clear()
+    else:
+        _dict_parameter_paths.pop((str(version), rules), None)
+
+
+def _get_dict_parameter_paths(
+    version: FluentVersion, rules: str
+) -> _DictParameterPaths | None:
+    """Get the dict-typed parameters lookup table of a generated datamodel module."""
     from ansys.fluent.core.module_config import config
-    from ansys.fluent.core.services.object_model import (
-        PyDictionary,
-        PyNamedObjectContainer,
-        PyParameter,
-    )
     from ansys.fluent.core.utils import load_module
 
+    key = (str(version.number), rules)
     try:
-        module = load_module(
-            rules, config.codegen_outdir / f"datamodel_{version.number}" / f"{rules}.py"
-        )
+        return _dict_parameter_paths[key]
+    except KeyError:
+        pass
+    file_path = config.codegen_outdir / f"datamodel_{version.number}" / f"{rules}.py"
+    try:
+        module = load_module(rules, file_path)
     except (
         ImportError,
         FileNotFoundError,
-    ):  # no codegen, during codegen or outdated codegen
-        return False
-    cls = module.Root
-    comps = rules_path.split("/")
-    for i, comp in enumerate(comps):
-        if hasattr(cls, comp):
-            cls = getattr(cls, comp)
-            if issubclass(cls, PyParameter) and i < len(comps) - 1:
-                return False
-            if issubclass(cls, PyNamedObjectContainer):
-                cls = getattr(cls, f"_{comp}")
-    return issubclass(cls, PyDictionary)
+    ):  # no codegen, during codegen or outdated codegen
+        paths = None
+    else:
+        paths = _DictParameterPaths(module.Root)
+    return _dict_parameter_paths.setdefault(key, paths)
+
+
+def _is_dict_parameter_type(version: FluentVersion, rules: str, rules_path: str):
+    """Check if a parameter is a dict type."""
+    paths = _get_dict_parameter_paths(version, rules)
+    return paths is not None and paths.is_dict(rules_path)
 
 
 class DataModelCache:
-    """Class to manage datamodel cache."""
+    """Class to manage datamodel cache.
+
+    Each write to the cache makes a new version of the cached state. Readers get
+    a snapshot of the state, which shares the unmodified containers with the
+    later versions and is never modified, so they access it without locking.
+    The containers written after a snapshot are copied once, and the snapshot
+    of the writes made since the last one is only taken, under the lock, by the
+    next reader, so that a stream of writes does not copy large containers on
+    every write.
+    """
 
     use_display_name = False
 
@@ -166,6 +371,9 @@ class DataModelCache:
         self.rules_str_to_cache = defaultdict(dict)
         self.rules_str_to_config = {}
         self._locks = {}
+        self._rules_str_to_version = defaultdict(int)
+        self._writers: dict[str, _CopyOnWrite] = {}
+        self._snapshots: dict[str, tuple[int, dict[str, Any]]] = {}
 
     @contextmanager
     def _with_lock(self, rules: str):
@@ -174,6 +382,56 @@ class DataModelCache:
         with self._locks[rules]:
             yield
 
+    @staticmethod
+    def _get_name_index(container: dict[str, Any]) -> _NameIndex:
+        index = getattr(container, "name_index", None)
+        if index is None:
+            index = _NameIndex(container)
+            if isinstance(container, _StateDict):
+                container.name_index = index
+        return index
+
+    def _start_write(self, rules: str, keep_name_indexes: bool = True) -> _CopyOnWrite:
+        # Called with the lock held. The root is replaced on the first write
+        # after a snapshot, or by assigning it directly.
+        cow = self._writers.get(rules)
+        root = self.rules_str_to_cache[rules]
+        if cow is None or cow.root is not root:
+            cow = self._writers[rules] = _CopyOnWrite(root)
+        cow.start_write(keep_name_indexes)
+        return cow
+
+    def _end_write(self, rules: str, cow: _CopyOnWrite):
+        self.rules_str_to_cache[rules] = cow.root
+        self._rules_str_to_version[rules] += 1
+
+    def get_snapshot(self, rules: str) -> tuple[int, dict[str, Any]]:
+        """Get the current version and state of the datamodel cache.
+
+        The lock is only taken if the cache was written since the last snapshot.
+
+        Parameters
+        ----------
+        rules : str
+            datamodel rules
+
+        Returns
+        -------
+        tuple[int, dict[str, Any]]
+            version and state, which must not be modified
+        """
+        snapshot = self._snapshots.get(rules)
+        if snapshot is None or snapshot[1] is not self.rules_str_to_cache.get(rules):
+            with self._with_lock(rules):
+                snapshot = self._snapshots[rules] = (
+                    self._rules_str_to_version[rules],
+                    self.rules_str_to_cache.get(rules),
+                )
+                # The following writes must copy the containers of the snapshot.
+                self._writers.pop(rules, None)
+        version, state = snapshot
+        return version, {} if state is None else state
+
     class Empty:
         """Class representing unassigned cached state."""
 
@@ -229,6 +487,7 @@ class DataModelCache:
     def _update_cache_from_variant_state(
         self,
         rules: str,
+        cow: _CopyOnWrite,
         source: dict[str, StateType],
         key: str,
         state: Variant,
@@ -270,6 +529,7 @@ class DataModelCache:
             for item in get_variant_vector_items(state):
                 self._update_cache_from_variant_state(
                     rules,
+                    cow,
                     source,
                     key,
                     item,
@@ -286,6 +546,7 @@ class DataModelCache:
             )
 
             # Determine the appropriate key
+            parent = source
             if ":" in key:
                 type_, iname = key.split(":", maxsplit=1)
                 key = self._determine_key(
@@ -300,10 +561,11 @@ class DataModelCache:
 
             # Update the source with items from the variant map state
             if state.variant_map_state.item:
-                source = source[key]
+                source = cow.writable(source, key)
                 for k, v in state.variant_map_state.item.items():
                     self._update_cache_from_variant_state(
                         rules,
+                        cow,
                         source,
                         k,
                         v,
@@ -314,6 +576,10 @@ class DataModelCache:
             else:
                 source[key] = {}
 
+            # The names of the object may have been updated
+            if ":" in key:
+                self._get_name_index(parent).add(key, parent[key])
+
         # Default case when no fields are matched
         else:
             updater_fn(source, key, None)
@@ -328,19 +594,17 @@ class DataModelCache:
         iname: str,
     ) -> str:
         """Determine the appropriate key based on internal naming conventions."""
-        for k1, v1 in source.items():
-            if (internal_names_as_keys and k1 == key) or (
-                (not internal_names_as_keys)
-                and isinstance(v1, dict)
-                and v1.get(NameKey.INTERNAL.value) == iname
-            ):
-                return k1  # Found a matching key
-
-        # If no match found and internal naming is used
         if internal_names_as_keys:
-            source[key] = {}
+            if key not in source:
+                source[key] = {}
             return key
 
+        found_key = self._get_name_index(source).find(
+            source, NameKey.INTERNAL, type_, iname
+        )
+        if found_key is not None:
+            return found_key
+
         # If no match found and external naming is used
         name = state.variant_map_state.item[NameKey.DISPLAY.value].string_state
         new_key = f"{type_}:{name}"
@@ -364,55 +628,57 @@ class DataModelCache:
         version : FluentVersion, optional
             Fluent version
         """
-        cache = self.rules_str_to_cache[rules]
-
         with self._with_lock(rules):
+            cow = self._start_write(rules)
             internal_names_as_keys = (
                 self.get_config(rules, "name_key") == NameKey.INTERNAL
             )
 
             # Process deleted paths
-            self._process_deleted_paths(cache, deleted_paths, internal_names_as_keys)
+            self._process_deleted_paths(cow, deleted_paths, internal_names_as_keys)
 
             # Update cache with new state items
             for k, v in state.variant_map_state.item.items():
                 self._update_cache_from_variant_state(
                     rules,
-                    cache,
+                    cow,
+                    cow.root,
                     k,
                     v,
                     dict.__setitem__,
                     k.split(":", maxsplit=1)[0],
                     version,
                 )
+            self._end_write(rules, cow)
 
     def _process_deleted_paths(
         self,
-        cache: dict[str, Any],
+        cow: _CopyOnWrite,
         deleted_paths: list[str],
         internal_names_as_keys: bool,
     ):
         """Process and delete paths from the cache based on the deleted paths list."""
         for deleted_path in deleted_paths:
             comps = [x for x in deleted_path.split("/") if x]
-            self._delete_from_cache(cache, comps, internal_names_as_keys)
+            self._delete_from_cache(cow, comps, internal_names_as_keys)
 
     def _delete_from_cache(
-        self, sub_cache: dict[str, Any], comps: list[str], internal_names_as_keys: bool
+        self, cow: _CopyOnWrite, comps: list[str], internal_names_as_keys: bool
     ):
         """Recursively delete components from the cache."""
+        sub_cache = cow.root
         for i, comp in enumerate(comps):
             if ":" in comp:
-                _, iname = comp.split(":", maxsplit=1)
                 key_to_del = self._find_key_to_delete(
-                    sub_cache, comp, iname, i == len(comps) - 1, internal_names_as_keys
+                    sub_cache, comp, i == len(comps) - 1, internal_names_as_keys
                 )
                 if key_to_del:
+                    self._get_name_index(sub_cache).discard(key_to_del)
                     del sub_cache[key_to_del]
                     return  # Exit after deletion
             else:
                 if comp in sub_cache:
-                    sub_cache = sub_cache[comp]
+                    sub_cache = cow.writable(sub_cache, comp)
                 else:
                     break
 
@@ -420,21 +686,18 @@ class DataModelCache:
         self,
         sub_cache: dict[str, Any],
         comp: str,
-        iname: str,
         is_last_component: bool,
         internal_names_as_keys: bool,
     ) -> str | None:
         """Find the key to delete from the sub-cache."""
-        for k, v in sub_cache.items():
-            if (internal_names_as_keys and k == comp) or (
-                (not internal_names_as_keys)
-                and isinstance(v, dict)
-                and v.get(NameKey.INTERNAL.value) == iname
-            ):
-                return (
-                    k if is_last_component else None
-                )  # Return key if it's the last component
-        return None  # No key found to delete
+        if not is_last_component:
+            return None
+        if internal_names_as_keys:
+            return comp if comp in sub_cache else None
+        type_, iname = comp.split(":", maxsplit=1)
+        return self._get_name_index(sub_cache).find(
+            sub_cache, NameKey.INTERNAL, type_, iname
+        )
 
     @staticmethod
     def _dm_path_comp(comp):
@@ -468,25 +731,31 @@ class DataModelCache:
         name_key_in_config = self.get_config(rules, "name_key")
         if name_key is None:
             name_key = name_key_in_config
-        cache = self.rules_str_to_cache[rules]
-        with self._with_lock(rules):
-            if not len(cache):
+        # A snapshot is never modified, so no lock is needed to read it.
+        _, cache = self.get_snapshot(rules)
+        if not cache:
+            return DataModelCache.Empty
+        comps = DataModelCache._dm_path_comp_list(obj)
+        for comp in comps:
+            if name_key == name_key_in_config or comp in cache:
+                cache = cache.get(comp, None)
+            elif ":" in comp:
+                type_, name = comp.split(":", maxsplit=1)
+                key = self._get_name_index(cache).find(
+                    cache, ~name_key_in_config, type_, name
+                )
+                cache = None if key is None else cache[key]
+            else:
+                cache = None
+            if cache is None:
                 return DataModelCache.Empty
-            comps = DataModelCache._dm_path_comp_list(obj)
-            for comp in comps:
-                if name_key == name_key_in_config:
-                    cache = cache.get(comp, None)
-                else:
-                    _, cache = _CacheImpl(name_key_in_config).find(cache, comp, None)
-                if cache is None:
-                    return DataModelCache.Empty
 
-            if not isinstance(cache, abc.Mapping) or name_key == name_key_in_config:
-                return copy.deepcopy(cache)
-            else:
-                if not cache:
-                    return DataModelCache.Empty
-                return _CacheImpl(name_key_in_config).transform(cache)
+        if not isinstance(cache, abc.Mapping) or name_key == name_key_in_config:
+            return copy.deepcopy(cache)
+        else:
+            if not cache:
+                return DataModelCache.Empty
+            return _CacheImpl(name_key_in_config).transform(cache)
 
     def set_state(self, rules: str, obj: object, value: Any):
         """Set datamodel cache state.
@@ -501,17 +770,25 @@ class DataModelCache:
             state
         """
         name_key_in_config = self.get_config(rules, "name_key")
-        cache = self.rules_str_to_cache[rules]
         with self._with_lock(rules):
-            comps = DataModelCache._dm_path_comp_list(obj)
-            for i, comp in enumerate(comps):
-                key, next_cache = _CacheImpl(name_key_in_config).find(cache, comp, None)
-                if i == len(comps) - 1 and not isinstance(value, abc.Mapping):
-                    cache[key] = value
-                    return
-                if isinstance(next_cache, abc.Mapping):
-                    cache = next_cache
-                else:
-                    cache[key] = {}
-                    cache = cache[key]
-            _CacheImpl(name_key_in_config).update(cache, value)
+            # The written containers are not indexed, as the update below can
+            # add, remove or rename any named object.
+            cow = self._start_write(rules, keep_name_indexes=False)
+            self._set_state(cow, name_key_in_config, obj, value)
+            self._end_write(rules, cow)
+
+    @staticmethod
+    def _set_state(cow: _CopyOnWrite, name_key_in_config, obj: object, value: Any):
+        cache = cow.root
+        comps = DataModelCache._dm_path_comp_list(obj)
+        for i, comp in enumerate(comps):
+            key, next_cache = _CacheImpl(name_key_in_config).find(cache, comp, None)
+            if i == len(comps) - 1 and not isinstance(value, abc.Mapping):
+                cache[key] = value
+                return
+            if isinstance(next_cache, abc.Mapping):
+                cache = cow.writable(cache, key)
+            else:
+                cache[key] = {}
+                cache = cow.writable(cache, key)
+        _CacheImpl(name_key_in_config).update(cache, value, cow)
@@ -0,0 +1,182 @@
+# Copyright (C) 2021 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+
+"""Client-side cache of field data keyed on the requests."""
+
+from collections import OrderedDict
+from collections.abc import Hashable
+from enum import Enum
+import threading
+from typing import Any
+
+import numpy as np
+
+#: Default byte-size budget of the field data cache.
+DEFAULT_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+
+def _freeze(value: Any) -> Hashable:
+    """Convert a request parameter to a hashable value."""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple((k, _freeze(v)) for k, v in value.items())
+    if isinstance(value, Enum):
+        return value.value
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
+def request_key(
+    request_type: str, request_params: dict, surface_ids: list[int]
+) -> Hashable:
+    """Build the cache key of a field data request.
+
+    Parameters
+    ----------
+    request_type : str
+        Name of the request class.
+    request_params : dict
+        Request parameters, as returned by the ``_asdict()`` method of the request.
+    surface_ids : list[int]
+        Surface IDs the request resolves to.
+    """
+    params = {
+        name: value for name, value in request_params.items() if name != "surfaces"
+    }
+    return request_type, _freeze(params), tuple(surface_ids)
+
+
+def _nbytes(value: Any) -> int:
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, dict):
+        return sum(_nbytes(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(_nbytes(item) for item in value)
+    return 0
+
+
+def _set_read_only(value: Any) -> None:
+    if isinstance(value, np.ndarray):
+        value.flags.writeable = False
+    elif isinstance(value, dict):
+        for item in value.values():
+            _set_read_only(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            _set_read_only(item)
+
+
+class FieldDataCache:
+    """Least-recently-used cache of extracted field data with a byte-size budget.
+
+    Entries are either solution entries, which are dropped whenever the
+    solution changes, or geometry entries, which are only dropped when the
+    mesh changes. The arrays of cached values are made read-only, as they are
+    shared by all the callers which get them.
+
+    Parameters
+    ----------
+    max_bytes : int, optional
+        Maximum total size of the cached arrays in bytes.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_CACHE_MAX_BYTES):
+        """__init__ method of FieldDataCache class."""
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[Hashable, tuple[Any, int, bool]] = OrderedDict()
+        self._nbytes = 0
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def nbytes(self) -> int:
+        """Total size of the cached arrays in bytes."""
+        return self._nbytes
+
+    @property
+    def generation(self) -> int:
+        """Counter incremented on every invalidation.
+
+        Read it before fetching a value and pass it to :meth:`put`, so that a
+        value fetched before an invalidation is not cached.
+        """
+        return self._generation
+
+    def get(self, key: Hashable) -> Any | None:
+        """Get a cached value, or ``None`` if the key is not cached."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(
+        self,
+        key: Hashable,
+        value: Any,
+        geometry: bool = False,
+        generation: int | None = None,
+    ) -> None:
+        """Cache a value, evicting least-recently-used entries to stay in budget.
+
+        Values larger than the budget are not cached, nor are values fetched
+        before the last invalidation, as told by ``generation``.
+        """
+        nbytes = _nbytes(value)
+        if nbytes > self.max_bytes:
+            return
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            _set_read_only(value)
+            self._pop(key)
+            self._entries[key] = (value, nbytes, geometry)
+            self._nbytes += nbytes
+            while self._nbytes > self.max_bytes:
+                self._pop(next(iter(self._entries)))
+
+    def invalidate(self, geometry: bool = False) -> None:
+        """Drop the solution entries, and the geometry entries if ``geometry`` is set."""
+        with self._lock:
+            self._generation += 1
+            for key in [
+                key for key, entry in self._entries.items() if geometry or not entry[2]
+            ]:
+                self._pop(key)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self.invalidate(geometry=True)
+
+    def _pop(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._nbytes -= entry[1]
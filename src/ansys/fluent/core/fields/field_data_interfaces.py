@@ -26,7 +26,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections.abc import Callable
+from collections.abc import Callable, Iterator, Sequence
 import dataclasses
 from enum import Enum
 from typing import TYPE_CHECKING, Iterable
@@ -732,6 +732,102 @@ class _AllowedVectorFieldNames(_AllowedFieldNames):
         return name in self(respect_data_valid)
 
 
+class FaceConnectivity(Sequence):
+    """
+    Face-wise view of flat face connectivity data.
+
+    Each face in the flat array is represented by ``[N, v0, v1, ..., vN]``, where
+    ``N`` is the number of vertices in the face and ``v0...vN`` are the vertex
+    indices. This is the legacy VTK cell array layout, so ``data`` can be passed
+    to VTK or PyVista as is.
+
+    Faces are located with vectorized operations, and indexing a face returns a
+    view into ``data``.
+
+    Attributes
+    ----------
+    data: npt.NDArray[np.int32]
+        Flat connectivity data.
+    counts: npt.NDArray[np.int64]
+        Number of vertices of each face.
+    offsets: npt.NDArray[np.int64]
+        Offsets of each face into ``indices``, with a trailing entry equal to
+        the length of ``indices``.
+    indices: npt.NDArray[np.int32]
+        Vertex indices of all faces, without the vertex counts.
+
+    Examples
+    --------
+    >>> connectivity = FaceConnectivity(np.array([4, 4, 5, 12, 11, 3, 1, 2, 3]))
+    >>> list(connectivity)
+    [array([ 4,  5, 12, 11]), array([1, 2, 3])]
+    >>> connectivity.offsets
+    array([0, 4, 7])
+    """
+
+    def __init__(self, data: npt.NDArray[np.int32]):
+        """__init__ method of FaceConnectivity class."""
+        import numpy as np
+
+        self.data = np.asarray(data)
+        self._starts = _face_starts(self.data)
+        self.counts = np.diff(self._starts, append=len(self.data) + 1) - 1
+        self.offsets = np.concatenate(([0], np.cumsum(self.counts)))
+        self._indices = None
+
+    @property
+    def indices(self) -> npt.NDArray[np.int32]:
+        """Vertex indices of all faces, without the vertex counts."""
+        import numpy as np
+
+        if self._indices is None:
+            mask = np.ones(len(self.data), dtype=bool)
+            mask[self._starts - 1] = False
+            self._indices = self.data[mask]
+        return self._indices
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        start = self._starts[index]
+        return self.data[start : start + self.counts[index]]
+
+    def __iter__(self) -> Iterator[npt.NDArray[np.int32]]:
+        data = self.data
+        for start, count in zip(self._starts.tolist(), self.counts.tolist()):
+            yield data[start : start + count]
+
+    def __repr__(self) -> str:
+        return f"FaceConnectivity(faces={len(self)}, indices={self.offsets[-1]})"
+
+
+def _face_starts(data: npt.NDArray[np.int32]) -> npt.NDArray[np.int64]:
+    """Get positions of the first vertex index of each face in flat connectivity.
+
+    Faces of a single size, such as triangles or pathline segments, are located
+    with one strided comparison. Otherwise, each face header depends on the
+    previous one, and the headers are collected in a single scan over the data.
+    """
+    import numpy as np
+
+    size = len(data)
+    if size == 0:
+        return np.zeros(0, dtype=np.int64)
+    stride = int(data[0]) + 1
+    if stride > 1 and size % stride == 0 and (data[::stride] == stride - 1).all():
+        return np.arange(1, size, stride, dtype=np.int64)
+    values = data.tolist()
+    starts = []
+    position = 0
+    while position < size:
+        starts.append(position + 1)
+        position += max(values[position], 0) + 1
+    return np.array(starts, dtype=np.int64)
+
+
 class SurfaceData:
     """
     Class that enables object-style access to surface data structures.
@@ -739,7 +835,7 @@ class SurfaceData:
     Attributes
     ----------
     vertices: npt.NDArray[np.float64] | None
-    connectivity: list[npt.NDArray[np.float64]] | None
+    connectivity: FaceConnectivity | npt.NDArray[np.int32] | None
     face_centroids: npt.NDArray[np.float64] | None
     face_normals: npt.NDArray[np.float64] | None
     """
@@ -750,8 +846,8 @@ class SurfaceData:
         self.vertices: npt.NDArray[np.float64] | None = self._surf_data.get(
             SurfaceDataType.Vertices
         )
-        self.connectivity: list[npt.NDArray[np.int32]] | None = self._surf_data.get(
-            SurfaceDataType.FacesConnectivity
+        self.connectivity: FaceConnectivity | npt.NDArray[np.int32] | None = (
+            self._surf_data.get(SurfaceDataType.FacesConnectivity)
         )
         self.face_centroids: npt.NDArray[np.float64] | None = self._surf_data.get(
             SurfaceDataType.FacesCentroid
@@ -769,7 +865,7 @@ class PathlinesData:
     ----------
     scalar_field_name: str
     vertices: npt.NDArray[np.float64] | None
-    lines: list[npt.NDArray[np.float64]] | None
+    lines: FaceConnectivity | npt.NDArray[np.int32] | None
     scalar_field: npt.NDArray[np.float64] | None
     pathlines_count: npt.NDArray[np.float64] | None
     particle_time: npt.NDArray[np.float64] | None
@@ -785,7 +881,7 @@ class PathlinesData:
         self.vertices: npt.NDArray[np.float64] | None = (
             self._pathlines_data_for_surface.get("vertices")
         )
-        self.lines: list[npt.NDArray[np.int32]] | None = (
+        self.lines: FaceConnectivity | npt.NDArray[np.int32] | None = (
             self._pathlines_data_for_surface.get("lines")
         )
         self.scalar_field: npt.NDArray[np.float64] | None = (
@@ -821,7 +917,7 @@ class _ReturnFieldData:
         surface_data: np.ndarray | list[np.ndarray],
         deprecated_flag: bool | None = False,
         flatten_connectivity: bool = False,
-    ) -> dict[int | str, dict[SurfaceDataType, np.ndarray | list[np.ndarray]]]:
+    ) -> dict[int | str, dict[SurfaceDataType, np.ndarray | FaceConnectivity]]:
         surfaces = get_surfaces_from_objects(surfaces)
         ret_surf_data = {}
         for count, surface in enumerate(surfaces):
@@ -843,12 +939,10 @@ class _ReturnFieldData:
                             "'SurfaceFieldDataRequest' to request data in the flat format.",
                             PyFluentDeprecationWarning,
                         )
-                        ret_surf_data[surface][data_type] = (
-                            _transform_faces_connectivity_data(
-                                surface_data[surface_ids[count]][
-                                    SurfaceDataType.FacesConnectivity.value
-                                ]
-                            )
+                        ret_surf_data[surface][data_type] = FaceConnectivity(
+                            surface_data[surface_ids[count]][
+                                SurfaceDataType.FacesConnectivity.value
+                            ]
                         )
                 else:
                     ret_surf_data[surface][data_type] = surface_data[
@@ -879,7 +973,7 @@ class _ReturnFieldData:
         pathlines_data: dict,
         deprecated_flag: bool | None = False,
         flatten_connectivity: bool = False,
-    ) -> dict[int | str, dict[str, np.ndarray | list[np.ndarray]]]:
+    ) -> dict[int | str, dict[str, np.ndarray | FaceConnectivity]]:
         surfaces = get_surfaces_from_objects(surfaces)
         path_lines_dict = {}
         for count, surface in enumerate(surfaces):
@@ -896,7 +990,7 @@ class _ReturnFieldData:
                     "'PathlinesFieldDataRequest' to request data in the flat format.",
                     PyFluentDeprecationWarning,
                 )
-                lines_data = _transform_faces_connectivity_data(
+                lines_data = FaceConnectivity(
                     pathlines_data[surface_ids[count]]["lines"]
                 )
             temp_dict = {
@@ -946,42 +1040,3 @@ def get_surfaces_from_objects(surfaces: list[int | str | object]):
         else:
             updated_surfaces.append(surface)
     return updated_surfaces
-
-
-def _transform_faces_connectivity_data(data):
-    """
-    Transform flat face connectivity data into structured face-wise format.
-
-    Each face in the flat array is represented by:
-    [N, v0, v1, ..., vN], where:
-      - N is the number of vertices in the face
-      - v0...vN are the vertex indices
-
-    This function parses such a flat array and returns a list of vertex index arrays,
-    each representing a face.
-
-    Parameters
-    ----------
-    data : array-like of int
-        Flat array containing face connectivity data, typically returned from
-        `faces_connectivity_data["inlet"].connectivity`.
-
-    Returns
-    -------
-    faces_data : list of ndarray
-        List of 1D NumPy arrays, where each array contains the vertex indices
-        of a face.
-
-    Examples
-    --------
-    >>> flat_data = np.array([4, 4, 5, 12, 11, 3, 1, 2, 3], dtype=np.int32)
-    >>> _transform_faces_connectivity_data(flat_data)
-    [array([ 4,  5, 12, 11]), array([1, 2, 3])]
-    """
-    faces_data = []
-    i = 0
-    while i < len(data):
-        end = i + 1 + data[i]
-        faces_data.append(data[i + 1 : end])
-        i = end
-    return faces_data
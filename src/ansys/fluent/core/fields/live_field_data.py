@@ -22,10 +22,15 @@
 
 """Wrappers over FieldData gRPC service of Fluent."""
 
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from enum import Enum
+import itertools
 import logging
+import operator
+import queue
+import threading
 import time
 import warnings
 import weakref
@@ -34,13 +39,20 @@ import numpy as np
 
 from ansys.api.fluent.v0 import field_data_pb2 as FieldDataProtoModule
 from ansys.fluent.core.exceptions import DisallowedValuesError
+from ansys.fluent.core.fields.field_data_cache import (
+    DEFAULT_CACHE_MAX_BYTES,
+    FieldDataCache,
+    request_key,
+)
 from ansys.fluent.core.fields.field_data_interfaces import (
     BaseFieldDataSource,
     BaseFieldInfo,
     FieldBatch,
     FieldDataSource,
+    PathlinesData,
     PathlinesFieldDataRequest,
     ScalarFieldDataRequest,
+    SurfaceData,
     SurfaceDataType,
     SurfaceFieldDataRequest,
     VectorFieldDataRequest,
@@ -56,6 +68,7 @@ from ansys.fluent.core.fields.field_data_interfaces import (
     get_surfaces_from_objects,
 )
 from ansys.fluent.core.pyfluent_warnings import PyFluentDeprecationWarning
+from ansys.fluent.core.streaming_services.events_streaming import SolverEvent
 from ansys.fluent.core.variable_strategies import (
     FluentFieldDataNamingStrategy as naming_strategy,
 )
@@ -187,11 +200,7 @@ class BaseFieldData:
 
     def get_surface_ids(self, surfaces: list[str | int]) -> list[int]:
         """Get a list of surface ids based on surfaces provided as inputs."""
-        return _get_surface_ids(
-            field_info=self._field_info,
-            allowed_surface_names=self._allowed_surface_names,
-            surfaces=surfaces,
-        )
+        return _get_surface_ids(field_info=self._field_info, surfaces=surfaces)
 
     def _get_scalar_field_data(
         self,
@@ -328,10 +337,12 @@ class Batch(FieldBatch):
         allowed_surface_names,
         allowed_scalar_field_names,
         allowed_vector_field_names,
+        validate_surface_ids: bool = True,
     ):
         """__init__ method of Batch class."""
         self._field_data = field_data
         self._field_info = field_info
+        self._validate_surface_ids = validate_surface_ids
 
         self._allowed_surface_names = allowed_surface_names
         self._allowed_scalar_field_names = allowed_scalar_field_names
@@ -340,13 +351,14 @@ class Batch(FieldBatch):
         self._fetched_data = _FetchFieldData()
         self._pathline_field_data = []
         self._cache_requests = []
+        self._requests = []
 
     def get_surface_ids(self, surfaces: list[str | int]) -> list[int]:
         """Get a list of surface ids based on surfaces provided as inputs."""
         return _get_surface_ids(
             field_info=self._field_info,
-            allowed_surface_names=self._allowed_surface_names,
             surfaces=surfaces,
+            validate=self._validate_surface_ids,
         )
 
     def _add_surfaces_request(self, **kwargs) -> None:
@@ -434,8 +446,8 @@ class Batch(FieldBatch):
         This method allows users to specify multiple field data requests, which will
         later be processed when retrieving responses.
         """
-        for req in (obj,) + args:
-            req = req._replace(surfaces=self.get_surface_ids(req.surfaces))
+        for request in (obj,) + args:
+            req = request._replace(surfaces=self.get_surface_ids(request.surfaces))
             if req in self._cache_requests:
                 warnings.warn(f"{req._asdict()} is duplicate and being ignored.")
                 continue
@@ -475,6 +487,7 @@ class Batch(FieldBatch):
                     zones=req.zones,
                 )
             self._cache_requests.append(req)
+            self._requests.append(request)
         return self
 
     def get_response(self) -> BatchFieldData:
@@ -495,10 +508,187 @@ class Batch(FieldBatch):
             self._allowed_scalar_field_names,
         )
 
+    def iter_responses(self, streams: int = 1) -> Iterator[
+        tuple[
+            SurfaceFieldDataRequest
+            | ScalarFieldDataRequest
+            | VectorFieldDataRequest
+            | PathlinesFieldDataRequest,
+            int | str,
+            SurfaceData | PathlinesData | np.ndarray,
+        ]
+    ]:
+        """Iterate over data for previously added requests as it arrives.
+
+        Data for a surface is yielded once all its fields are decoded and its
+        stream has moved on to another surface, so that processing can overlap
+        with the transfer of the remaining data.
+
+        Parameters
+        ----------
+        streams : int, optional
+            Number of concurrent streams that the batch is split into. The
+            default is ``1``, which sends the batch in a single stream.
+
+        Yields
+        ------
+        tuple
+            ``(request, surface, data)`` where ``request`` is the added request,
+            ``surface`` is one of its surfaces, and ``data`` is the data that
+            ``get_field_data(request)[surface]`` returns.
+        """
+        if streams < 1:
+            raise ValueError("'streams' must be a positive integer.")
+        pending = {}
+        for request, req in zip(self._requests, self._cache_requests):
+            for surface, surface_id in zip(
+                get_surfaces_from_objects(request.surfaces), req.surfaces
+            ):
+                response = _PendingResponse(request, surface, surface_id)
+                pending.setdefault((response.payload_tag_id, surface_id), []).append(
+                    response
+                )
+        # A field can be sent in several payloads, so a surface is only
+        # complete once every stream that contributed to it has moved on.
+        current = {}
+        for stream, item in self._iter_fields(streams):
+            key = None if item is None else item[:2]
+            previous = current.get(stream)
+            current[stream] = key
+            if previous is not None and previous != key:
+                busy = {s for s, k in current.items() if k == previous}
+                responses = pending.get(previous, [])
+                for response in list(responses):
+                    if response.complete and not response.streams & busy:
+                        responses.remove(response)
+                        yield response.request, response.surface, response.data()
+            if item is not None:
+                for response in pending.get(key, []):
+                    response.add(stream, *item[2:])
+        for responses in pending.values():
+            for response in responses:
+                if response.fields:
+                    yield response.request, response.surface, response.data()
+
+    def _iter_fields(self, streams: int) -> Iterator[tuple]:
+        # Yields ``(stream, item)`` for each decoded field and ``(stream, None)``
+        # when a stream ends.
+        if streams == 1:
+            for item in self._field_data.iter_fields(
+                self._field_data.get_batched_fields()
+            ):
+                yield 0, item
+            yield 0, None
+            return
+        chunk_iterators = self._field_data.get_batched_fields_streams(streams)
+        results = queue.Queue()
+        stopped = threading.Event()
+
+        def read(stream, chunk_iterator):
+            try:
+                for item in self._field_data.iter_fields(chunk_iterator):
+                    if stopped.is_set():
+                        break
+                    results.put((stream, item))
+            except Exception as ex:
+                results.put(ex)
+            finally:
+                results.put((stream, None))
+
+        executor = ThreadPoolExecutor(max_workers=len(chunk_iterators))
+        try:
+            for stream, chunk_iterator in enumerate(chunk_iterators):
+                executor.submit(read, stream, chunk_iterator)
+            active = len(chunk_iterators)
+            while active:
+                result = results.get()
+                if isinstance(result, Exception):
+                    raise result
+                if result[1] is None:
+                    active -= 1
+                yield result
+        finally:
+            stopped.set()
+            for chunk_iterator in chunk_iterators:
+                cancel = getattr(chunk_iterator, "cancel", None)
+                if cancel is not None:
+                    cancel()
+            executor.shutdown(wait=False)
+
     def __call__(self):
         self.get_response()
 
 
+class _PendingResponse:
+    """Fields received so far for one surface of a batch request."""
+
+    def __init__(self, request, surface: int | str, surface_id: int):
+        self.request = request
+        self.surface = surface
+        self.surface_id = surface_id
+        self.fields = {}
+        self.streams = set()
+        if isinstance(request, SurfaceFieldDataRequest):
+            self.payload_tag_id = (("type", "surface-data"),)
+            self._required = {SurfaceDataType(d).value for d in request.data_types}
+        elif isinstance(request, ScalarFieldDataRequest):
+            self.payload_tag_id = (
+                ("type", "scalar-field"),
+                ("dataLocation", 1 if request.node_value else 0),
+                ("boundaryValues", request.boundary_value),
+            )
+            self._required = {_to_field_name_str(request.field_name)}
+        elif isinstance(request, VectorFieldDataRequest):
+            self.payload_tag_id = (("type", "vector-field"),)
+            self._required = {_to_field_name_str(request.field_name)}
+        else:
+            field_name = _to_field_name_str(request.field_name)
+            self.payload_tag_id = (("type", "pathlines-field"), ("field", field_name))
+            self._required = {"vertices", "lines", "pathlines-count", field_name}
+            if request.provide_particle_time_field:
+                self._required.add("particle-time")
+
+    @property
+    def complete(self) -> bool:
+        """Whether every required field has been received."""
+        return self._required.issubset(self.fields)
+
+    def add(self, stream: int, field_name: str, values: np.ndarray) -> None:
+        """Add a payload of a field received on ``stream``."""
+        if field_name not in self._required:
+            return
+        if field_name in self.fields:
+            values = np.concatenate((self.fields[field_name], values))
+        self.fields[field_name] = values
+        self.streams.add(stream)
+
+    def data(self) -> SurfaceData | PathlinesData | np.ndarray:
+        """Get the received data in the format of ``get_field_data``."""
+        args = ([self.surface], [self.surface_id], {self.surface_id: self.fields})
+        request = self.request
+        if isinstance(request, SurfaceFieldDataRequest):
+            data = _ReturnFieldData._surface_data(
+                [SurfaceDataType(d) for d in request.data_types],
+                *args,
+                flatten_connectivity=request.flatten_connectivity,
+            )
+        elif isinstance(request, ScalarFieldDataRequest):
+            data = _ReturnFieldData._scalar_data(
+                _to_field_name_str(request.field_name), *args
+            )
+        elif isinstance(request, VectorFieldDataRequest):
+            data = _ReturnFieldData._vector_data(
+                _to_field_name_str(request.field_name), *args
+            )
+        else:
+            data = _ReturnFieldData._pathlines_data(
+                _to_field_name_str(request.field_name),
+                *args,
+                flatten_connectivity=request.flatten_connectivity,
+            )
+        return data[self.surface]
+
+
 class Transaction(Batch):
     """Transaction class - deprecated."""
 
@@ -513,15 +703,21 @@ class Transaction(Batch):
 
 def _get_surface_ids(
     field_info: _FieldInfo,
-    allowed_surface_names,
     surfaces: list[int | str | object],
+    validate: bool = True,
 ) -> list[int]:
     """Get surface IDs based on surface names or IDs.
 
+    All surfaces are resolved and validated against a single fetch of the
+    surfaces info.
+
     Parameters
     ----------
     surfaces : List[int] | List[str]
         List of surface IDs or surface names.
+    validate : bool, optional
+        Whether to validate surface IDs. When ``False``, surface IDs are trusted
+        and passed through unchecked. Surface names are always resolved.
 
     Returns
     -------
@@ -529,21 +725,29 @@ def _get_surface_ids(
     """
     surface_ids = []
     updated_surfaces = get_surfaces_from_objects(surfaces)
+    surfaces_info = None
+    allowed_surf_ids = None
     for surf in updated_surfaces:
+        if not validate and isinstance(surf, int):
+            surface_ids.append(surf)
+            continue
+        if surfaces_info is None:
+            surfaces_info = field_info._get_surfaces_info()
         if isinstance(surf, str):
-            surface_ids.extend(
-                field_info._get_surfaces_info()[allowed_surface_names.valid_name(surf)][
-                    "surface_id"
-                ]
-            )
+            if surf not in surfaces_info:
+                raise DisallowedValuesError("surface", surf, list(surfaces_info))
+            surface_ids.extend(surfaces_info[surf]["surface_id"])
+            continue
+        if allowed_surf_ids is None:
+            allowed_surf_ids = [
+                info["surface_id"][0] for info in surfaces_info.values()
+            ]
+        if surf in allowed_surf_ids:
+            surface_ids.append(surf)
+        elif isinstance(surf, Iterable) and not isinstance(surf, (str, bytes)):
+            raise DisallowedValuesError("surface", surf, list(surf))
         else:
-            allowed_surf_ids = _AllowedSurfaceIDs(field_info)()
-            if surf in allowed_surf_ids:
-                surface_ids.append(surf)
-            elif isinstance(surf, Iterable) and not isinstance(surf, (str, bytes)):
-                raise DisallowedValuesError("surface", surf, list(surf))
-            else:
-                raise DisallowedValuesError("surface", surf, allowed_surf_ids)
+            raise DisallowedValuesError("surface", surf, allowed_surf_ids)
     return surface_ids
 
 
@@ -659,20 +863,406 @@ class Element:
     facets: list[Facet] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(frozen=True)
+class MeshArrays:
+    """Columnar, array-backed storage of a cell zone mesh.
+
+    Standard elements are stored in CSR form (``element_offsets`` into
+    ``element_connectivity``). Polyhedral elements use a second CSR level:
+    ``element_facet_offsets`` indexes facets, and ``facet_offsets`` indexes
+    ``facet_connectivity``. All connectivity holds 0-based node indices.
+
+    Attributes
+    ----------
+    node_ids : np.ndarray
+        Node ids, shape ``(N,)``.
+    node_coords : np.ndarray
+        Node coordinates, shape ``(N, 3)``.
+    element_ids : np.ndarray
+        Element ids, shape ``(E,)``.
+    element_types : np.ndarray
+        ``CellElementType`` codes of the elements, shape ``(E,)``.
+    element_offsets : np.ndarray
+        Offsets into ``element_connectivity``, shape ``(E + 1,)``.
+    element_connectivity : np.ndarray
+        Node indices of standard elements.
+    element_facet_offsets : np.ndarray
+        Offsets into ``facet_offsets``, shape ``(E + 1,)``.
+    facet_offsets : np.ndarray
+        Offsets into ``facet_connectivity``, shape ``(F + 1,)``.
+    facet_connectivity : np.ndarray
+        Node indices of polyhedral facets.
+    """
+
+    node_ids: np.ndarray
+    node_coords: np.ndarray
+    element_ids: np.ndarray
+    element_types: np.ndarray
+    element_offsets: np.ndarray
+    element_connectivity: np.ndarray
+    element_facet_offsets: np.ndarray
+    facet_offsets: np.ndarray
+    facet_connectivity: np.ndarray
+
+    @property
+    def node_count(self) -> int:
+        """Number of nodes."""
+        return len(self.node_ids)
+
+    @property
+    def element_count(self) -> int:
+        """Number of elements."""
+        return len(self.element_ids)
+
+    def element_node_indices(self, index: int) -> np.ndarray:
+        """Get node indices of an element as a view into ``element_connectivity``."""
+        return self.element_connectivity[
+            self.element_offsets[index] : self.element_offsets[index + 1]
+        ]
+
+    def element_facets(self, index: int) -> list[np.ndarray]:
+        """Get node indices of the facets of an element as views."""
+        return [
+            self.facet_connectivity[self.facet_offsets[i] : self.facet_offsets[i + 1]]
+            for i in range(
+                self.element_facet_offsets[index],
+                self.element_facet_offsets[index + 1],
+            )
+        ]
+
+
+def _offsets_from_counts(counts: np.ndarray) -> np.ndarray:
+    offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    return offsets
+
+
+def _nodes_chunk_to_arrays(nodes_pb, dtype) -> tuple[np.ndarray, np.ndarray]:
+    count = len(nodes_pb)
+    node_ids = np.fromiter((node.id for node in nodes_pb), dtype=np.int64, count=count)
+    node_coords = np.fromiter(
+        (c for node in nodes_pb for c in (node.x, node.y, node.z)),
+        dtype=dtype,
+        count=3 * count,
+    ).reshape(count, 3)
+    return node_ids, node_coords
+
+
+def _elements_chunk_to_arrays(elements_pb) -> tuple[np.ndarray, ...]:
+    """Convert a chunk of element messages to arrays with raw node ids."""
+    count = len(elements_pb)
+    element_ids = np.fromiter(
+        (element.id for element in elements_pb), dtype=np.int64, count=count
+    )
+    element_types = np.fromiter(
+        (element.element_type for element in elements_pb), dtype=np.int8, count=count
+    )
+    is_poly = element_types == CellElementType.POLYHEDRON.value
+    standard = [e for e, poly in zip(elements_pb, is_poly) if not poly]
+    polyhedra = [e for e, poly in zip(elements_pb, is_poly) if poly]
+    node_counts = np.zeros(count, dtype=np.int64)
+    node_counts[~is_poly] = np.fromiter(
+        (len(e.node_ids) for e in standard), dtype=np.int64, count=len(standard)
+    )
+    node_ids = np.fromiter(
+        itertools.chain.from_iterable(e.node_ids for e in standard),
+        dtype=np.int64,
+        count=int(node_counts.sum()),
+    )
+    facet_counts = np.zeros(count, dtype=np.int64)
+    facet_counts[is_poly] = np.fromiter(
+        (len(e.facets) for e in polyhedra), dtype=np.int64, count=len(polyhedra)
+    )
+    facets = [facet for e in polyhedra for facet in e.facets]
+    # The repeated field is named ``node`` in the v0 API and ``nodes`` in v1.
+    facet_nodes = operator.attrgetter(
+        "nodes" if facets and hasattr(facets[0], "nodes") else "node"
+    )
+    facet_sizes = np.fromiter(
+        (len(facet_nodes(f)) for f in facets), dtype=np.int64, count=len(facets)
+    )
+    facet_node_ids = np.fromiter(
+        itertools.chain.from_iterable(facet_nodes(f) for f in facets),
+        dtype=np.int64,
+        count=int(facet_sizes.sum()),
+    )
+    return (
+        element_ids,
+        element_types,
+        node_counts,
+        node_ids,
+        facet_counts,
+        facet_sizes,
+        facet_node_ids,
+    )
+
+
+def _node_indices_from_ids(
+    ids: np.ndarray, node_ids: np.ndarray, sorter: np.ndarray
+) -> np.ndarray:
+    """Map node ids to 0-based indices into ``node_ids``."""
+    if not len(ids):
+        return np.empty(0, dtype=np.int64)
+    if not len(node_ids):
+        raise ValueError("Element connectivity references unknown node ids.")
+    positions = np.searchsorted(node_ids, ids, sorter=sorter)
+    np.minimum(positions, len(node_ids) - 1, out=positions)
+    indices = sorter[positions]
+    if not np.array_equal(node_ids[indices], ids):
+        raise ValueError("Element connectivity references unknown node ids.")
+    return indices
+
+
+def _concatenate(arrays: list[np.ndarray], dtype) -> np.ndarray:
+    return np.concatenate(arrays) if arrays else np.empty(0, dtype=dtype)
+
+
+def _build_node_arrays(nested_nodes, dtype) -> tuple[np.ndarray, np.ndarray]:
+    """Build node id and coordinate arrays from the streamed node messages."""
+    node_chunks = [_nodes_chunk_to_arrays(nodes_pb, dtype) for nodes_pb in nested_nodes]
+    node_ids = _concatenate([ids for ids, _ in node_chunks], np.int64)
+    node_coords = (
+        np.concatenate([coords for _, coords in node_chunks])
+        if node_chunks
+        else np.empty((0, 3), dtype=dtype)
+    )
+    return node_ids, node_coords
+
+
+def _build_element_arrays(nested_elements) -> tuple[np.ndarray, ...]:
+    """Build element arrays with raw node ids from the streamed element messages."""
+    element_chunks = [
+        _elements_chunk_to_arrays(elements_pb) for elements_pb in nested_elements
+    ]
+    return tuple(
+        _concatenate([chunk[i] for chunk in element_chunks], dtype)
+        for i, dtype in enumerate(
+            (np.int64, np.int8, np.int64, np.int64, np.int64, np.int64, np.int64)
+        )
+    )
+
+
+def _assemble_mesh_arrays(
+    node_ids: np.ndarray,
+    node_coords: np.ndarray,
+    sorter: np.ndarray,
+    element_arrays: tuple[np.ndarray, ...],
+    compact: bool = False,
+) -> MeshArrays:
+    """Assemble ``MeshArrays`` from node arrays and raw element arrays.
+
+    If ``compact`` is set, only the nodes referenced by the elements are kept.
+    """
+    (
+        element_ids,
+        element_types,
+        node_counts,
+        connectivity_ids,
+        facet_counts,
+        facet_sizes,
+        facet_node_ids,
+    ) = element_arrays
+    connectivity = _node_indices_from_ids(connectivity_ids, node_ids, sorter)
+    facet_connectivity = _node_indices_from_ids(facet_node_ids, node_ids, sorter)
+    if compact:
+        used = np.unique(np.concatenate((connectivity, facet_connectivity)))
+        node_ids, node_coords = node_ids[used], node_coords[used]
+        connectivity = np.searchsorted(used, connectivity)
+        facet_connectivity = np.searchsorted(used, facet_connectivity)
+    return MeshArrays(
+        node_ids=node_ids,
+        node_coords=node_coords,
+        element_ids=element_ids,
+        element_types=element_types,
+        element_offsets=_offsets_from_counts(node_counts),
+        element_connectivity=connectivity,
+        element_facet_offsets=_offsets_from_counts(facet_counts),
+        facet_offsets=_offsets_from_counts(facet_sizes),
+        facet_connectivity=facet_connectivity,
+    )
+
+
+def _build_mesh_arrays(nested_nodes, nested_elements, dtype=np.float64) -> MeshArrays:
+    """Build ``MeshArrays`` from the streamed node and element messages."""
+    node_ids, node_coords = _build_node_arrays(nested_nodes, dtype)
+    return _assemble_mesh_arrays(
+        node_ids,
+        node_coords,
+        np.argsort(node_ids, kind="stable"),
+        _build_element_arrays(nested_elements),
+    )
+
+
+def _chunk_elements(nested_elements, chunk_cells: int | None):
+    """Regroup streamed element messages into chunks of at most ``chunk_cells``."""
+    if chunk_cells is None:
+        yield from nested_elements
+        return
+    pending = []
+    for elements_pb in nested_elements:
+        pending.extend(elements_pb)
+        if len(pending) < chunk_cells:
+            continue
+        full = len(pending) - len(pending) % chunk_cells
+        for start in range(0, full, chunk_cells):
+            yield pending[start : start + chunk_cells]
+        # Only the remainder, shorter than a chunk, is carried over.
+        pending = pending[full:]
+    if pending:
+        yield pending
+
+
+class _NodesView(Sequence):
+    """Lazy sequence of ``Node`` objects over ``MeshArrays``."""
+
+    def __init__(self, arrays: MeshArrays):
+        self._arrays = arrays
+
+    def __len__(self) -> int:
+        return self._arrays.node_count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        x, y, z = self._arrays.node_coords[index].tolist()
+        return Node(_id=int(self._arrays.node_ids[index]), x=x, y=y, z=z)
+
+
+class _ElementsView(Sequence):
+    """Lazy sequence of ``Element`` objects over ``MeshArrays``."""
+
+    def __init__(self, arrays: MeshArrays):
+        self._arrays = arrays
+
+    def __len__(self) -> int:
+        return self._arrays.element_count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        arrays = self._arrays
+        _id = int(arrays.element_ids[index])
+        index = operator.index(index) % len(self)
+        return Element(
+            _id=_id,
+            element_type=CellElementType(int(arrays.element_types[index])),
+            node_indices=arrays.element_node_indices(index).tolist(),
+            facets=[
+                Facet(node_indices=facet.tolist())
+                for facet in arrays.element_facets(index)
+            ],
+        )
+
+
+def _mesh_arrays_from_objects(
+    nodes: Sequence[Node], elements: Sequence[Element]
+) -> MeshArrays:
+    """Build ``MeshArrays`` from ``Node`` and ``Element`` objects."""
+    facets = [facet for element in elements for facet in element.facets]
+    return MeshArrays(
+        node_ids=np.array([node._id for node in nodes], dtype=np.int64),
+        node_coords=np.array(
+            [(node.x, node.y, node.z) for node in nodes], dtype=np.float64
+        ).reshape(-1, 3),
+        element_ids=np.array([element._id for element in elements], dtype=np.int64),
+        element_types=np.array(
+            [CellElementType(element.element_type).value for element in elements],
+            dtype=np.int8,
+        ),
+        element_offsets=_offsets_from_counts(
+            [len(element.node_indices) for element in elements]
+        ),
+        element_connectivity=np.array(
+            [i for element in elements for i in element.node_indices], dtype=np.int64
+        ),
+        element_facet_offsets=_offsets_from_counts(
+            [len(element.facets) for element in elements]
+        ),
+        facet_offsets=_offsets_from_counts(
+            [len(facet.node_indices) for facet in facets]
+        ),
+        facet_connectivity=np.array(
+            [i for facet in facets for i in facet.node_indices], dtype=np.int64
+        ),
+    )
+
+
 class Mesh:
     """Mesh class for Fluent field data.
 
+    The mesh is stored column-wise in ``arrays``. ``nodes`` and ``elements``
+    are lazy views which construct ``Node`` and ``Element`` objects on access.
+
+    Parameters
+    ----------
+    nodes : Sequence[Node]
+        Nodes in the mesh.
+    elements : Sequence[Element]
+        Elements in the mesh.
+
     Attributes
     ----------
-    nodes : list[Node]
-        List of nodes in the mesh.
-    elements : list[Element]
-        List of elements in the mesh.
+    arrays : MeshArrays
+        Array-backed storage of the mesh.
+    nodes : Sequence[Node]
+        Nodes in the mesh.
+    elements : Sequence[Element]
+        Elements in the mesh.
     """
 
-    nodes: list[Node]
-    elements: list[Element]
+    def __init__(self, nodes: Sequence[Node], elements: Sequence[Element]):
+        """__init__ method of Mesh class."""
+        self.arrays = _mesh_arrays_from_objects(nodes, elements)
+
+    @classmethod
+    def from_arrays(cls, arrays: MeshArrays) -> "Mesh":
+        """Create a mesh over array-backed storage without copying it."""
+        mesh = cls.__new__(cls)
+        mesh.arrays = arrays
+        return mesh
+
+    def __eq__(self, other):
+        if not isinstance(other, Mesh):
+            return NotImplemented
+        return list(self.nodes) == list(other.nodes) and list(self.elements) == list(
+            other.elements
+        )
+
+    def __repr__(self):
+        return (
+            f"Mesh(nodes=<{self.arrays.node_count} nodes>, "
+            f"elements=<{self.arrays.element_count} elements>)"
+        )
+
+    @property
+    def nodes(self) -> Sequence[Node]:
+        """Nodes in the mesh."""
+        return _NodesView(self.arrays)
+
+    @property
+    def elements(self) -> Sequence[Element]:
+        """Elements in the mesh."""
+        return _ElementsView(self.arrays)
+
+
+# Events after which cached solution data is stale. ITERATION_ENDED and
+# TIMESTEP_ENDED are not used, as the solver is paused until their callbacks
+# return; solution data is instead not cached while the solver runs.
+_SOLUTION_CHANGED_EVENTS = (
+    SolverEvent.DATA_LOADED,
+    SolverEvent.SOLUTION_INITIALIZED,
+)
+# Events which start and stop the solver.
+_CALCULATIONS_STARTED_EVENTS = (
+    SolverEvent.CALCULATIONS_STARTED,
+    SolverEvent.CALCULATIONS_RESUMED,
+)
+_CALCULATIONS_STOPPED_EVENTS = (
+    SolverEvent.CALCULATIONS_ENDED,
+    SolverEvent.CALCULATIONS_PAUSED,
+)
+# Events after which cached surface geometry is stale.
+_MESH_CHANGED_EVENTS = (SolverEvent.CASE_LOADED,)
 
 
 class LiveFieldData(BaseFieldData, FieldDataSource):
@@ -684,12 +1274,17 @@ class LiveFieldData(BaseFieldData, FieldDataSource):
         field_info,
         scheme_interpreter,
         get_zones_info: weakref.WeakMethod[Callable[[], list[ZoneInfo]]] | None = None,
+        events_manager=None,
     ):
         """__init__ method of FieldData class."""
         self._field_data = field_data
         self._field_info = field_info
         self.is_data_valid = field_data.is_data_valid
         self.scheme = scheme_interpreter
+        self._events_manager = events_manager
+        self._cache = None
+        self._cache_callback_ids = []
+        self._calculating = False
 
         self.get_zones_info = lambda: get_zones_info()()
 
@@ -721,8 +1316,104 @@ class LiveFieldData(BaseFieldData, FieldDataSource):
         )
         self._returned_data = _ReturnFieldData()
 
-    def new_batch(self):
-        """Create a new field batch."""
+    @property
+    def cache(self) -> FieldDataCache | None:
+        """Field data cache, or ``None`` if caching is disabled."""
+        return self._cache
+
+    def enable_cache(self, max_bytes: int = DEFAULT_CACHE_MAX_BYTES) -> None:
+        """Enable the client-side cache of field data.
+
+        Results of ``get_field_data`` are cached, keyed on the request and the
+        surface IDs it resolves to. Cached scalar, vector and pathlines data
+        are dropped when the solver starts or stops, or when data is loaded or
+        the solution is initialized, and they are not cached while the solver
+        runs. Surface geometry stays cached until a case is loaded. The
+        arrays returned from the cache are read-only.
+
+        Parameters
+        ----------
+        max_bytes : int, optional
+            Byte-size budget of the cache. Least-recently-used entries are
+            evicted to stay within the budget.
+        """
+        if self._cache is not None:
+            self._cache.max_bytes = max_bytes
+            return
+        self._cache = FieldDataCache(max_bytes)
+        if self._events_manager is not None:
+            for events, callback in (
+                (_SOLUTION_CHANGED_EVENTS, self._on_solution_changed),
+                (_CALCULATIONS_STARTED_EVENTS, self._on_calculations_started),
+                (_CALCULATIONS_STOPPED_EVENTS, self._on_calculations_stopped),
+                (_MESH_CHANGED_EVENTS, self._on_mesh_changed),
+            ):
+                for event in events:
+                    try:
+                        callback_id = self._events_manager.register_callback(
+                            event, callback
+                        )
+                    except ValueError:
+                        # The event is not supported in this session mode.
+                        continue
+                    self._cache_callback_ids.append(callback_id)
+
+    def disable_cache(self) -> None:
+        """Disable the client-side cache of field data and drop its entries."""
+        for callback_id in self._cache_callback_ids:
+            self._events_manager.unregister_callback(callback_id)
+        self._cache_callback_ids = []
+        self._cache = None
+        self._calculating = False
+
+    def _on_solution_changed(self, session, event_info) -> None:
+        cache = self._cache
+        if cache is not None:
+            cache.invalidate()
+
+    def _on_calculations_started(self, session, event_info) -> None:
+        self._calculating = True
+        self._on_solution_changed(session, event_info)
+
+    def _on_calculations_stopped(self, session, event_info) -> None:
+        self._calculating = False
+        self._on_solution_changed(session, event_info)
+
+    def _on_mesh_changed(self, session, event_info) -> None:
+        cache = self._cache
+        if cache is not None:
+            cache.invalidate(geometry=True)
+
+    def _extract_fields(
+        self,
+        request_type: type,
+        request_params: dict,
+        surface_ids: list[int],
+        get_fields: Callable,
+    ) -> dict:
+        """Extract fields, going through the cache if it is enabled."""
+        cache = self._cache
+        geometry = request_type is SurfaceFieldDataRequest
+        if cache is None or (self._calculating and not geometry):
+            return self._field_data.extract_fields(get_fields())
+        key = request_key(request_type.__name__, request_params, surface_ids)
+        fields = cache.get(key)
+        if fields is None:
+            generation = cache.generation
+            fields = self._field_data.extract_fields(get_fields())
+            cache.put(key, fields, geometry=geometry, generation=generation)
+        return fields
+
+    def new_batch(self, validate_surface_ids: bool = True):
+        """Create a new field batch.
+
+        Parameters
+        ----------
+        validate_surface_ids : bool, optional
+            Whether to validate surface IDs of the added requests against the
+            surfaces available in Fluent. Pass ``False`` for trusted IDs to skip
+            the surfaces info query.
+        """
         return Batch(
             self._field_data,
             self._field_info,
@@ -730,6 +1421,7 @@ class LiveFieldData(BaseFieldData, FieldDataSource):
             self._allowed_surface_names,
             self._allowed_scalar_field_names,
             self._allowed_vector_field_names,
+            validate_surface_ids=validate_surface_ids,
         )
 
     def _get_scalar_field_data(self, **kwargs):
@@ -738,13 +1430,16 @@ class LiveFieldData(BaseFieldData, FieldDataSource):
         field_name = self._allowed_scalar_field_names.valid_name(
             _to_field_name_str(kwargs.get("field_name"))
         )
-        fields = self._field_data.extract_fields(
-            self._field_data._get_scalar_field_data(
+        fields = self._extract_fields(
+            ScalarFieldDataRequest,
+            {**kwargs, "field_name": field_name},
+            surface_ids,
+            lambda: self._field_data._get_scalar_field_data(
                 field_name,
                 surface_ids,
                 kwargs.get("node_value"),
                 kwargs.get("boundary_value"),
-            )
+            ),
         )
         scalar_field_data = next(iter(fields.values()))
         return self._returned_data._scalar_data(
@@ -756,10 +1451,13 @@ class LiveFieldData(BaseFieldData, FieldDataSource):
         **kwargs,
     ) -> dict[int | str, dict[SurfaceDataType, np.ndarray | list[np.ndarray]]]:
         surface_ids = self.get_surface_ids(kwargs.get("surfaces"))
-        fields = self._field_data.extract_fields(
-            self._field_data._get_surface_data(
+        fields = self._extract_fields(
+            SurfaceFieldDataRequest,
+            kwargs,
+            surface_ids,
+            lambda: self._field_data._get_surface_data(
                 kwargs.get("data_types"), surface_ids, kwargs.get("overset_mesh")
-            )
+            ),
         )
         surface_data = next(iter(fields.values()))
         if self._deprecated_flag:
@@ -789,10 +1487,11 @@ class LiveFieldData(BaseFieldData, FieldDataSource):
         field_name = self._allowed_vector_field_names.valid_name(
             _to_field_name_str(kwargs.get("field_name"))
         )
-        for surface_id in surface_ids:
-            self.scheme.string_eval(f"(surface? {surface_id})")
-        fields = self._field_data.extract_fields(
-            self._field_data._get_vector_field_data(field_name, surface_ids)
+        fields = self._extract_fields(
+            VectorFieldDataRequest,
+            {**kwargs, "field_name": field_name},
+            surface_ids,
+            lambda: self._field_data._get_vector_field_data(field_name, surface_ids),
         )
         vector_field_data = next(iter(fields.values()))
 
@@ -817,8 +1516,15 @@ class LiveFieldData(BaseFieldData, FieldDataSource):
             additional_field_name = self._allowed_scalar_field_names.valid_name(
                 _to_field_name_str(additional_field_name)
             )
-        fields = self._field_data.extract_fields(
-            self._field_data._get_pathlines_field_data(
+        fields = self._extract_fields(
+            PathlinesFieldDataRequest,
+            {
+                **kwargs,
+                "field_name": field_name,
+                "additional_field_name": additional_field_name,
+            },
+            surface_ids,
+            lambda: self._field_data._get_pathlines_field_data(
                 field_name=field_name,
                 surfaces=surface_ids,
                 additional_field_name=additional_field_name,
@@ -833,7 +1539,7 @@ class LiveFieldData(BaseFieldData, FieldDataSource):
                 coarsen=kwargs.get("coarsen"),
                 velocity_domain=kwargs.get("velocity_domain"),
                 zones=zones,
-            )
+            ),
         )
         pathlines_data = next(iter(fields.values()))
 
@@ -856,6 +1562,25 @@ class LiveFieldData(BaseFieldData, FieldDataSource):
             flatten_connectivity=kwargs.get("flatten_connectivity"),
         )
 
+    def _get_cell_zone_info(self, zone: str | int) -> ZoneInfo:
+        for zone_info in self.get_zones_info():
+            if zone_info.name == zone or zone_info._id == zone:
+                break
+        else:
+            raise ValueError(f"Zone {zone} not found.")
+        if zone_info.zone_type == ZoneType.FACE:
+            raise NotImplementedError("Face zone mesh is not supported.")
+        return zone_info
+
+    def _get_cell_zone_infos(self, zones: list[str | int] | None) -> list[ZoneInfo]:
+        if zones is None:
+            return [
+                zone_info
+                for zone_info in self.get_zones_info()
+                if zone_info.zone_type == ZoneType.CELL
+            ]
+        return [self._get_cell_zone_info(zone) for zone in zones]
+
     def get_mesh(self, zone: str | int) -> Mesh:
         """Get mesh for a zone.
 
@@ -867,7 +1592,8 @@ class LiveFieldData(BaseFieldData, FieldDataSource):
         Returns
         -------
         Mesh
-            Mesh object containing nodes and elements.
+            Mesh object containing nodes and elements. The underlying columnar
+            arrays are available as ``Mesh.arrays``.
 
         Raises
         ------
@@ -876,88 +1602,146 @@ class LiveFieldData(BaseFieldData, FieldDataSource):
         NotImplementedError
             If a face zone is provided.
         """
-        zone_info = None
-        for zone_info in self.get_zones_info():
-            if zone_info.name == zone or zone_info._id == zone:
-                break
-        if zone_info is None:
-            raise ValueError(f"Zone {zone} not found.")
-        if zone_info.zone_type == ZoneType.FACE:
-            raise NotImplementedError("Face zone mesh is not supported.")
+        zone_info = self._get_cell_zone_info(zone)
+        return self._fetch_meshes([zone_info], max_workers=2)[zone_info.name]
+
+    def get_meshes(
+        self,
+        zones: list[str | int] | None = None,
+        max_workers: int | None = None,
+    ) -> dict[str, Mesh]:
+        """Get meshes for several cell zones concurrently.
+
+        Node and element data of all zones are requested concurrently over the
+        existing channel, and each mesh is assembled as soon as both of its
+        requests complete.
+
+        Parameters
+        ----------
+        zones : list[str | int], optional
+            Cell zone names or ids. All cell zones are used by default.
+        max_workers : int, optional
+            Maximum number of concurrent requests. Defaults to the
+            ``ThreadPoolExecutor`` default.
 
+        Returns
+        -------
+        dict[str, Mesh]
+            Mesh objects keyed by zone name, in the order of ``zones``.
+
+        Raises
+        ------
+        ValueError
+            If a zone is not found.
+        NotImplementedError
+            If a face zone is provided.
+        """
+        zone_infos = self._get_cell_zone_infos(zones)
+        return self._fetch_meshes(zone_infos, max_workers)
+
+    def _fetch_meshes(
+        self, zone_infos: list[ZoneInfo], max_workers: int | None
+    ) -> dict[str, Mesh]:
         # Mesh data is retrieved from the root domain in Fluent
-        logger.info(f"Getting nodes data for zone {zone_info._id}")
-        start_time = time.time()
         # TODO: Add precision query in AppUtilities service
         is_double_precision = self.scheme.eval("(rp-double?)")
         if is_double_precision:
-            nested_nodes = self._field_data.get_solver_mesh_nodes_double(
-                domain_id=ROOT_DOMAIN_ID, thread_id=zone_info._id
-            )
+            get_nodes = self._field_data.get_solver_mesh_nodes_double
         else:
-            nested_nodes = self._field_data.get_solver_mesh_nodes_float(
-                domain_id=ROOT_DOMAIN_ID, thread_id=zone_info._id
-            )
-        logger.info(f"Nodes data received in {time.time() - start_time} seconds")
-        logger.info(f"Getting elements for zone {zone_info._id}")
-        start_time = time.time()
-        elementss_pb = self._field_data.get_solver_mesh_elements(
-            domain_id=ROOT_DOMAIN_ID, thread_id=zone_info._id
-        )
-        logger.info(f"Elements data received in {time.time() - start_time} seconds")
-        logger.info("Constructing nodes structure in PyFluent")
+            get_nodes = self._field_data.get_solver_mesh_nodes_float
+        dtype = np.float64 if is_double_precision else np.float32
         start_time = time.time()
-        node_count = sum(len(nodes) for nodes in nested_nodes)
-        nodes = np.empty(node_count, dtype=Node)
-        node_index_by_id = {}
-        i = 0
-        for nodes_pb in nested_nodes:
-            for node_pb in nodes_pb:
-                nodes[i] = Node(_id=node_pb.id, x=node_pb.x, y=node_pb.y, z=node_pb.z)
-                node_index_by_id[node_pb.id] = i
-                i += 1
-        logger.info(
-            f"Nodes structure constructed in {time.time() - start_time} seconds"
-        )
-        logger.info("Constructing elements structure in PyFluent")
-        start_time = time.time()
-        element_count = sum(len(elements) for elements in elementss_pb)
-        elements = np.empty(element_count, dtype=Element)
-        i = 0
-        for elements_pb in elementss_pb:
-            for element_pb in elements_pb:
-                element_type = CellElementType(element_pb.element_type)
-                if element_type == CellElementType.POLYHEDRON:
-                    facets = []
-                    for facet_pb in element_pb.facets:
-                        facet = Facet(
-                            node_indices=[
-                                node_index_by_id[id]
-                                for id in getattr(
-                                    facet_pb,
-                                    "nodes",
-                                    getattr(facet_pb, "node", []),
-                                )
-                            ]
-                        )
-                        facets.append(facet)
-                    element = Element(
-                        _id=element_pb.id,
-                        element_type=element_type,
-                        facets=facets,
+        arrays_by_zone = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = {}
+            for zone_info in zone_infos:
+                logger.info(f"Getting nodes and elements for zone {zone_info._id}")
+                for kind, get_data in (
+                    ("nodes", get_nodes),
+                    ("elements", self._field_data.get_solver_mesh_elements),
+                ):
+                    future = executor.submit(
+                        get_data, domain_id=ROOT_DOMAIN_ID, thread_id=zone_info._id
                     )
-                else:
-                    element = Element(
-                        _id=element_pb.id,
-                        element_type=element_type,
-                        node_indices=[
-                            node_index_by_id[id] for id in element_pb.node_ids
-                        ],
+                    pending[future] = (zone_info, kind)
+            received = {}
+            for future in as_completed(pending):
+                zone_info, kind = pending[future]
+                zone_data = received.setdefault(zone_info._id, {})
+                zone_data[kind] = future.result()
+                if len(zone_data) == 2:
+                    logger.info(
+                        f"Mesh data for zone {zone_info._id} received in "
+                        f"{time.time() - start_time} seconds"
                     )
-                elements[i] = element
-                i += 1
-        logger.info(
-            f"Elements structure constructed in {time.time() - start_time} seconds"
-        )
-        logger.info("Returning mesh")
-        return Mesh(nodes=nodes, elements=elements)
+                    zone_data = received.pop(zone_info._id)
+                    arrays_by_zone[zone_info._id] = _build_mesh_arrays(
+                        zone_data["nodes"], zone_data["elements"], dtype
+                    )
+        logger.info(f"Meshes constructed in {time.time() - start_time} seconds")
+        return {
+            zone_info.name: Mesh.from_arrays(arrays_by_zone[zone_info._id])
+            for zone_info in zone_infos
+        }
+
+    def iter_mesh(
+        self,
+        zones: list[str | int] | None = None,
+        chunk_cells: int | None = None,
+    ) -> Iterator[tuple[ZoneInfo, MeshArrays]]:
+        """Iterate over the mesh of cell zones in array-backed chunks.
+
+        Elements are converted and yielded as they arrive from the server,
+        so that only the node arrays of the current zone and one chunk of
+        elements are held in memory at a time. Each chunk contains only the
+        nodes referenced by its elements, with connectivity indexing into
+        those nodes.
+
+        Parameters
+        ----------
+        zones : list[str | int], optional
+            Cell zone names or ids. All cell zones are used by default.
+        chunk_cells : int, optional
+            Maximum number of elements per chunk. By default, one chunk is
+            yielded per streamed server response (typically one per partition).
+
+        Yields
+        ------
+        tuple[ZoneInfo, MeshArrays]
+            Zone information and the mesh arrays of a chunk.
+
+        Raises
+        ------
+        ValueError
+            If a zone is not found or ``chunk_cells`` is not positive.
+        NotImplementedError
+            If a face zone is provided.
+        """
+        if chunk_cells is not None and chunk_cells < 1:
+            raise ValueError("'chunk_cells' must be a positive integer.")
+        zone_infos = self._get_cell_zone_infos(zones)
+        is_double_precision = self.scheme.eval("(rp-double?)")
+        if is_double_precision:
+            iter_nodes = self._field_data.iter_solver_mesh_nodes_double
+        else:
+            iter_nodes = self._field_data.iter_solver_mesh_nodes_float
+        dtype = np.float64 if is_double_precision else np.float32
+        for zone_info in zone_infos:
+            logger.info(f"Streaming mesh for zone {zone_info._id}")
+            node_ids, node_coords = _build_node_arrays(
+                iter_nodes(domain_id=ROOT_DOMAIN_ID, thread_id=zone_info._id), dtype
+            )
+            sorter = np.argsort(node_ids, kind="stable")
+            for elements_pb in _chunk_elements(
+                self._field_data.iter_solver_mesh_elements(
+                    domain_id=ROOT_DOMAIN_ID, thread_id=zone_info._id
+                ),
+                chunk_cells,
+            ):
+                yield zone_info, _assemble_mesh_arrays(
+                    node_ids,
+                    node_coords,
+                    sorter,
+                    _elements_chunk_to_arrays(elements_pb),
+                    compact=True,
+                )
@@ -725,8 +725,8 @@ class FileFieldData(FieldDataSource):
             Whether to provide the overset method. The default is ``False``.
         flatten_connectivity : bool, optional
             When ``True``, face connectivity is returned as a single flat
-            ``ndarray``. When ``False`` (default), it is returned as a list
-            of per-face vertex-index arrays.
+            ``ndarray``. When ``False`` (default), it is returned as a
+            ``FaceConnectivity`` sequence of per-face vertex-index arrays.
 
         Returns
         -------
@@ -737,8 +737,9 @@ class FileFieldData(FieldDataSource):
             - ``SurfaceData.vertices`` – ``ndarray`` of shape ``(N, 3)``
               containing vertex coordinates, or ``None`` if not requested.
             - ``SurfaceData.connectivity`` – flat ``ndarray`` (when
-              ``flatten_connectivity=True``) or list of per-face
-              ``ndarray`` objects, or ``None`` if not requested.
+              ``flatten_connectivity=True``) or ``FaceConnectivity``
+              sequence of per-face ``ndarray`` objects, or ``None`` if not
+              requested.
 
         Raises
         ------
@@ -862,26 +863,20 @@ class FileFieldData(FieldDataSource):
         )
         field_name = _to_scalar_field_name(field_name)
         surface_ids = self.get_surface_ids(surfaces=surfaces)
-        scalar_data = {}
         if len(self._file_session._data_file.get_phases()) > 1:
             if not field_name.startswith("phase-"):
                 raise InvalidMultiPhaseFieldName()
             phase_name, scalar_field_name = field_name.split(":", 1)
-            for surface_id in surface_ids:
-                scalar_data[surface_id] = {
-                    field_name: self._file_session._data_file.get_face_scalar_field_data(
-                        phase_name,
-                        scalar_field_name,
-                        surface_id,
-                    )
-                }
         else:
-            for surface_id in surface_ids:
-                scalar_data[surface_id] = {
-                    field_name: self._file_session._data_file.get_face_scalar_field_data(
-                        "phase-1", field_name, surface_id
-                    )
-                }
+            phase_name, scalar_field_name = "phase-1", field_name
+        scalar_data = {
+            surface_id: {field_name: surface_data[scalar_field_name]}
+            for surface_id, surface_data in (
+                self._file_session._data_file.get_face_field_data(
+                    phase_name, [scalar_field_name], surface_ids
+                ).items()
+            )
+        }
 
         return self._returned_data._scalar_data(
             field_name=field_name,
@@ -1039,8 +1034,8 @@ class FileFieldData(FieldDataSource):
 
               - ``.vertices`` -- ``ndarray`` of shape ``(N, 3)``, or ``None``.
               - ``.connectivity`` -- flat ``ndarray`` (when
-                ``flatten_connectivity=True``) or list of per-face
-                ``ndarray`` objects, or ``None``.
+                ``flatten_connectivity=True``) or ``FaceConnectivity``
+                sequence of per-face ``ndarray`` objects, or ``None``.
 
             - **ScalarFieldDataRequest** -- values are ``ndarray`` of scalar
               field values per face/node.
@@ -291,10 +291,16 @@ class Mesh:
         Get list of vertices of the surface.
     """
 
+    # Node coordinates of a surface are read as one contiguous slab when the
+    # slab is at most this many times larger than the surface's node count.
+    _VERTICES_SLAB_RATIO = 4
+
     def __init__(self, file_handle: h5py.File):
         """Initialize the object."""
         _check_h5_extension(file_handle.filename)
         self._file_handle: Any = file_handle
+        self._zone_topology = None
+        self._face_node_offsets = None
 
     def get_mesh_type(self) -> MeshType:
         """Returns the type of the mesh."""
@@ -306,10 +312,30 @@ class Mesh:
         except Exception:
             return MeshType.UNKNOWN
 
+    def _get_zone_topology(self) -> dict[str, npt.NDArray[Any]]:
+        """Face zone ids and face ranges, read once per file."""
+        if self._zone_topology is None:
+            zone_topology = self._file_handle["meshes"]["1"]["faces"]["zoneTopology"]
+            self._zone_topology = {
+                name: zone_topology[name][()] for name in ("id", "minId", "maxId")
+            }
+        return self._zone_topology
+
+    def _get_face_node_offsets(self) -> npt.NDArray[np.int64]:
+        """Offsets of the nodes of each face in the face nodes dataset.
+
+        This is the prefix sum of the node counts of the faces, read once per file.
+        """
+        if self._face_node_offsets is None:
+            nnodes = self._file_handle["meshes"]["1"]["faces"]["nodes"]["1"]["nnodes"]
+            offsets = np.zeros(nnodes.size + 1, dtype=np.int64)
+            np.cumsum(nnodes[()], out=offsets[1:])
+            self._face_node_offsets = offsets
+        return self._face_node_offsets
+
     def get_surface_ids(self) -> list[int]:
         """Returns list of ids of all available surfaces."""
-        id_data = self._file_handle["meshes"]["1"]["faces"]["zoneTopology"]["id"]
-        return [id_data[i] for i in range(id_data.size)]
+        return self._get_zone_topology()["id"].tolist()
 
     def get_surface_names(self) -> list[str]:
         """Returns list of names of all available surfaces."""
@@ -321,25 +347,20 @@ class Mesh:
 
     def get_surface_locs(self, surface_id: int) -> tuple[int, int]:
         """Returns range of surface locations for a particular surface."""
-        ids = self.get_surface_ids()
-        index = ids.index(surface_id)
-        min_id = self._file_handle["meshes"]["1"]["faces"]["zoneTopology"]["minId"][
-            index
-        ]
-        max_id = self._file_handle["meshes"]["1"]["faces"]["zoneTopology"]["maxId"][
-            index
-        ]
+        zone_topology = self._get_zone_topology()
+        index = self.get_surface_ids().index(surface_id)
+        min_id = zone_topology["minId"][index]
+        max_id = zone_topology["maxId"][index]
         return (int(min_id - 1), int(max_id - 1))
 
     def _get_nodes(
         self, surface_id: int
     ) -> tuple[npt.NDArray[np.uint32], npt.NDArray[np.int16]]:
         min_id, max_id = self.get_surface_locs(surface_id)
-        nnodes = self._file_handle["meshes"]["1"]["faces"]["nodes"]["1"]["nnodes"]
-        nodes = self._file_handle["meshes"]["1"]["faces"]["nodes"]["1"]["nodes"]
-        previous = np.sum(nnodes[0:min_id])
-        nnodes = nnodes[min_id : max_id + 1]
-        nodes = nodes[previous : previous + np.sum(nnodes)]
+        face_nodes = self._file_handle["meshes"]["1"]["faces"]["nodes"]["1"]
+        offsets = self._get_face_node_offsets()
+        nnodes = face_nodes["nnodes"][min_id : max_id + 1]
+        nodes = face_nodes["nodes"][offsets[min_id] : offsets[max_id + 1]]
         return (nodes, nnodes)
 
     def get_connectivity(self, surface_id: int) -> npt.NDArray[np.uint32]:
@@ -362,11 +383,15 @@ class Mesh:
         """Returns numpy array of vertices data for a particular surface."""
         nodes, nnodes = self._get_nodes(surface_id)
         nodes = np.unique(nodes)
-        nodes = np.sort(nodes)
         nodes -= 1
         vertices_dict = self._file_handle["meshes"]["1"]["nodes"]["coords"]
         vertices = vertices_dict[str(list(vertices_dict.keys())[0])]
-        return vertices[:][nodes].flatten()
+        if not len(nodes):
+            return np.zeros(0, dtype=vertices.dtype)
+        first, last = int(nodes[0]), int(nodes[-1]) + 1
+        if last - first <= self._VERTICES_SLAB_RATIO * len(nodes):
+            return vertices[first:last][nodes - first].flatten()
+        return vertices[nodes].flatten()
 
 
 class RPVarProcessor:
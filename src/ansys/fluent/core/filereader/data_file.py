@@ -77,6 +77,8 @@ class DataFile:
         Get the variables list available at face.
     get_cell_variables(phase_name)
         Get the variables list available at cell.
+    get_face_field_data(phase_name, fields, surface_ids)
+        Get the field data for face for several fields and surfaces.
     get_face_scalar_field_data(phase_name, field_name, surface_id)
         Get the scalar field data for face.
     get_face_vector_field_data(phase_name, surface_id)
@@ -91,6 +93,7 @@ class DataFile:
     ):
         """__init__ method of CaseFile class."""
         self._case_file_handle = case_file_handle
+        self._face_field_arrays = {}
         if data_file_name and project_file_name:
             raise RuntimeError(
                 "Please enter either the data file path or the project file path"
@@ -177,6 +180,73 @@ class DataFile:
         """
         return self._field_data[phase_name]["cells"]["fields"][0].decode().split(";")
 
+    def _get_face_field_arrays(
+        self, phase_name: str, field_name: str
+    ) -> list[tuple[int, int, h5py.Dataset]]:
+        """Returns the face index range and dataset of each array of a face field."""
+        key = (phase_name, field_name)
+        field_arrays = self._face_field_arrays.get(key)
+        if field_arrays is None:
+            field_data = self._field_data[phase_name]["faces"][field_name]
+            field_arrays = []
+            for field_array_name in field_data:
+                field_array = field_data[field_array_name]
+                field_arrays.append(
+                    (
+                        int(field_array.attrs["minId"][0] - 1),
+                        int(field_array.attrs["maxId"][0] - 1),
+                        field_array,
+                    )
+                )
+            self._face_field_arrays[key] = field_arrays
+        return field_arrays
+
+    def get_face_field_data(
+        self, phase_name: str, fields: list[str], surface_ids: list[int]
+    ) -> dict[int, dict[str, np.ndarray]]:
+        """Gets field data for face for several fields and surfaces.
+
+        The arrays of each field are looked up once, and the data of each surface
+        is read as a single slice of the array that holds it.
+
+        Parameters
+        ----------
+        phase_name : str
+            Name of the phase.
+
+        fields: List[str]
+            Names of the fields.
+
+        surface_ids : List[int]
+            List of surface IDs.
+
+        Returns
+        -------
+            Dictionary mapping each surface ID to a dictionary of field name to
+            numpy array of field data.
+        """
+        mesh = self._case_file_handle.get_mesh()
+        surface_locs = {
+            surface_id: mesh.get_surface_locs(surface_id) for surface_id in surface_ids
+        }
+        field_data = {surface_id: {} for surface_id in surface_ids}
+        for field in fields:
+            field_name = _to_scalar_field_name(field)
+            if ":" in field_name:
+                field_name = field_name.split(":")[1]
+            field_arrays = self._get_face_field_arrays(phase_name, field_name)
+            for surface_id, (min_id, max_id) in surface_locs.items():
+                for array_min_id, array_max_id, field_array in field_arrays:
+                    if min_id >= array_min_id and max_id <= array_max_id:
+                        values = field_array[
+                            min_id - array_min_id : max_id + 1 - array_min_id
+                        ]
+                        break
+                else:
+                    values = np.zeros(max_id + 1 - min_id)
+                field_data[surface_id][field] = values
+        return field_data
+
     def get_face_scalar_field_data(
         self, phase_name: str, field_name: str, surface_id: int
     ) -> np.ndarray:
@@ -197,18 +267,9 @@ class DataFile:
         -------
             Numpy array containing scalar field data for a particular phase, field and surface.
         """
-        field_name = _to_scalar_field_name(field_name)
-        if ":" in field_name:
-            field_name = field_name.split(":")[1]
-        min_id, max_id = self._case_file_handle.get_mesh().get_surface_locs(surface_id)
-        field_data = self._field_data[phase_name]["faces"][field_name]
-        for field_array_name in field_data:
-            field_array = field_data[field_array_name]
-            array_min_id = int(field_array.attrs["minId"][0] - 1)
-            array_max_id = int(field_array.attrs["maxId"][0] - 1)
-            if min_id >= array_min_id and max_id <= array_max_id:
-                return field_array[min_id - array_min_id : max_id + 1 - array_min_id]
-        return np.zeros(max_id + 1 - min_id)
+        return self.get_face_field_data(phase_name, [field_name], [surface_id])[
+            surface_id
+        ][field_name]
 
     def get_face_vector_field_data(
         self, phase_name: str, surface_id: int
@@ -225,17 +286,12 @@ class DataFile:
 
         Returns
         -------
-            Numpy array containing scalar field data for a particular phase, field and surface.
+            Numpy array of shape (N, 3) containing velocity vector field data for a
+            particular phase and surface.
         """
-        x_comp = self.get_face_scalar_field_data(phase_name, "SV_U", surface_id)
-        y_comp = self.get_face_scalar_field_data(phase_name, "SV_V", surface_id)
-        z_comp = self.get_face_scalar_field_data(phase_name, "SV_W", surface_id)
-
-        vector_data = np.array([])
-        for a, b, c in zip(x_comp, y_comp, z_comp):
-            vector_data = np.append(vector_data, [a, b, c])
-
-        return vector_data
+        components = ["SV_U", "SV_V", "SV_W"]
+        field_data = self.get_face_field_data(phase_name, components, [surface_id])
+        return np.column_stack([field_data[surface_id][c] for c in components])
 
 
 def _get_data_file_name_from_flprj(flprj_file):
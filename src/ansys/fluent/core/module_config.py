@@ -80,6 +80,13 @@ def _get_default_examples_path(instance: "Config") -> str:
     return str(default_path)
 
 
+def _get_default_user_data_dir() -> Path:
+    """Get the default user data directory."""
+    from ansys.fluent.core.utils import get_user_data_dir
+
+    return get_user_data_dir()
+
+
 class Config:
     """Set the global configuration variables for PyFluent."""
 
@@ -119,6 +126,20 @@ class Config:
         lambda instance: True, "DATAMODEL_USE_ATTR_CACHE"
     )
 
+    #: Whether to cache settings attributes such as ``active?`` on the client, defaults to False.
+    settings_use_attr_cache = _ConfigDescriptor["Config"](lambda instance: False)
+
+    #: Whether to cache the settings static info on disk for each Fluent build, defaults to True.
+    settings_use_static_info_cache = _ConfigDescriptor["Config"](lambda instance: True)
+
+    #: Directory where the settings static info is cached, defaults to the value of ``PYFLUENT_SETTINGS_STATIC_INFO_CACHE_DIR`` environment variable or the ``settings_static_info`` folder in the user data directory.
+    settings_static_info_cache_dir = _ConfigDescriptor["Config"](
+        lambda instance: instance._env.get(
+            "PYFLUENT_SETTINGS_STATIC_INFO_CACHE_DIR",
+            _get_default_user_data_dir() / "settings_static_info",
+        )
+    )
+
     #: Whether to stream and cache commands state, defaults to True.
     datamodel_use_nocommands_diff_state = _ConfigDescriptor["Config"](
         lambda instance: True, "DATAMODEL_USE_NOCOMMANDS_DIFF_STATE"
@@ -134,6 +155,11 @@ class Config:
         lambda instance: False, "USE_FILE_TRANSFER_SERVICE"
     )
 
+    #: Whether to offer Fluent the shared-memory transport of solution variable and field data arrays, defaults to the value of ``PYFLUENT_SHARED_MEMORY_TRANSPORT`` environment variable.
+    use_shared_memory_transport = _ConfigDescriptor["Config"](
+        lambda instance: instance._env.get("PYFLUENT_SHARED_MEMORY_TRANSPORT") == "1"
+    )
+
     #: Directory where API files are written out during codegen.
     codegen_outdir = _ConfigDescriptor["Config"](
         lambda instance: instance._env.get(
@@ -23,6 +23,7 @@
 """Abstract field data wrapper."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from typing import TYPE_CHECKING, Any
 
 import numpy as np
@@ -119,6 +120,27 @@ class AbstractFieldData(ABC):
         """
         pass
 
+    @abstractmethod
+    def iter_solver_mesh_nodes_float(
+        self, domain_id: int, thread_id: int
+    ) -> Iterator[Any]:
+        """Iterate over streamed mesh nodes -> floating point precision."""
+        pass
+
+    @abstractmethod
+    def iter_solver_mesh_nodes_double(
+        self, domain_id: int, thread_id: int
+    ) -> Iterator[Any]:
+        """Iterate over streamed mesh nodes -> double precision."""
+        pass
+
+    @abstractmethod
+    def iter_solver_mesh_elements(
+        self, domain_id: int, thread_id: int
+    ) -> Iterator[Any]:
+        """Iterate over streamed mesh elements."""
+        pass
+
     @abstractmethod
     def _get_surface_data(
         self,
@@ -222,7 +244,19 @@ class AbstractFieldData(ABC):
         """Extract fields from the chunk iterator."""
         pass
 
+    @abstractmethod
+    def iter_fields(
+        self, chunk_iterator
+    ) -> Iterator[tuple[Any, int, str, npt.NDArray[Any]]]:
+        """Iterate over fields of the chunk iterator as they are decoded."""
+        pass
+
     @abstractmethod
     def get_batched_fields(self) -> dict[Any, dict[str, npt.NDArray[Any]]]:
         """Get the batched fields from the service."""
         pass
+
+    @abstractmethod
+    def get_batched_fields_streams(self, streams: int) -> list[Any]:
+        """Get the batched fields from the service over several streams."""
+        pass
@@ -35,7 +35,7 @@ class AbstractSettings(ABC):
         pass
 
     @abstractmethod
-    def get_var(self, path: str) -> Any:
+    def get_var(self, path: str, as_array: bool = False) -> Any:
         """Get the value for the given path."""
         pass
 
@@ -24,6 +24,9 @@
 """Batch RPC service."""
 
 import logging
+import sys
+import threading
+import traceback
 from typing import TypeVar
 import weakref
 
@@ -33,6 +36,66 @@ _TBatchOps = TypeVar("_TBatchOps", bound="BatchOps")
 
 network_logger: logging.Logger = logging.getLogger("pyfluent.networking")
 
+# Write methods which are queued when coalescing writes, keyed by gRPC service.
+# They do not return any data, so the calls can return before they are executed.
+# The datamodel writes are not queued, as their responses update the datamodel
+# cache which PyMenu reads are served from.
+_COALESCED_METHODS = {
+    "ansys.api.fluent.v0.settings.Settings": {
+        "SetVar",
+        "Rename",
+        "Create",
+        "Delete",
+        "ResizeListObject",
+    },
+    "ansys.api.fluent.v1.settings.Settings": {
+        "SetState",
+        "Rename",
+        "CreateObject",
+        "DeleteObject",
+        "ResizeListObject",
+    },
+    "ansys.api.fluent.v0.DataModel": {"SetState"},
+    "ansys.api.fluent.v1.text_interface.TextInterface": {"SetState"},
+}
+
+
+def _get_call_site() -> traceback.FrameSummary | None:
+    """Get the innermost frame of the call stack outside of PyFluent and gRPC."""
+    frame = sys._getframe(1)
+    while frame is not None:
+        module_name = frame.f_globals.get("__name__", "")
+        if not module_name.startswith(("ansys.fluent.core", "grpc")):
+            return traceback.FrameSummary(
+                frame.f_code.co_filename, frame.f_lineno, frame.f_code.co_name
+            )
+        frame = frame.f_back
+    return None
+
+
+class BatchedOperationError(RuntimeError):
+    """Raised when coalesced operations fail in Fluent.
+
+    Attributes
+    ----------
+    failed_ops : list[tuple[BatchOps.Op, str]]
+        Failed operations and their execution status.
+    """
+
+    def __init__(self, failed_ops: list) -> None:
+        self.failed_ops = failed_ops
+        lines = [f"{len(failed_ops)} batched operation(s) failed:"]
+        for op, status in failed_ops:
+            lines.append(f"  {op._service_name}.{op._method}: {status}")
+            if op.call_site is not None:
+                site = op.call_site
+                lines.append(
+                    f'    queued at File "{site.filename}", line {site.lineno}'
+                )
+                if site.line:
+                    lines.append(f"      {site.line}")
+        super().__init__("\n".join(lines))
+
 
 class BatchOps:
     """Class to execute operations in batch in Fluent.
@@ -61,6 +124,21 @@ class BatchOps:
 
     will throw a ``KeyError`` as ``solver.settings.results.graphics.mesh["mesh-1"]`` attempts to
     access the ``mesh-1`` mesh object which has not been created yet.
+
+    With ``coalesce=True``, only the settings and TUI writes are queued and any other
+    call, including the streaming field data and solution variable calls, first
+    executes the queued operations, so that the operations are executed in the order
+    of the calls. The queue is also executed when it holds ``max_ops`` operations,
+    ``timeout`` seconds after its first operation was queued and on exiting the
+    ``with`` block, unless the block exits with an exception, which drops the queue.
+    Failed operations are reported through a ``BatchedOperationError`` giving the
+    Python line which queued each of them. ``session.coalesce_writes()`` enters this
+    mode.
+
+    >>> with pyfluent.BatchOps(solver, coalesce=True):
+    >>>     for name, velocity in inlet_velocities.items():
+    >>>         inlets[name].momentum.velocity_magnitude = velocity
+    >>>     inlets["inlet-1"].momentum.velocity_magnitude()  # Executes the queue first
     """
 
     def _instance():
@@ -97,20 +175,35 @@ class BatchOps:
             self._status = None
             self._result = None
             self.queued = False
+            self.call_site = None
 
         def update_result(self, status, result) -> None:
             """Update results after the batch operation is executed."""
             self._status = status
             self._result = result
 
-    def __new__(cls, session) -> _TBatchOps:
+    def __new__(
+        cls,
+        session,
+        coalesce: bool = False,
+        max_ops: int = 100,
+        timeout: float | None = 1.0,
+    ) -> _TBatchOps:
         if cls.instance() is None:
             instance = super().__new__(cls)
             instance._service = session._batch_ops_service
             instance._ops: list[BatchOps.Op] = []
             instance.batching = False
+            instance._lock = threading.RLock()
+            instance._timer = None
+            instance._timeout_error = None
             cls._instance = weakref.ref(instance)
-        return cls.instance()
+        instance = cls.instance()
+        if not instance.batching:
+            instance.coalesce = coalesce
+            instance.max_ops = max_ops
+            instance.timeout = timeout
+        return instance
 
     def __enter__(self) -> _TBatchOps:
         """Entering the with block."""
@@ -122,11 +215,66 @@ class BatchOps:
         """Exiting from the with block."""
         network_logger.debug("Executing batch operations")
         self.batching = False
-        if not exc_type:
+        if self.coalesce:
+            if exc_type:
+                self._drop_ops()
+            else:
+                self.flush()
+        elif not exc_type:
             results = self._service.execute(self._ops)
             for op, (status, result) in zip(self._ops, results):
                 op.update_result(status, result)
 
+    def flush(self) -> None:
+        """Execute the queued operations when coalescing writes.
+
+        Raises
+        ------
+        BatchedOperationError
+            If any operation failed, including the ones executed after a timeout.
+        """
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            ops, self._ops = self._ops, []
+            if ops:
+                network_logger.debug(f"Executing {len(ops)} batched operations")
+                results = self._service.execute(ops)
+                for op, (status, result) in zip(ops, results):
+                    op.update_result(status, result)
+            timeout_error, self._timeout_error = self._timeout_error, None
+        if timeout_error is not None:
+            raise timeout_error
+        failed_ops = []
+        for op in ops:
+            status = (
+                "not executed"
+                if op._status is None
+                else self._service.get_status_name(op._status)
+            )
+            if status != "STATUS_SUCCESSFUL":
+                failed_ops.append((op, status))
+        if failed_ops:
+            raise BatchedOperationError(failed_ops)
+
+    def _drop_ops(self) -> None:
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if self._ops:
+                network_logger.debug(f"Dropping {len(self._ops)} batched operations")
+            self._ops = []
+            self._timeout_error = None
+
+    def _flush_on_timeout(self) -> None:
+        try:
+            self.flush()
+        except Exception as ex:
+            # Raised by the next flush, which happens at the latest at the block exit.
+            self._timeout_error = ex
+
     def add_op(self, package: str, service: str, method: str, request) -> Op:
         """Queue a single batch operation. Only the non-getter operations will be
         queued.
@@ -148,6 +296,8 @@ class BatchOps:
             BatchOps.Op object with a queued attribute which is true if the operation
             has been queued.
         """
+        if self.coalesce:
+            return self._coalesce_op(package, service, method, request)
         op = self.__class__.Op(package, service, method, request.SerializeToString())
         op._supported, op.response_cls = self._service.get_op_metadata(
             package, service, method
@@ -160,6 +310,44 @@ class BatchOps:
             op.queued = True
         return op
 
+    def _coalesce_op(self, package: str, service: str, method: str, request) -> Op:
+        op = self.__class__.Op(package, service, method, request.SerializeToString())
+        if method in _COALESCED_METHODS.get(f"{package}.{service}", ()):
+            op._supported, op.response_cls = self._service.get_op_metadata(
+                package, service, method
+            )
+        with self._lock:
+            if not op._supported or self._timeout_error is not None:
+                # Any other call must see the effect of the queued operations.
+                self.flush()
+                return op
+            op.call_site = _get_call_site()
+            self._ops.append(op)
+            op.queued = True
+            if len(self._ops) >= self.max_ops:
+                self.flush()
+            elif self._timer is None and self.timeout is not None:
+                self._timer = threading.Timer(self.timeout, self._flush_on_timeout)
+                self._timer.daemon = True
+                self._timer.start()
+        return op
+
     def clear_ops(self) -> None:
         """Clear all queued batch operations."""
         self._ops.clear()
+
+
+def flush_coalesced_writes() -> None:
+    """Execute the queued writes before a call which is not queued by ``BatchOps``.
+
+    Streaming calls do not go through the batching of the unary calls, so they
+    call this to see the effect of the writes queued when coalescing writes.
+
+    Raises
+    ------
+    BatchedOperationError
+        If any queued operation failed.
+    """
+    batch_ops = BatchOps.instance()
+    if batch_ops is not None and batch_ops.batching and batch_ops.coalesce:
+        batch_ops.flush()
@@ -53,6 +53,7 @@ Class hierarchy
     ``is_solution_data_available``.
 """
 
+from collections.abc import Iterator, MutableSequence
 from typing import Any
 
 import numpy as np
@@ -64,6 +65,30 @@ from ansys.fluent.core.fields.field_data_interfaces import (
 from ansys.fluent.core.services.abstract_field_data import AbstractFieldData
 
 
+def _split_fields_request(request, count: int) -> list:
+    """Split a fields request into at most ``count`` requests.
+
+    The per-surface entries of the repeated request fields are distributed
+    round-robin. The other fields are copied into every request.
+    """
+    entries = [
+        (descriptor.name, entry)
+        for descriptor, value in request.ListFields()
+        if isinstance(value, MutableSequence)
+        for entry in value
+    ]
+    parts = []
+    for _ in range(min(count, len(entries)) or 1):
+        part = type(request)()
+        part.CopyFrom(request)
+        for name, _ in entries:
+            part.ClearField(name)
+        parts.append(part)
+    for index, (name, entry) in enumerate(entries):
+        getattr(parts[index % len(parts)], name).add().CopyFrom(entry)
+    return parts
+
+
 class FieldDataBase(AbstractFieldData):
     """Shared base class for FieldData and FieldDataV261 classes."""
 
@@ -153,6 +178,24 @@ class FieldDataBase(AbstractFieldData):
         """
         return self._service.get_solver_mesh_elements(domain_id, thread_id)
 
+    def iter_solver_mesh_nodes_float(
+        self, domain_id: int, thread_id: int
+    ) -> Iterator[Any]:
+        """Iterate over streamed mesh nodes -> floating point precision."""
+        return self._service.iter_solver_mesh_nodes_float(domain_id, thread_id)
+
+    def iter_solver_mesh_nodes_double(
+        self, domain_id: int, thread_id: int
+    ) -> Iterator[Any]:
+        """Iterate over streamed mesh nodes -> double precision."""
+        return self._service.iter_solver_mesh_nodes_double(domain_id, thread_id)
+
+    def iter_solver_mesh_elements(
+        self, domain_id: int, thread_id: int
+    ) -> Iterator[Any]:
+        """Iterate over streamed mesh elements."""
+        return self._service.iter_solver_mesh_elements(domain_id, thread_id)
+
     def _get_surface_data(
         self,
         data_types: list[SurfaceDataType],
@@ -303,10 +346,25 @@ class FieldDataBase(AbstractFieldData):
         """Extract fields from the chunk iterator."""
         return self._chunk_parser.extract_fields(chunk_iterator)
 
+    def iter_fields(
+        self, chunk_iterator
+    ) -> Iterator[tuple[Any, int, str, npt.NDArray[Any]]]:
+        """Iterate over fields of the chunk iterator as they are decoded."""
+        return self._chunk_parser.iter_fields(chunk_iterator)
+
     def get_batched_fields(self) -> dict[Any, dict[str, npt.NDArray[Any]]]:
         """Get the batched fields from the service."""
         return self._service.get_fields(self._service._batched_fields_request)
 
+    def get_batched_fields_streams(self, streams: int) -> list[Any]:
+        """Get the batched fields from the service over several streams."""
+        return [
+            self._service.get_fields(request)
+            for request in _split_fields_request(
+                self._service._batched_fields_request, streams
+            )
+        ]
+
 
 class FieldDataV261(FieldDataBase):
     """Class for FieldDataV261 service."""
@@ -31,7 +31,11 @@ from google.protobuf.json_format import MessageToDict
 from google.protobuf.message import DecodeError, Message
 import grpc
 
-from ansys.fluent.core.services.batch_ops import BatchOps
+from ansys.fluent.core.services.batch_ops import (
+    BatchedOperationError,
+    BatchOps,
+    flush_coalesced_writes,
+)
 
 network_logger: logging.Logger = logging.getLogger("pyfluent.networking")
 
@@ -158,6 +162,9 @@ class GrpcErrorInterceptor(grpc.UnaryUnaryClientInterceptor):
             except DecodeError:
                 pass
             ex = response.exception()
+            if isinstance(ex, BatchedOperationError):
+                # Raised by executing coalesced writes before this call.
+                raise ex
             new_ex = new_ex_cls(
                 ex.details() if isinstance(ex, grpc.RpcError) else str(ex)
             )
@@ -219,7 +226,11 @@ class BatchedFuture(grpc.Future):
         pass
 
 
-class BatchInterceptor(grpc.UnaryUnaryClientInterceptor):
+class BatchInterceptor(
+    grpc.UnaryUnaryClientInterceptor,
+    grpc.UnaryStreamClientInterceptor,
+    grpc.StreamUnaryClientInterceptor,
+):
     """Interceptor class to batch gRPC calls."""
 
     def __init__(self) -> None:
@@ -251,3 +262,23 @@ class BatchInterceptor(grpc.UnaryUnaryClientInterceptor):
     ) -> Any:
         """Intercept unary-unary call for batch operation."""
         return self._intercept_call(continuation, client_call_details, request)
+
+    def intercept_unary_stream(
+        self,
+        continuation: Any,
+        client_call_details: grpc.ClientCallDetails,
+        request: Any,
+    ) -> Any:
+        """Intercept unary-stream call, executing the coalesced writes first."""
+        flush_coalesced_writes()
+        return continuation(client_call_details, request)
+
+    def intercept_stream_unary(
+        self,
+        continuation: Any,
+        client_call_details: grpc.ClientCallDetails,
+        request_iterator: Any,
+    ) -> Any:
+        """Intercept stream-unary call, executing the coalesced writes first."""
+        flush_coalesced_writes()
+        return continuation(client_call_details, request_iterator)
@@ -51,6 +51,15 @@ Class hierarchy
 ``Settings(BaseSettings)``
     Used from Fluent 27R1 onward (v1 proto API). ``is_wildcard`` and
     ``has_wildcard`` delegate directly to the v1 Settings service.
+
+Attribute cache
+---------------
+``BaseSettings`` can keep a client-side cache of the ``active?``,
+``read-only?``, ``allowed-values``, ``min`` and ``max`` attributes, keyed by
+settings path (see :meth:`BaseSettings.enable_attrs_cache`). The same store
+holds the snapshots taken by :meth:`BaseSettings.prefetch_attrs`. It is
+cleared whenever this client changes settings and on the server events wired
+up by the session.
 """
 
 from functools import wraps
@@ -81,6 +90,39 @@ def _trace(fn):
     return _fn
 
 
+def _invalidates_attrs_cache(fn):
+    @wraps(fn)
+    def _fn(self, *args, **kwds):
+        try:
+            return fn(self, *args, **kwds)
+        finally:
+            self.invalidate_attrs_cache()
+
+    return _fn
+
+
+#: Attributes which may be served from the client-side attribute cache.
+_CACHED_ATTRS = frozenset(("active?", "read-only?", "allowed-values", "min", "max"))
+
+
+class _AttrsSnapshot:
+    """Context manager returned by ``BaseSettings.prefetch_attrs``."""
+
+    def __init__(self, settings: "BaseSettings") -> None:
+        self._settings = settings
+
+    def __enter__(self):
+        self._settings._attrs_snapshot_users += 1
+        return self
+
+    def __exit__(self, *args) -> None:
+        settings = self._settings
+        settings._attrs_snapshot_users -= 1
+        # Nested snapshots are dropped together with the outermost one.
+        if not settings._attrs_snapshot_users and not settings.attrs_cache_enabled:
+            settings.invalidate_attrs_cache()
+
+
 class BaseSettings(AbstractSettings):
     """Base class for Settings service.
     This contains the shared methods for SettingsV251, SettingsV261 and Settings classes.
@@ -89,28 +131,147 @@ class BaseSettings(AbstractSettings):
     def __init__(self, service) -> None:
         """__init__ method of BaseSettings class."""
         self.service = service
+        # Cached attributes keyed by settings path. Holds the prefetched
+        # snapshots even when the attribute cache is disabled.
+        self._attrs_cache: dict[str, dict[str, Any]] = {}
+        self._attrs_cache_enabled = False
+        self._attrs_snapshot_users = 0
+        # Bumped on every invalidation so that a get_attrs call which raced
+        # with an invalidation does not store stale values.
+        self._attrs_cache_generation = 0
+
+    @property
+    def attrs_cache_enabled(self) -> bool:
+        """Whether the client-side attribute cache is enabled."""
+        return self._attrs_cache_enabled
+
+    def enable_attrs_cache(self) -> None:
+        """Enable the client-side cache of settings attributes.
+
+        Non-recursive ``get_attrs`` calls which only request ``active?``,
+        ``read-only?``, ``allowed-values``, ``min`` or ``max`` are served from
+        the cache once the values for a path have been fetched. The whole
+        cache is cleared after any ``set_var``, ``rename``, ``create``,
+        ``delete``, ``resize_list_object`` or ``execute_cmd`` call made
+        through this object.
+        """
+        self._attrs_cache_enabled = True
+
+    def disable_attrs_cache(self) -> None:
+        """Disable the client-side cache of settings attributes."""
+        self._attrs_cache_enabled = False
+        self.invalidate_attrs_cache()
+
+    def invalidate_attrs_cache(self) -> None:
+        """Drop all the cached and prefetched settings attributes.
+
+        Call this after changing settings by other means than this object,
+        for example through TUI commands or Scheme evaluation.
+        """
+        self._attrs_cache = {}
+        self._attrs_cache_generation += 1
+
+    def _on_settings_changed(self, session, event_info) -> None:
+        """Events callback which invalidates the attribute cache."""
+        self.invalidate_attrs_cache()
+
+    def _get_cached_attrs(self, path: str, attrs: list[str]) -> dict[str, Any] | None:
+        cached = self._attrs_cache.get(path)
+        if cached is None or not all(attr in cached for attr in attrs):
+            return None
+        values = {attr: cached[attr] for attr in attrs}
+        # The server reports an inactive object whatever was requested.
+        if cached.get("active?", True) is False:
+            values["active?"] = False
+        return values
+
+    def _cache_attrs(
+        self, path: str, values: Any, generation: int, attrs=_CACHED_ATTRS
+    ) -> None:
+        if generation != self._attrs_cache_generation or not isinstance(values, dict):
+            return
+        cached = self._attrs_cache.setdefault(path, {})
+        for attr, value in values.items():
+            if attr in attrs:
+                cached[attr] = value
+
+    def prefetch_attrs(
+        self, path: str, attrs: list[str], depth: int | None = None
+    ) -> "_AttrsSnapshot":
+        """Fetch attributes of the object at a path and of its descendants.
+
+        The attributes are retrieved with a single ``get_attrs`` call, which
+        is recursive unless ``depth`` is ``0``, and later non-recursive
+        ``get_attrs`` calls for them are served from the snapshot until the
+        cache is next invalidated. A recursive call fetches the whole subtree
+        whatever ``depth`` is, so only pass a nonzero ``depth`` for objects
+        whose subtree is known to be small.
+
+        Parameters
+        ----------
+        path : str
+            Path of the object.
+        attrs : list[str]
+            Attribute names to retrieve.
+        depth : int, optional
+            Number of levels of descendants to keep in the snapshot. All levels
+            are kept by default.
+
+        Returns
+        -------
+        _AttrsSnapshot
+            Context manager which drops the snapshot on exit unless the
+            attribute cache is enabled.
+        """
+        requested = frozenset(attrs)
+        generation = self._attrs_cache_generation
+        if depth == 0:
+            if self._get_cached_attrs(path, attrs) is None:
+                values = self.service.get_attrs(path, attrs, False)
+                self._cache_attrs(path, values, generation, requested)
+            return _AttrsSnapshot(self)
+        response = self.service.get_attrs(path, attrs, True)
+        pending = [(path, response, 0)]
+        while pending:
+            node_path, node, level = pending.pop()
+            if not isinstance(node, dict):
+                continue
+            self._cache_attrs(node_path, node.get("attrs"), generation, requested)
+            if depth is None or level < depth:
+                for name, child in (node.get("group_children") or {}).items():
+                    child_path = f"{node_path}/{name}" if node_path else name
+                    pending.append((child_path, child, level + 1))
+        return _AttrsSnapshot(self)
 
     @_trace
+    @_invalidates_attrs_cache
     def set_var(self, path: str, value: Any) -> None:
         """Set the value for the given path."""
         self.service.set_var(path, value)
 
     @_trace
-    def get_var(self, path: str) -> Any:
-        """Get the value for the given path."""
-        return self.service.get_var(path)
+    def get_var(self, path: str, as_array: bool = False) -> Any:
+        """Get the value for the given path.
+
+        Long homogeneous numeric lists are returned as NumPy arrays if
+        ``as_array`` is ``True``.
+        """
+        return self.service.get_var(path, as_array)
 
     @_trace
+    @_invalidates_attrs_cache
     def rename(self, path: str, new: str, old: str) -> None:
         """Rename the object at the given path."""
         self.service.rename(path, new, old)
 
     @_trace
+    @_invalidates_attrs_cache
     def create(self, path: str, name: str) -> None:
         """Create a named object child for the given path."""
         self.service.create(path, name)
 
     @_trace
+    @_invalidates_attrs_cache
     def delete(self, path: str, name: str) -> None:
         """Delete the object with the given name at the given path."""
         self.service.delete(path, name)
@@ -126,6 +287,7 @@ class BaseSettings(AbstractSettings):
         return self.service.get_list_size(path)
 
     @_trace
+    @_invalidates_attrs_cache
     def resize_list_object(self, path: str, size: int) -> None:
         """Resize a list object."""
         self.service.resize_list_object(path, size)
@@ -142,6 +304,7 @@ class BaseSettings(AbstractSettings):
         return self.service.get_static_info()
 
     @_trace
+    @_invalidates_attrs_cache
     def execute_cmd(self, path: str, command: str, **kwds) -> Any:
         """Execute a given command with the provided keyword arguments."""
         return self.service.execute_cmd(path, command, **kwds)
@@ -154,7 +317,15 @@ class BaseSettings(AbstractSettings):
     @_trace
     def get_attrs(self, path: str, attrs: list[str], recursive: bool = False) -> Any:
         """Return values of given attributes."""
-        return self.service.get_attrs(path, attrs, recursive)
+        if recursive or not (self._attrs_cache or self._attrs_cache_enabled):
+            return self.service.get_attrs(path, attrs, recursive)
+        values = self._get_cached_attrs(path, attrs)
+        if values is None:
+            generation = self._attrs_cache_generation
+            values = self.service.get_attrs(path, attrs, recursive)
+            if self._attrs_cache_enabled and _CACHED_ATTRS.issuperset(attrs):
+                self._cache_attrs(path, values, generation)
+        return values
 
 
 class SettingsV251(BaseSettings):
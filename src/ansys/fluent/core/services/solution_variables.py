@@ -226,6 +226,30 @@ class _AllowedSvarNames:
             )
         return variable_name
 
+    def valid_names(
+        self,
+        variable_names: list[str],
+        zone_names: list[str],
+        domain_name: str | None = "mixture",
+    ) -> list[str]:
+        """Get valid solution variable names, fetching the allowed names once.
+
+        Raises
+        ------
+        InvalidSolutionVariableNameError
+            If any of the given solution variable names is invalid.
+        """
+        allowed_values = self(zone_names=zone_names, domain_name=domain_name)
+        valid_names = []
+        for variable_name in variable_names:
+            variable_name = _to_field_name_str(variable_name)
+            if variable_name not in allowed_values:
+                raise InvalidSolutionVariableNameError(
+                    variable_name=variable_name, allowed_values=allowed_values
+                )
+            valid_names.append(variable_name)
+        return valid_names
+
 
 class _AllowedZoneNames(_AllowedNames):
     def __init__(self, solution_variable_info: SolutionVariableInfo):
@@ -409,6 +433,69 @@ class SolutionVariableData(AbstractSolutionVariableData):
             svar_data,
         )
 
+    def get_data_many(
+        self,
+        variable_names: list[str],
+        zone_names: list[str],
+        domain_names: list[str] | None = None,
+        out: dict[str, dict[str, dict[str, np.ndarray]]] | None = None,
+    ) -> dict[str, dict[str, Data]]:
+        """Get the data of several SVARs in several domains on zones.
+
+        The SVARs are requested together, and their data can be written into
+        the arrays of a previous call to avoid allocating them again.
+
+        Parameters
+        ----------
+        variable_names : List[str]
+            Names of the solution variables.
+        zone_names: List[str]
+            Zone names list for solution variable data.
+        domain_names : List[str], optional
+            Domain names. The default is ``["mixture"]``.
+        out : dict[str, dict[str, dict[str, np.ndarray]]], optional
+            Arrays by domain name, solution variable name and zone name into
+            which the data is written. The arrays of the missing entries are
+            allocated and added, so the same dictionary can be passed again to
+            reuse them.
+
+        Returns
+        -------
+        dict[str, dict[str, Data]]
+            Objects containing SVAR data by domain name and solution variable name.
+
+        Examples
+        --------
+        >>> out = {}
+        >>> for _ in range(iterations):
+        >>>     solver_session.settings.solution.run_calculation.iterate(iter_count=1)
+        >>>     svars = solution_variable_data.get_data_many(
+        >>>         variable_names=["SV_U", "SV_V", "SV_P", "SV_T"],
+        >>>         zone_names=["fluid"],
+        >>>         out=out,
+        >>>     )
+        >>>     fluid_pressure = svars["mixture"]["SV_P"]["fluid"]
+        """
+        if domain_names is None:
+            domain_names = ["mixture"]
+        self._update_solution_variable_info()
+        zone_id_name_map, svar_data = self._service.get_data_many(
+            variable_names=variable_names,
+            zone_names=zone_names,
+            domain_names=domain_names,
+            allowed_solution_variable_names=self._allowed_solution_variable_names,
+            allowed_domain_names=self._allowed_domain_names,
+            allowed_zone_names=self._allowed_zone_names,
+            out=out,
+        )
+        return {
+            domain_name: {
+                variable_name: Data(domain_name, zone_id_name_map, zone_data)
+                for variable_name, zone_data in variables_data.items()
+            }
+            for domain_name, variables_data in svar_data.items()
+        }
+
     def set_data(
         self,
         variable_name: str,
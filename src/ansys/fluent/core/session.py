@@ -39,10 +39,12 @@ from ansys.fluent.core.fields.field_data_streaming import FieldDataStreaming
 from ansys.fluent.core.fields.live_field_data import LiveFieldData, ZoneInfo, _FieldInfo
 from ansys.fluent.core.fluent_connection import FluentConnection
 from ansys.fluent.core.journaling import Journal
+from ansys.fluent.core.module_config import config
 from ansys.fluent.core.pyfluent_warnings import (
     PyFluentDeprecationWarning,
     PyFluentUserWarning,
 )
+from ansys.fluent.core.services.batch_ops import BatchOps
 from ansys.fluent.core.services.scheme_interpreter import SchemeInterpreter
 from ansys.fluent.core.streaming_services.datamodel_event_streaming import (
     DatamodelEvents as DatamodelEventsV0,
@@ -53,6 +55,9 @@ from ansys.fluent.core.streaming_services.datamodel_event_streaming_v1 import (
 from ansys.fluent.core.streaming_services.events_streaming import (
     EventsManager as EventsManagerV0,
 )
+from ansys.fluent.core.streaming_services.events_streaming import (
+    SolverEvent,
+)
 from ansys.fluent.core.streaming_services.events_streaming_v1 import EventsManager
 from ansys.fluent.core.streaming_services.transcript_streaming import (
     Transcript as TranscriptV0,
@@ -73,6 +78,16 @@ logger = logging.getLogger("pyfluent.general")
 
 __all__ = ("BaseSession",)
 
+# Server events after which cached settings attributes may be stale. Events
+# which are not supported in a session mode are skipped.
+_SETTINGS_CHANGED_EVENTS = (
+    SolverEvent.CASE_LOADED,
+    SolverEvent.DATA_LOADED,
+    SolverEvent.SETTINGS_CLEARED,
+    SolverEvent.SOLUTION_INITIALIZED,
+    SolverEvent.CALCULATIONS_ENDED,
+)
+
 
 def _parse_server_info_file(file_name: str):
     """Parse server info file.
@@ -235,6 +250,8 @@ class BaseSession:
         )
 
         self._settings_service = fluent_connection._service_factory.settings
+        if config.settings_use_attr_cache:
+            self._enable_settings_attrs_cache()
 
         self._health_check = fluent_connection._health_check
         self.connection_properties = fluent_connection.connection_properties
@@ -248,6 +265,20 @@ class BaseSession:
         for obj in filter(None, (self._datamodel_events, self.transcript, self.events)):
             self._fluent_connection.register_finalizer_cb(obj.stop)
 
+    def _enable_settings_attrs_cache(self) -> None:
+        """Cache settings attributes, invalidating them on server events."""
+        self._settings_service.enable_attrs_cache()
+        if self.events is None:
+            return
+        for event in _SETTINGS_CHANGED_EVENTS:
+            try:
+                self.events.register_callback(
+                    event, self._settings_service._on_settings_changed
+                )
+            except ValueError:
+                # The event is not supported in this session mode.
+                continue
+
     @deprecate_function(version="v0.38.0", new_func="is_active")
     def is_server_healthy(self) -> bool:
         """Whether the current session is healthy (i.e. the server is 'SERVING')."""
@@ -349,6 +380,32 @@ class BaseSession:
         """Executes a tui command."""
         self.scheme.eval(f"(ti-menu-load-string {json.dumps(command)})")
 
+    def coalesce_writes(
+        self, max_ops: int = 100, timeout: float | None = 1.0
+    ) -> BatchOps:
+        """Coalesce the settings and TUI writes into batched calls.
+
+        Parameters
+        ----------
+        max_ops : int, optional
+            Number of queued writes which triggers their execution, by default 100.
+        timeout : float, optional
+            Seconds after which the queued writes are executed, by default 1.0.
+            ``None`` disables the timeout.
+
+        Returns
+        -------
+        BatchOps
+            Context manager which executes the remaining writes on exit.
+
+        Examples
+        --------
+        >>> with solver.coalesce_writes():
+        >>>     for name in inlet_names:
+        >>>         solver.settings.setup.boundary_conditions.velocity_inlet[name].momentum.velocity_magnitude = 2.0
+        """
+        return BatchOps(self, coalesce=True, max_ops=max_ops, timeout=timeout)
+
     def get_fluent_version(self) -> FluentVersion:
         """Gets and returns the fluent version."""
         return FluentVersion(self.scheme.version)
@@ -515,7 +572,11 @@ class Fields:
         field_data = fluent_connection._service_factory.field_data
         self._field_info = _FieldInfo(field_data)
         self.field_data = LiveFieldData(
-            field_data, self._field_info, _session.scheme, get_zones_info
+            field_data,
+            self._field_info,
+            _session.scheme,
+            get_zones_info,
+            events_manager=_session.events,
         )
         field_data_streaming = fluent_connection._service_factory.field_data_streaming
         self.field_data_streaming = FieldDataStreaming(
@@ -25,6 +25,7 @@
 
 import logging
 
+from ansys.fluent.core.data_model_cache import _clear_dict_parameter_paths
 from ansys.fluent.core.module_config import config
 from ansys.fluent.core.pyfluent_warnings import warning_for_fluent_dev_version
 from ansys.fluent.core.services.text_interface import TUIMenu
@@ -65,6 +66,8 @@ def _make_datamodel_module(session, module_name):
             f"{module_name}_{session._version}",
             config.codegen_outdir / f"datamodel_{session._version}" / f"{file_name}.py",
         )
+        # The lookup tables of the dict-typed parameters may be stale.
+        _clear_dict_parameter_paths(session._version, module_name)
         warning_for_fluent_dev_version(session._version)
         return module.Root(session._se_service, module_name, [])
     except (ImportError, FileNotFoundError) as ex:
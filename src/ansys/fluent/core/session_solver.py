@@ -204,9 +204,16 @@ class Solver(BaseSession, settings_root.root if TYPE_CHECKING else object):
                 interrupt=Solver._interrupt,
                 file_transfer_service=self._file_transfer_service,
                 scheme_eval=self.scheme.eval,
+                build_id=self._get_build_id,
             )
         return cast("settings_root.root", self._settings)
 
+    def _get_build_id(self) -> str | None:
+        try:
+            return self.application_runtime.get_build_info().build_id
+        except RuntimeError:  # GrpcErrorInterceptor raises RuntimeError on failure
+            return None
+
     def _get_zones_info(self) -> list[ZoneInfo]:
         zones_info = []
         # v0 ThreadType: CELL_THREAD=0, FACE_THREAD=1
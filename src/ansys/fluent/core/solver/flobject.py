@@ -48,10 +48,13 @@ from enum import Enum
 import fnmatch
 from functools import total_ordering
 import hashlib
+import importlib
+import json
 import keyword
 import logging
 import os
 import os.path
+from pathlib import Path
 import pickle
 import string
 import sys
@@ -70,6 +73,9 @@ from typing import (
 )
 import warnings
 import weakref
+import zlib
+
+import numpy as np
 
 from ansys.fluent.core.pyfluent_warnings import (
     PyFluentDeprecationWarning,
@@ -255,6 +261,22 @@ def _raise_if_exposure_hidden(name, child_classes, obj) -> None:
         )
 
 
+def _has_leaf_children(obj) -> bool:
+    """Whether ``obj`` is a group whose children are all leaves.
+
+    The attributes of such a group and of its children can be prefetched with
+    a recursive ``get_attrs`` call without fetching a large subtree.
+    """
+    if not isinstance(obj, Group):
+        return False
+    child_classes = type(obj)._child_classes
+    for name in obj.child_names:
+        child_cls = child_classes.get(name)
+        if child_cls is None or issubclass(child_cls, (Group, NamedObject, ListObject)):
+            return False
+    return True
+
+
 class _InlineConstants:
     is_active = "active?"
     is_read_only = "read-only?"
@@ -266,6 +288,12 @@ class _InlineConstants:
     file_purpose = "file-purpose"
 
 
+_prefetched_attrs = (
+    _InlineConstants.is_active,
+    _InlineConstants.is_read_only,
+    _InlineConstants.allowed_values,
+)
+
 # Type hints
 RealType = NewType("real", float | str)  # constant or expression
 RealListType = list[RealType]
@@ -614,6 +642,35 @@ class Base:
         """
         return self.flproxy.get_attrs(self.path, attrs, recursive)
 
+    def prefetch(self, attrs: list[str] | None = None, depth: int | None = None):
+        """Fetch attributes of the object and of its descendants in one call.
+
+        Later ``is_active()`` and ``get_attr()`` calls on the object and its
+        descendants are served from the fetched snapshot until this client
+        next changes settings.
+
+        Parameters
+        ----------
+        attrs : list[str], optional
+            Attribute names to retrieve. By default, ``"active?"``,
+            ``"read-only?"`` and ``"allowed-values"`` are retrieved.
+        depth : int, optional
+            Number of levels of descendants to keep. All levels are kept by
+            default.
+
+        Returns
+        -------
+        contextlib.AbstractContextManager
+            Context manager which drops the snapshot on exit, unless the
+            attribute cache of the settings service is enabled.
+        """
+        if attrs is None:
+            attrs = list(_prefetched_attrs)
+            if FluentVersion(self._version) < FluentVersion.v252:
+                # Needed by _is_deprecated for these versions.
+                attrs.append("deprecated-version")
+        return self.flproxy.prefetch_attrs(self.path, attrs, depth)
+
     def get_attr(
         self,
         attr: str,
@@ -752,14 +809,17 @@ class Base:
                 return not _is_deprecated(v)
             return True
 
-        return _get_completer_info(
-            obj=self,
-            base_class=Base,
-            prefix=prefix,
-            excluded=excluded,
-            filter_function=filter_deprecated,
-            type_name_map=_type_name_map,
-        )
+        # Activity and deprecation of the children are looked up per member.
+        # They are prefetched only when that does not fetch a whole subtree.
+        with self.prefetch(depth=1) if _has_leaf_children(self) else nullcontext():
+            return _get_completer_info(
+                obj=self,
+                base_class=Base,
+                prefix=prefix,
+                excluded=excluded,
+                filter_function=filter_deprecated,
+                type_name_map=_type_name_map,
+            )
 
 
 StateT = TypeVar("StateT")
@@ -1011,6 +1071,52 @@ def _create_child(cls, name, parent: weakref.CallableProxyType, alias_path=None)
     return cls(name, parent)
 
 
+def _states_equal(a, b) -> bool:
+    """Whether two settings states are equal, ignoring the sequence types."""
+    if isinstance(a, collections.abc.Mapping) or isinstance(b, collections.abc.Mapping):
+        return a == b
+    sequence_types = (collections.abc.Sequence, np.ndarray)
+    if (
+        isinstance(a, sequence_types)
+        and isinstance(b, sequence_types)
+        and not isinstance(a, str)
+        and not isinstance(b, str)
+    ):
+        return len(a) == len(b) and all(_states_equal(x, y) for x, y in zip(a, b))
+    return bool(a == b)
+
+
+def _iter_state_changes(cls, current, state, path: str = ""):
+    """Yield ``(path, keys, current, new)`` for each leaf of ``state`` that
+    differs from ``current``.
+
+    ``path`` is relative to the object of class ``cls`` and ``keys`` are the
+    Python keys leading to the leaf. Leaves of ``state`` set to ``None`` are
+    skipped and lists are compared as a whole.
+    """
+    if state is None:
+        return
+    if not (
+        isinstance(state, collections.abc.Mapping)
+        and isinstance(current, collections.abc.Mapping)
+    ):
+        if not _states_equal(current, state):
+            yield path, (), current, state
+        return
+    named = cls is not None and issubclass(cls, NamedObject)
+    for key, value in state.items():
+        if named:
+            child_cls = cls.child_object_type
+            child_path = f'{path}["{key}"]'
+        else:
+            child_cls = getattr(cls, "_child_classes", {}).get(key)
+            child_path = f"{path}.{key}" if path else key
+        for leaf_path, keys, old, new in _iter_state_changes(
+            child_cls, current.get(key), value, child_path
+        ):
+            yield leaf_path, (key,) + keys, old, new
+
+
 class SettingsBase(Base, Generic[StateT]):
     """Base class for settings objects.
 
@@ -1100,6 +1206,74 @@ class SettingsBase(Base, Generic[StateT]):
         out = sys.stdout if out is None else out
         self._print_state_helper(self.get_state(), out, indent_factor=indent_factor)
 
+    def diff(
+        self, state: StateT, current: StateT | None = None
+    ) -> dict[str, tuple[Any, Any]]:
+        """Compare a state with the state of the object.
+
+        Parameters
+        ----------
+        state : StateT
+            State to compare. Keys which are missing or set to ``None`` are
+            ignored, and lists are compared as a whole.
+        current : StateT, optional
+            Previously fetched state of the object to compare with. By
+            default, the state is fetched with ``get_state()``.
+
+        Returns
+        -------
+        dict[str, tuple[Any, Any]]
+            Current and new values of each leaf which differs, keyed by its
+            path relative to the object.
+        """
+        if current is None:
+            current = self.get_state()
+        return {
+            path: (old, new)
+            for path, _, old, new in _iter_state_changes(type(self), current, state)
+        }
+
+    def apply_diff(
+        self, state: StateT, current: StateT | None = None
+    ) -> dict[str, tuple[Any, Any]]:
+        """Set only the parts of a state which differ from the state of the object.
+
+        The changed leaves are sent as a single partial state, so that applying
+        a mostly unchanged state transfers only the changes.
+
+        Parameters
+        ----------
+        state : StateT
+            State to apply. Keys which are missing or set to ``None`` are left
+            unchanged.
+        current : StateT, optional
+            Previously fetched state of the object to compare with. By
+            default, the state is fetched with ``get_state()``.
+
+        Returns
+        -------
+        dict[str, tuple[Any, Any]]
+            Applied changes, as returned by :meth:`diff`.
+        """
+        if current is None:
+            current = self.get_state()
+        changes = {}
+        delta = None
+        for path, keys, old, new in _iter_state_changes(type(self), current, state):
+            changes[path] = (old, new)
+            if not keys:
+                delta = new
+                break
+            if delta is None:
+                delta = {}
+            node = delta
+            for key in keys[:-1]:
+                node = node.setdefault(key, {})
+            node[keys[-1]] = new
+        if changes:
+            self.set_state(delta)
+        return changes
+
     def state_with_units(self) -> StateT:
         """Get the state of the object with units where available."""
         state = self.get_state()
@@ -1215,7 +1389,15 @@ class Boolean(SettingsBase[bool], Property):
     _state_type = bool
 
 
-class RealList(SettingsBase[RealListType], RealNumerical):
+class _NumericalList:
+    """Provides NumPy access to the state of a numerical list setting."""
+
+    def as_array(self) -> np.ndarray:
+        """Get the state of the object as a NumPy array."""
+        return np.asarray(self.flproxy.get_var(self.path, as_array=True))
+
+
+class RealList(SettingsBase[RealListType], RealNumerical, _NumericalList):
     """A ``RealList`` object representing a real list setting."""
 
     base_set_state = SettingsBase[RealListType].set_state
@@ -1224,7 +1406,7 @@ class RealList(SettingsBase[RealListType], RealNumerical):
     _state_type = RealListType
 
 
-class IntegerList(SettingsBase[IntListType], Numerical):
+class IntegerList(SettingsBase[IntListType], Numerical, _NumericalList):
     """An ``Integer`` object representing an integer list setting."""
 
     _state_type = IntListType
@@ -1281,15 +1463,12 @@ class Group(SettingsBase[DictStateType]):
     def __init__(self, name: str | None = None, parent=None):
         """__init__ of Group class."""
         super().__init__(name, parent)
-        for child in self.child_names:
-            cls = self.__class__._child_classes[child]
-            self._setattr(child, _create_child(cls, None, self))
-        for cmd in self.command_names:
-            cls = self.__class__._child_classes[cmd]
-            self._setattr(cmd, _create_child(cls, None, self))
-        for query in self.query_names:
-            cls = self.__class__._child_classes[query]
-            self._setattr(query, _create_child(cls, None, self))
+        cls_dict = self.__class__.__dict__
+        for child in self.child_names + self.command_names + self.query_names:
+            # Classes built at runtime create their children on first access.
+            if not isinstance(cls_dict.get(child), _LazyChild):
+                cls = self.__class__._child_classes[child]
+                self._setattr(child, _create_child(cls, None, self))
 
     def __call__(self, *args, **kwargs):
         if kwargs:
@@ -2490,25 +2669,263 @@ class _FlStringConstant:
 _bases_by_class = {}
 
 
+class _LazyChildClasses(collections.abc.Mapping):
+    """Child classes of a class built at runtime, constructed on first access."""
+
+    def __init__(self, parent_cls, version):
+        self._parent_cls = parent_cls
+        self._version = version
+        self._names = []
+        self._pending = {}
+        self._classes = {}
+
+    def add_pending(self, attr_name, name, info, cls_names):
+        """Register a child class to be constructed on first access."""
+        self._names.append(attr_name)
+        self._pending[attr_name] = (name, info, cls_names)
+
+    def __setitem__(self, attr_name, cls):
+        if attr_name not in self:
+            self._names.append(attr_name)
+        self._classes[attr_name] = cls
+
+    def __getitem__(self, attr_name):
+        cls = self._classes.get(attr_name)
+        if cls is None:
+            name, info, cls_names = self._pending[attr_name]
+            cls = _build_cls(name, info, cls_names, self._parent_cls, self._version)
+            cls = self._classes.setdefault(attr_name, cls)
+        return cls
+
+    def __contains__(self, attr_name):
+        return attr_name in self._classes or attr_name in self._pending
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __len__(self):
+        return len(self._names)
+
+
+class _LazyChild:
+    """Create a child object of a group on first access."""
+
+    def __init__(self, name):
+        self._name = name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        cls = owner._child_classes[self._name]
+        child = _create_child(cls, None, instance)
+        instance._setattr(self._name, child)
+        return child
+
+
+def _import_settings_class(package: str, module: str, name: str):
+    """Import a class from a submodule of a generated settings package."""
+    return getattr(importlib.import_module(f"{package}.{module}"), name)
+
+
+class _ImportedChildClasses(collections.abc.Mapping):
+    """Child classes of a generated class, imported on first access."""
+
+    def __init__(self, package: str, locations: dict[str, tuple[str, str]]):
+        self._package = package
+        self._locations = locations
+        self._classes = {}
+
+    def __getitem__(self, attr_name):
+        cls = self._classes.get(attr_name)
+        if cls is None:
+            module, name = self._locations[attr_name]
+            cls = self._classes[attr_name] = _import_settings_class(
+                self._package, module, name
+            )
+        return cls
+
+    def __contains__(self, attr_name):
+        return attr_name in self._locations
+
+    def __iter__(self):
+        return iter(self._locations)
+
+    def __len__(self):
+        return len(self._locations)
+
+
+def _is_user_creatable(info, version) -> bool:
+    return (
+        version == "222"
+        or info.get("user-creatable?", False)
+        or info.get("user_creatable", False)
+    )
+
+
+def _get_cls_name(name, info, version=None, parent_taboo=None):
+    """Get the class name, the attribute name in the parent and the class bases."""
+    if name == "":
+        pname = "root"
+    else:
+        pname = to_python_name(name)
+    obj_type = info["type"]
+    base = _baseTypes.get(obj_type)
+    if obj_type == "command" and name in ["create", "rename", "delete", "resize"]:
+        base = CommandWithPositionalArgs
+    if base is None:
+        settings_logger.warning(
+            f"Unable to find base class for '{name}' "
+            f"(type = '{obj_type}'). "
+            f"Falling back to String."
+        )
+        base = String
+
+    include_child_named_objects = info.get(
+        "include-child-named-objects?", False
+    ) or info.get("include_child_named_objects", False)
+    user_creatable = _is_user_creatable(info, version)
+
+    bases = (base,)
+    if include_child_named_objects:
+        bases = bases + (_ChildNamedObjectAccessorMixin,)
+    if obj_type == "named-object" and user_creatable:
+        if version < "251":
+            bases = bases + (CreatableNamedObjectMixinOld,)
+        else:
+            bases = bases + (CreatableNamedObjectMixin,)
+    elif obj_type == "named-object":
+        bases = bases + (_NonCreatableNamedObjectMixin,)
+    elif info.get("has-allowed-values"):
+        bases += (AllowedValuesMixin,)
+    elif info.get("file_purpose") == "input":
+        bases += (_InputFile,)
+    elif info.get("file_purpose") == "output":
+        bases += (_OutputFile,)
+    elif info.get("file_purpose") == "inout":
+        bases += (_InOutFile,)
+
+    original_pname = pname
+    i = 1
+    if parent_taboo:
+        while pname in parent_taboo:
+            pname = f"{original_pname}_{i}"
+            i += 1
+    parent_attr_name = pname
+    if info.get("file_purpose"):  # not generalizing for performance
+        while pname in _bases_by_class and _bases_by_class[pname] != bases:
+            pname = f"{original_pname}_{i}"
+            i += 1
+        _bases_by_class[pname] = bases
+    if parent_taboo:
+        parent_taboo.add(pname)
+    return pname, parent_attr_name, bases
+
+
 # pylint: disable=missing-raises-doc
 def get_cls(name, info, parent=None, version=None, parent_taboo=None):
-    """Create a class for the object identified by "path"."""
+    """Create a class for the object identified by "path".
+
+    Children, commands and queries of the class are constructed lazily, the
+    first time they are accessed. The class names of the whole tree are
+    resolved beforehand, so that they do not depend on the access order.
+    """
+    cls_names = _resolve_cls_names(name, info, version, parent_taboo)
+    return (
+        _build_cls(name, info, cls_names, parent, version),
+        cls_names.parent_attr_name,
+    )
+
+
+class _ClsNames:
+    """Names and bases of a class and of its child classes."""
+
+    __slots__ = ("pname", "parent_attr_name", "bases", "children", "object_type")
+
+    def __init__(self, pname, parent_attr_name, bases):
+        self.pname = pname
+        self.parent_attr_name = parent_attr_name
+        self.bases = bases
+        self.children = {}
+        self.object_type = None
+
+
+_CLS_NAME_SECTIONS = ("children", "commands", "queries", "arguments")
+_dir_by_bases = {}
+
+
+def _get_taboo(bases, version):
+    """Get the names that the child classes of a class cannot take."""
+    names = _dir_by_bases.get(bases)
+    if names is None:
+        dct = dict.fromkeys(
+            [
+                "fluent_name",
+                "_version",
+                "_child_classes",
+                "exposure_level",
+                "_deprecated_version",
+            ]
+        )
+        names = _dir_by_bases[bases] = frozenset(dir(type("_", bases, dct)))
+    taboo = set(names)
+    if version and version >= "261":
+        taboo -= {"list", "list_properties"}
+    taboo |= set(
+        [
+            "child_names",
+            "command_names",
+            "query_names",
+            "argument_names",
+            "child_object_type",
+        ]
+    )
+    return taboo
+
+
+# pylint: disable=missing-raises-doc
+def _resolve_cls_names(name, info, version=None, parent_taboo=None):
+    """Resolve the class names of a tree in the order of a depth-first build."""
     try:
-        if name == "":
-            pname = "root"
-        else:
-            pname = to_python_name(name)
-        obj_type = info["type"]
-        base = _baseTypes.get(obj_type)
-        if obj_type == "command" and name in ["create", "rename", "delete", "resize"]:
-            base = CommandWithPositionalArgs
-        if base is None:
-            settings_logger.warning(
-                f"Unable to find base class for '{name}' "
-                f"(type = '{obj_type}'). "
-                f"Falling back to String."
+        cls_names = _ClsNames(
+            *_get_cls_name(name, info, version=version, parent_taboo=parent_taboo)
+        )
+    except Exception:
+        print(f"Unable to construct class for '{name}'")
+        raise
+    commands = info.get("commands")
+    if commands:
+        commands.pop("exit", None)
+        if not _is_user_creatable(info, version):
+            commands.pop("create", None)
+    taboo = None
+    for section in _CLS_NAME_SECTIONS:
+        info_dict = info.get(section)
+        if not info_dict:
+            continue
+        if taboo is None:
+            taboo = _get_taboo(cls_names.bases, version)
+        if section == "children":
+            taboo.add("child_names")
+        children = cls_names.children[section] = {}
+        for cname, cinfo in info_dict.items():
+            cnames = children[cname] = _resolve_cls_names(
+                cname, cinfo, version, parent_taboo=taboo
             )
-            base = String
+            taboo.add(cnames.pname)
+    object_type = info.get("object-type", False) or info.get("object_type", False)
+    if object_type:
+        cls_names.object_type = _resolve_cls_names(
+            "child-object-type", object_type, version
+        )
+    return cls_names
+
+
+# pylint: disable=missing-raises-doc
+def _build_cls(name, info, cls_names, parent, version):
+    try:
+        pname = cls_names.pname
+        bases = cls_names.bases
+        obj_type = info["type"]
         dct = {"fluent_name": name, "_version": version}
         helpinfo = info.get("help")
         if helpinfo:
@@ -2524,52 +2941,8 @@ def get_cls(name, info, parent=None, version=None, parent_taboo=None):
                 else:
                     dct["__doc__"] = f"'{pname.strip('_')}' child."
 
-        include_child_named_objects = info.get(
-            "include-child-named-objects?", False
-        ) or info.get("include_child_named_objects", False)
-        user_creatable = info.get("user-creatable?", False) or info.get(
-            "user_creatable", False
-        )
-
-        if version == "222":
-            user_creatable = True
-
-        bases = (base,)
-        if include_child_named_objects:
-            bases = bases + (_ChildNamedObjectAccessorMixin,)
-        if obj_type == "named-object" and user_creatable:
-            if version < "251":
-                bases = bases + (CreatableNamedObjectMixinOld,)
-            else:
-                bases = bases + (CreatableNamedObjectMixin,)
-        elif obj_type == "named-object":
-            bases = bases + (_NonCreatableNamedObjectMixin,)
-        elif info.get("has-allowed-values"):
-            bases += (AllowedValuesMixin,)
-        elif info.get("file_purpose") == "input":
-            bases += (_InputFile,)
-        elif info.get("file_purpose") == "output":
-            bases += (_OutputFile,)
-        elif info.get("file_purpose") == "inout":
-            bases += (_InOutFile,)
-
-        original_pname = pname
-        i = 1
-        if parent_taboo:
-            while pname in parent_taboo:
-                pname = f"{original_pname}_{i}"
-                i += 1
-        parent_attr_name = pname
-        if info.get("file_purpose"):  # not generalizing for performance
-            while pname in _bases_by_class and _bases_by_class[pname] != bases:
-                pname = f"{original_pname}_{i}"
-                i += 1
-            _bases_by_class[pname] = bases
-        if parent_taboo:
-            parent_taboo.add(pname)
-
-        dct["_child_classes"] = {}
         cls = type(pname, bases, dct)
+        cls._child_classes = _LazyChildClasses(cls, version)
 
         # If root, set it explicitly to stable
         if parent is None:
@@ -2589,69 +2962,53 @@ def get_cls(name, info, parent=None, version=None, parent_taboo=None):
         else:
             cls._deprecated_version = ""
 
-        taboo = set(dir(cls))
-        if version and version >= "261":
-            taboo -= {"list", "list_properties"}
-        taboo |= set(
-            [
-                "child_names",
-                "command_names",
-                "query_names",
-                "argument_names",
-                "child_object_type",
-            ]
-        )
-
         doc = ""
+        # Group children are also created lazily on the group objects.
+        lazy_children = issubclass(cls, Group)
 
-        def _process_cls_names(info_dict, names, write_doc=False):
-            nonlocal taboo
+        def _process_cls_names(section, names, write_doc=False):
             nonlocal cls
 
-            for cname, cinfo in info_dict.items():
-                ccls, parent_attr_name = get_cls(
-                    cname, cinfo, cls, version=version, parent_taboo=taboo
-                )
-
+            for cname, cinfo in info[section].items():
+                cnames = cls_names.children[section][cname]
+                parent_attr_name = cnames.parent_attr_name
                 if write_doc:
+                    ccls = _build_cls(cname, cinfo, cnames, cls, version)
                     nonlocal doc
                     th = ccls._state_type
                     th = th.__name__ if hasattr(th, "__name__") else str(th)
                     doc += f"    {ccls.__name__} : {th}\n"
                     doc += f"        {ccls.__doc__}\n"
+                    cls._child_classes[parent_attr_name] = ccls
+                else:
+                    cls._child_classes.add_pending(
+                        parent_attr_name, cname, cinfo, cnames
+                    )
+                    if lazy_children:
+                        setattr(cls, parent_attr_name, _LazyChild(parent_attr_name))
 
                 names.append(parent_attr_name)
-                taboo.add(ccls.__name__)
-                cls._child_classes[parent_attr_name] = ccls
 
-        children = info.get("children")
-        if children:
-            taboo.add("child_names")
+        if info.get("children"):
             cls.child_names = []
-            _process_cls_names(children, cls.child_names)
+            _process_cls_names("children", cls.child_names)
 
-        commands = info.get("commands")
-        if commands:
-            commands.pop("exit", None)
-        if commands and not user_creatable:
-            commands.pop("create", None)
-        if commands:
+        # The commands that are not exposed are removed by _resolve_cls_names().
+        if info.get("commands"):
             cls.command_names = []
-            _process_cls_names(commands, cls.command_names)
+            _process_cls_names("commands", cls.command_names)
 
-        queries = info.get("queries")
-        if queries:
+        if info.get("queries"):
             cls.query_names = []
-            _process_cls_names(queries, cls.query_names)
+            _process_cls_names("queries", cls.query_names)
 
-        arguments = info.get("arguments")
-        if arguments:
+        if info.get("arguments"):
             doc = cls.__doc__
             doc += "\n\n"
             doc += "Parameters\n"
             doc += "----------\n"
             cls.argument_names = []
-            _process_cls_names(arguments, cls.argument_names, write_doc=True)
+            _process_cls_names("arguments", cls.argument_names, write_doc=True)
             cls.__doc__ = doc
 
         if version < "242":
@@ -2663,8 +3020,8 @@ def get_cls(name, info, parent=None, version=None, parent_taboo=None):
 
         object_type = info.get("object-type", False) or info.get("object_type", False)
         if object_type:
-            cls.child_object_type, _ = get_cls(
-                "child-object-type", object_type, cls, version=version
+            cls.child_object_type = _build_cls(
+                "child-object-type", object_type, cls_names.object_type, cls, version
             )
             cls.child_object_type.get_name = lambda self: self._name
 
@@ -2709,7 +3066,7 @@ def get_cls(name, info, parent=None, version=None, parent_taboo=None):
             f"'{parent.fluent_name if parent else None}'"
         )
         raise
-    return cls, parent_attr_name
+    return cls
 
 
 def _gethash(obj_info):
@@ -2718,12 +3075,92 @@ def _gethash(obj_info):
     return dhash.hexdigest()
 
 
+_STATIC_INFO_CACHE_HEADER = b"pyfluent-settings-static-info-json\n"
+
+
+def _get_static_info_cache_file(version: str, build_id: str) -> Path:
+    from ansys.fluent.core.module_config import config
+
+    key = hashlib.sha256(f"{version}/{build_id}".encode()).hexdigest()[:16]
+    return Path(config.settings_static_info_cache_dir) / f"settings_{version}_{key}.bin"
+
+
+def _load_cached_static_info(cache_file: Path) -> dict[str, Any] | None:
+    """Load the static info saved by ``_save_cached_static_info``.
+
+    ``None`` is returned if the file is missing or corrupt.
+    """
+    try:
+        data = cache_file.read_bytes()
+    except OSError:
+        return None
+    start = len(_STATIC_INFO_CACHE_HEADER)
+    if not data.startswith(_STATIC_INFO_CACHE_HEADER):
+        return None
+    obj_hash = data[start : start + 64].decode("ascii", errors="replace")
+    try:
+        serialized = zlib.decompress(data[start + 64 :])
+    except zlib.error:
+        return None
+    if hashlib.sha256(serialized).hexdigest() != obj_hash:
+        return None
+    try:
+        obj_info = json.loads(serialized)
+    except ValueError:
+        return None
+    return obj_info if isinstance(obj_info, dict) else None
+
+
+def _save_cached_static_info(cache_file: Path, obj_info: dict[str, Any]) -> None:
+    """Save the static info as a header, the SHA-256 of its JSON and the compressed JSON.
+
+    The static info only holds dictionaries, lists and scalars, so JSON stores
+    it exactly without allowing a tampered cache file to run code on load.
+    """
+    serialized = json.dumps(obj_info, separators=(",", ":")).encode("utf-8")
+    data = (
+        _STATIC_INFO_CACHE_HEADER
+        + hashlib.sha256(serialized).hexdigest().encode("ascii")
+        + zlib.compress(serialized)
+    )
+    tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file.write_bytes(data)
+        os.replace(tmp_file, cache_file)
+    except OSError as ex:
+        settings_logger.warning(f"Unable to cache the settings static info: {ex}")
+        with suppress(OSError):
+            tmp_file.unlink()
+
+
+def _get_static_info(
+    flproxy, version: str, build_id: str | Callable[[], str | None] | None
+) -> dict[str, Any]:
+    """Get the static info, from the on-disk cache for known Fluent builds."""
+    from ansys.fluent.core.module_config import config
+
+    if not config.settings_use_static_info_cache:
+        return flproxy.get_static_info()
+    if callable(build_id):
+        build_id = build_id()
+    if not build_id:
+        return flproxy.get_static_info()
+    cache_file = _get_static_info_cache_file(version, build_id)
+    obj_info = _load_cached_static_info(cache_file)
+    if obj_info is None:
+        obj_info = flproxy.get_static_info()
+        _save_cached_static_info(cache_file, obj_info)
+    return obj_info
+
+
 def get_root(
     flproxy,
     version: str = "",
     interrupt: Any | None = None,
     file_transfer_service: Any | None = None,
     scheme_eval=None,
+    build_id: str | Callable[[], str | None] | None = None,
 ) -> Group:
     """Get the root settings object.
 
@@ -2739,6 +3176,11 @@ def get_root(
         A gRPC service to execute Scheme code.
     version : str
         Fluent version.
+    build_id : str | Callable[[], str | None], optional
+        Fluent build id, or a callable returning it. If provided and the
+        generated settings module is missing, the static info is cached on
+        disk for this build. A callable is only called when the on-disk cache
+        is looked up.
 
     Returns
     -------
@@ -2759,12 +3201,15 @@ def get_root(
         try:
             settings = _load_module(
                 f"settings_{version}",
-                config.codegen_outdir / "solver" / f"settings_{version}.py",
+                config.codegen_outdir
+                / "solver"
+                / f"settings_{version}"
+                / "__init__.py",
             )
             root_cls = settings.root
             warning_for_fluent_dev_version(version)
         except FileNotFoundError:
-            obj_info = flproxy.get_static_info()
+            obj_info = _get_static_info(flproxy, version, build_id)
             root_cls, _ = get_cls("", obj_info, version=version)
     root = root_cls()
     root.set_flproxy(flproxy)
@@ -37,6 +37,256 @@ def _pandas():
     return pandas
 
 
+def _grow(array: np.ndarray, length: int) -> np.ndarray:
+    """Get ``array`` with room for ``length`` items along its last axis.
+
+    The capacity is doubled until it fits and the items are copied over.
+    """
+    capacity = array.shape[-1]
+    if length <= capacity:
+        return array
+    while capacity < length:
+        capacity = max(2 * capacity, 1)
+    grown = np.empty((*array.shape[:-1], capacity), dtype=array.dtype)
+    grown[..., : array.shape[-1]] = array
+    return grown
+
+
+class _BucketLevel:
+    """Aggregates of the monitor values over the buckets of a level.
+
+    For each complete bucket, the level holds the sample indices of the minimum
+    and maximum values of each monitor and the sum of its values.
+    """
+
+    __slots__ = ("argmin", "argmax", "sums", "size")
+
+    def __init__(self, monitor_count: int):
+        """__init__ method of _BucketLevel class."""
+        self.argmin = np.empty((monitor_count, 0), dtype=np.int64)
+        self.argmax = np.empty((monitor_count, 0), dtype=np.int64)
+        self.sums = np.empty((monitor_count, 0), dtype=np.float64)
+        self.size = 0
+
+    def append(self, argmin: np.ndarray, argmax: np.ndarray, sums: np.ndarray):
+        """Append the aggregates of buckets."""
+        size = self.size + argmin.shape[1]
+        self.argmin = _grow(self.argmin, size)
+        self.argmax = _grow(self.argmax, size)
+        self.sums = _grow(self.sums, size)
+        self.argmin[:, self.size : size] = argmin
+        self.argmax[:, self.size : size] = argmax
+        self.sums[:, self.size : size] = sums
+        self.size = size
+
+
+class _MonitorSetData:
+    """Columnar store of the samples of a monitor set.
+
+    The x values and the values of each monitor are held in preallocated NumPy
+    columns whose capacity doubles when they are full, so that appending a
+    sample takes amortized constant time. Samples are never modified once
+    appended, so slices of the columns are returned as read-only views.
+
+    For downsampling and rolling windows, level ``k`` of a pyramid aggregates
+    the aligned buckets of ``2**k`` samples, each level being computed from
+    the one below. Only the samples appended since the previous query are
+    folded into the pyramid, so a query costs time in the number of points it
+    returns rather than in the length of the history.
+
+    Parameters
+    ----------
+    monitors : list[str]
+        Names of the monitors of the set.
+    """
+
+    _initial_capacity = 1024
+
+    def __init__(self, monitors: list[str]):
+        """__init__ method of _MonitorSetData class."""
+        self.monitors = monitors
+        self._size = 0
+        self._xvalues = np.empty(self._initial_capacity, dtype=np.int64)
+        self._yvalues = np.empty(
+            (len(monitors), self._initial_capacity), dtype=np.float64
+        )
+        self._levels: list[_BucketLevel] = []
+        self._levels_size = 0
+        self._data_frame = None
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, xvalue: int, yvalues: list[float]) -> None:
+        """Append a sample."""
+        self._xvalues = _grow(self._xvalues, self._size + 1)
+        self._yvalues = _grow(self._yvalues, self._size + 1)
+        self._xvalues[self._size] = xvalue
+        self._yvalues[:, self._size] = yvalues
+        self._size += 1
+
+    def get_data(
+        self,
+        start_index: int = 0,
+        end_index: int | None = None,
+        max_points: int | None = None,
+        window: int | None = None,
+    ) -> tuple[np.ndarray, dict[str, np.ndarray]]:
+        """Get the x values and the monitor values.
+
+        Without aggregation, they are read-only views of the columns.
+        """
+        if max_points is not None and max_points < 2:
+            raise ValueError(f"max_points must be at least 2, got {max_points}.")
+        if window is not None and window < 1:
+            raise ValueError(f"window must be at least 1, got {window}.")
+        start, stop, _ = slice(start_index, end_index).indices(self._size)
+        stop = max(start, stop)
+        if window is None and (max_points is None or stop - start <= max_points):
+            xvalues = self._xvalues[start:stop]
+            xvalues.flags.writeable = False
+            yvalues = {}
+            for monitor, column in zip(self.monitors, self._yvalues):
+                yvalues[monitor] = column[start:stop]
+                yvalues[monitor].flags.writeable = False
+            return xvalues, yvalues
+        self._update_levels()
+        if window is None:
+            xvalues, yvalues = self._get_min_max(start, stop, max_points)
+        else:
+            if max_points is None or stop - start <= max_points:
+                indices = np.arange(start, stop)
+            else:
+                # The rolling mean is smooth, so sampling it evenly is enough.
+                indices = np.unique(
+                    np.linspace(start, stop - 1, max_points).round().astype(np.int64)
+                )
+            window_starts = np.maximum(indices + 1 - window, 0)
+            xvalues = self._xvalues[indices]
+            yvalues = self._get_sums(window_starts, indices + 1) / (
+                indices + 1 - window_starts
+            )
+        return xvalues, dict(zip(self.monitors, yvalues))
+
+    def to_dataframe(self):
+        """Get the samples as a DataFrame indexed by the x values.
+
+        The DataFrame is built on demand and reused until a sample is appended.
+        """
+        if self._data_frame is None or len(self._data_frame) != self._size:
+            xvalues, yvalues = self.get_data()
+            self._data_frame = _pandas().DataFrame(
+                {monitor: column.copy() for monitor, column in yvalues.items()},
+                index=_pandas().Index(xvalues.copy(), name="xvalues"),
+                columns=self.monitors,
+            )
+        return self._data_frame
+
+    def _update_levels(self) -> None:
+        """Fold the samples appended since the previous update into the pyramid."""
+        size = self._size
+        k = 1
+        while size >> k:
+            if len(self._levels) < k:
+                self._levels.append(_BucketLevel(len(self.monitors)))
+            start, stop = self._levels_size >> k, size >> k
+            if stop > start:
+                if k == 1:
+                    indices = np.broadcast_to(
+                        np.arange(2 * start, 2 * stop),
+                        (len(self.monitors), 2 * (stop - start)),
+                    )
+                    argmin = argmax = indices
+                    sums = self._yvalues[:, 2 * start : 2 * stop]
+                else:
+                    level = self._levels[k - 2]
+                    argmin = level.argmin[:, 2 * start : 2 * stop]
+                    argmax = level.argmax[:, 2 * start : 2 * stop]
+                    sums = level.sums[:, 2 * start : 2 * stop]
+                self._levels[k - 1].append(
+                    self._pick(argmin, np.less),
+                    self._pick(argmax, np.greater),
+                    sums[:, 0::2] + sums[:, 1::2],
+                )
+            k += 1
+        self._levels_size = size
+
+    def _pick(self, indices: np.ndarray, compare) -> np.ndarray:
+        """Pick the index of the extremum of each pair of consecutive buckets."""
+        first, second = indices[:, 0::2], indices[:, 1::2]
+        return np.where(
+            compare(
+                np.take_along_axis(self._yvalues, second, axis=1),
+                np.take_along_axis(self._yvalues, first, axis=1),
+            ),
+            second,
+            first,
+        )
+
+    def _get_min_max(
+        self, start: int, stop: int, max_points: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Downsample the samples by the minimum and maximum over buckets.
+
+        Each bucket gives two points, at its first and last x values, with its
+        minimum and maximum in the order in which they occur.
+        """
+        k = 1
+        while ((stop - 1) >> k) - (start >> k) + 1 > max_points // 2:
+            k += 1
+        first_bucket = start >> k
+        bucket_count = ((stop - 1) >> k) - first_bucket + 1
+        bounds = (np.arange(bucket_count + 1) + first_bucket) << k
+        bounds[0], bounds[-1] = start, stop
+        argmin = np.empty((len(self.monitors), bucket_count), dtype=np.int64)
+        argmax = np.empty((len(self.monitors), bucket_count), dtype=np.int64)
+        if bucket_count > 2:
+            level = self._levels[k - 1]
+            interior = slice(first_bucket + 1, first_bucket + bucket_count - 1)
+            argmin[:, 1:-1] = level.argmin[:, interior]
+            argmax[:, 1:-1] = level.argmax[:, interior]
+        # The first and last buckets may be partial or not complete yet.
+        for i in {0, bucket_count - 1}:
+            bucket = self._yvalues[:, bounds[i] : bounds[i + 1]]
+            argmin[:, i] = bounds[i] + bucket.argmin(axis=1)
+            argmax[:, i] = bounds[i] + bucket.argmax(axis=1)
+        xvalues = np.empty(2 * bucket_count, dtype=self._xvalues.dtype)
+        xvalues[0::2] = self._xvalues[bounds[:-1]]
+        xvalues[1::2] = self._xvalues[bounds[1:] - 1]
+        first = np.minimum(argmin, argmax)
+        last = np.maximum(argmin, argmax)
+        yvalues = np.empty((len(self.monitors), 2 * bucket_count))
+        yvalues[:, 0::2] = np.take_along_axis(self._yvalues, first, axis=1)
+        yvalues[:, 1::2] = np.take_along_axis(self._yvalues, last, axis=1)
+        return xvalues, yvalues
+
+    def _get_sums(self, starts: np.ndarray, stops: np.ndarray) -> np.ndarray:
+        """Sum the monitor values over sample ranges.
+
+        Each range is split into aligned buckets of the pyramid, taking the
+        largest ones first. Adding up bucket sums avoids the cancellation of
+        differences of running sums, as monitor values such as residuals span
+        many orders of magnitude.
+        """
+        sums = np.zeros((len(self.monitors), len(starts)))
+        starts = starts.copy()
+        levels = [self._yvalues] + [level.sums for level in self._levels]
+        # Ascend while the ranges start with a bucket which is not aligned to
+        # the next level, then descend over the aligned buckets of the rest.
+        for ascending, ks in (
+            (True, range(len(levels))),
+            (False, reversed(range(len(levels)))),
+        ):
+            for k in ks:
+                take = starts + (1 << k) <= stops
+                if ascending:
+                    take &= (starts & (1 << k)) != 0
+                if take.any():
+                    sums[:, take] += levels[k][:, starts[take] >> k]
+                    starts[take] += 1 << k
+        return sums
+
+
 class MonitorsManager(StreamingService):
     """Manages monitors (Fluent residuals and report definitions monitors).
 
@@ -58,7 +308,7 @@ class MonitorsManager(StreamingService):
         self._session_id: str = session_id
         self._lock_refresh: threading.Lock = threading.Lock()
         self._monitors_info = None
-        self._data_frames = {}
+        self._monitor_sets: dict[str, _MonitorSetData] = {}
 
     def get_monitor_set_names(self) -> list[str]:
         """Get monitor set names.
@@ -73,7 +323,7 @@ class MonitorsManager(StreamingService):
             List of all monitor set names.
         """
         with self._lock:
-            return list(self._data_frames)
+            return list(self._monitor_sets)
 
     def get_monitor_set_prop(self, monitor_set_name: str, property: str) -> str:
         """Get monitor set property.
@@ -112,14 +362,35 @@ class MonitorsManager(StreamingService):
             is empty. Otherwise, it returns the plot object, depending on the ``plotting.backend``.
         """
         with self._lock:
-            df = self._data_frames[monitor_set_name]["df"]
-            return None if df.empty else df.plot(*args, **kwargs)
+            monitor_set = self._monitor_sets[monitor_set_name]
+            if not len(monitor_set) or not monitor_set.monitors:
+                return None
+            df = monitor_set.to_dataframe()
+        return df.plot(*args, **kwargs)
+
+    def to_dataframe(self, monitor_set_name: str):
+        """Get monitor set data as a DataFrame.
+
+        Parameters
+        ----------
+        monitor_set_name : str
+            Name of the monitor set.
+
+        Returns
+        -------
+        pandas.DataFrame
+            DataFrame of the monitor values indexed by the x-axis values.
+        """
+        with self._lock:
+            return self._monitor_sets[monitor_set_name].to_dataframe()
 
     def get_monitor_set_data(
         self,
         monitor_set_name,
         start_index: int = 0,
         end_index: int | None = None,
+        max_points: int | None = None,
+        window: int | None = None,
     ) -> tuple[np.ndarray, dict[str, np.ndarray]]:
         """Get monitor set data.
 
@@ -131,27 +402,34 @@ class MonitorsManager(StreamingService):
             Start index to provide data.
         end_index: int, optional
             End index to provide data.
+        max_points: int, optional
+            Maximum number of points to provide. When there are more samples,
+            they are downsampled by buckets, each bucket giving its minimum
+            and maximum values at its first and last x-axis values.
+        window: int, optional
+            Number of samples of a rolling window. When provided, the mean of
+            the values over the window ending at each sample is provided.
 
         Returns
         -------
         Tuple[np.array, Dict[str, np.array]]
             Tuple containing two elements: a numpy array of x-axis values and a dictionary
             associating monitor names of type ``str`` to numpy arrays of y-axis values.
+            Without downsampling or rolling window, the arrays are read-only views of
+            the data streamed so far.
+
+        Raises
+        ------
+        ValueError
+            If ``max_points`` is less than 2 or ``window`` is less than 1.
         """
         with self._lock:
-            df_data = self._data_frames[monitor_set_name]
-            try:
-                df = df_data["df"].iloc[start_index:end_index]
-            except IndexError:
-                return (np.array([]), {})
-            return (
-                (np.array([]), {})
-                if df.empty
-                else (
-                    df.index.to_numpy(),
-                    {column: df[column].to_numpy() for column in df.columns},
-                )
+            xvalues, yvalues = self._monitor_sets[monitor_set_name].get_data(
+                start_index, end_index, max_points, window
             )
+            if not len(xvalues) or not yvalues:
+                return (np.array([]), {})
+            return (xvalues, yvalues)
 
     def refresh(self, session, event_info) -> None:
         """Refresh plots on-initialized and data-read events.
@@ -178,26 +456,17 @@ class MonitorsManager(StreamingService):
         self._update_dataframe()
 
     def _populate_dataframes(self, data_received, *args, **kwargs):
-        for _, df_data in self._data_frames.items():
-            df = df_data["df"]
-            monitors = df_data["monitors"]
-            monitor_data = []
-            for monitor_name in monitors:
-                if monitor_name not in data_received:
-                    monitor_data = []
-                    break
-                monitor_data.append(data_received[monitor_name])
-
-            if monitor_data:
-                new_df = _pandas().DataFrame([monitor_data], columns=monitors)
-                new_df.set_index("xvalues", inplace=True)
-                if df.empty:
-                    df_data["df"] = new_df
-                else:
-                    df_data["df"] = _pandas().concat([df, new_df])
-                for callback_map in self._service_callbacks.values():
-                    callback, args, kwargs = callback_map
-                    callback(*args, **kwargs)
+        for monitor_set in self._monitor_sets.values():
+            try:
+                monitor_data = [
+                    data_received[monitor_name] for monitor_name in monitor_set.monitors
+                ]
+            except KeyError:
+                continue
+            monitor_set.append(data_received["xvalues"], monitor_data)
+            for callback_map in self._service_callbacks.values():
+                callback, args, kwargs = callback_map
+                callback(*args, **kwargs)
 
     def _process_streaming(self, id, stream_begin_method, started_evt, *args, **kwargs):
         """Begin monitors streaming."""
@@ -224,13 +493,10 @@ class MonitorsManager(StreamingService):
     def _update_dataframe(self):
         with self._lock:
             self._monitors_info = self._streaming_service.get_monitors_info()
-            self._data_frames = {}
+            self._monitor_sets = {}
             for monitor_set_name, monitor_set_info in self._monitors_info.items():
                 if "monitors" not in monitor_set_info:
                     continue
-                self._data_frames[monitor_set_name] = {}
-                monitors_name = list(monitor_set_info["monitors"]) + ["xvalues"]
-                df = _pandas().DataFrame([], columns=monitors_name)
-                df.set_index("xvalues", inplace=True)
-                self._data_frames[monitor_set_name]["df"] = df
-                self._data_frames[monitor_set_name]["monitors"] = monitors_name
+                self._monitor_sets[monitor_set_name] = _MonitorSetData(
+                    list(monitor_set_info["monitors"])
+                )
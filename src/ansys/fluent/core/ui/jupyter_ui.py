@@ -25,6 +25,7 @@
 
 from ansys.fluent.core.ui.utils import (
     _parse_path,
+    _prefetch_properties,
     _render_widget_from_props_generic,
     _safe_get_properties,
 )
@@ -155,6 +156,11 @@ def _command_ui(func, props):
 
 def settings_ui(obj, indent=0):
     """Render settings objects into ui graphics."""
+    with _prefetch_properties(obj, depth=1):
+        return _settings_ui(obj, indent)
+
+
+def _settings_ui(obj, indent):
     props = _safe_get_properties(obj)
     if isinstance(obj, (Group, NamedObject)):
         if isinstance(obj, Group):
@@ -43,6 +43,7 @@ from ansys.fluent.core.solver.flobject import (
 )
 from ansys.fluent.core.ui.utils import (
     _parse_path,
+    _prefetch_properties,
     _render_widget_from_props_generic,
     _safe_get_properties,
 )
@@ -248,6 +249,11 @@ def _lazy_section(
 
 def _settings_view(obj, indent: int = 0) -> pn.viewable.Viewable:
     """Recursively build the view for a settings object (lazy children)."""
+    with _prefetch_properties(obj, depth=1):
+        return _settings_view_impl(obj, indent)
+
+
+def _settings_view_impl(obj, indent: int) -> pn.viewable.Viewable:
     props = _safe_get_properties(obj)
 
     if isinstance(obj, (Group, NamedObject)):
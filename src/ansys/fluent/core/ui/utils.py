@@ -23,6 +23,8 @@
 
 """Utilities methods for ui rendering."""
 
+import contextlib
+
 from ansys.fluent.core.solver.flobject import (
     BaseCommand,
     Boolean,
@@ -33,6 +35,7 @@ from ansys.fluent.core.solver.flobject import (
     RealList,
     String,
     StringList,
+    _has_leaf_children,
 )
 from ansys.fluent.core.ui import in_jupyter
 
@@ -60,8 +63,27 @@ def _parse_path(settings_obj):
     return path_str[:-1]
 
 
+def _prefetch_properties(settings_obj, depth: int = 0):
+    """Fetch the attributes read by ``_safe_get_properties`` in one call.
+
+    Pass ``depth=1`` to also cover the children of ``settings_obj``, which is
+    only done when they are all leaves, so that no large subtree is fetched.
+    """
+    if depth and not _has_leaf_children(settings_obj):
+        depth = 0
+    try:
+        return settings_obj.prefetch(depth=depth)
+    except RuntimeError:
+        return contextlib.nullcontext()
+
+
 def _safe_get_properties(settings_obj):
     """Fetch potentially expensive properties once."""
+    with _prefetch_properties(settings_obj):
+        return _get_properties(settings_obj)
+
+
+def _get_properties(settings_obj):
     props = {}
     try:
         props["is_active"] = settings_obj.is_active()
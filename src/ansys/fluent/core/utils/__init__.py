@@ -39,6 +39,9 @@ __all__ = (
 
 def load_module(module_name, file_path):
     """Load a module from a file path."""
+    # Submodules of a previously loaded package of the same name are stale.
+    for name in [name for name in sys.modules if name.startswith(f"{module_name}.")]:
+        del sys.modules[name]
     spec = importlib.util.spec_from_file_location(module_name, file_path)
     module = importlib.util.module_from_spec(spec)
     sys.modules[module_name] = module
@@ -21,10 +21,15 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import time
+from types import SimpleNamespace
+
 import pytest
 
 import ansys.fluent.core as pyfluent
 from ansys.fluent.core import examples
+from ansys.fluent.core.services.batch_ops import BatchedOperationError, BatchOps
+from ansys.fluent.core.services.interceptors import BatchInterceptor
 
 
 def test_batch_ops_create_mesh():
@@ -58,3 +63,140 @@ def test_batch_ops_create_mesh_and_access_fails(new_solver_session):
             mesh["mesh-1"] = {}
             mesh["mesh-1"].surfaces_list = ["wall-elbow"]
     assert not solver.scheme.eval("(case-valid?)")
+
+
+class _FakeBatchOpsService:
+    def __init__(self, failing_methods=()):
+        self.executed = []
+        self.failing_methods = failing_methods
+
+    def get_op_metadata(self, package, service, method):
+        return True, None
+
+    def get_status_name(self, status):
+        return status
+
+    def execute(self, ops):
+        self.executed.append([op._method for op in ops])
+        return [
+            (
+                (
+                    "STATUS_FAILED"
+                    if op._method in self.failing_methods
+                    else "STATUS_SUCCESSFUL"
+                ),
+                None,
+            )
+            for op in ops
+        ]
+
+
+class _FakeRequest:
+    def SerializeToString(self):
+        return b""
+
+
+def _add_op(batch_ops, method):
+    return batch_ops.add_op(
+        "ansys.api.fluent.v0.settings", "Settings", method, _FakeRequest()
+    )
+
+
+def test_coalesce_writes_flushes_before_reads_and_on_exit(monkeypatch):
+    monkeypatch.setattr(BatchOps, "_instance", staticmethod(lambda: None))
+    service = _FakeBatchOpsService()
+    session = SimpleNamespace(_batch_ops_service=service)
+    with BatchOps(session, coalesce=True, max_ops=3, timeout=None) as batch_ops:
+        assert _add_op(batch_ops, "SetVar").queued
+        assert _add_op(batch_ops, "Rename").queued
+        assert service.executed == []
+        assert not _add_op(batch_ops, "GetVar").queued
+        assert service.executed == [["SetVar", "Rename"]]
+        for _ in range(3):
+            _add_op(batch_ops, "SetVar")
+        assert service.executed[-1] == ["SetVar"] * 3
+        _add_op(batch_ops, "Delete")
+        assert len(service.executed) == 2
+    assert service.executed[-1] == ["Delete"]
+    assert not batch_ops.batching
+
+
+def test_coalesce_writes_flushes_on_timeout(monkeypatch):
+    monkeypatch.setattr(BatchOps, "_instance", staticmethod(lambda: None))
+    service = _FakeBatchOpsService()
+    session = SimpleNamespace(_batch_ops_service=service)
+    with BatchOps(session, coalesce=True, timeout=0.01) as batch_ops:
+        _add_op(batch_ops, "SetVar")
+        deadline = time.time() + 5
+        while not service.executed and time.time() < deadline:
+            time.sleep(0.01)
+        assert service.executed == [["SetVar"]]
+    assert service.executed == [["SetVar"]]
+
+
+def test_coalesce_writes_reports_failed_call_site(monkeypatch):
+    monkeypatch.setattr(BatchOps, "_instance", staticmethod(lambda: None))
+    service = _FakeBatchOpsService(failing_methods=("Rename",))
+    session = SimpleNamespace(_batch_ops_service=service)
+    with pytest.raises(BatchedOperationError) as ex:
+        with BatchOps(session, coalesce=True, timeout=None) as batch_ops:
+            _add_op(batch_ops, "SetVar")
+            _add_op(batch_ops, "Rename")
+    [(op, status)] = ex.value.failed_ops
+    assert op._method == "Rename" and status == "STATUS_FAILED"
+    assert op.call_site.filename == __file__
+    assert "Settings.Rename: STATUS_FAILED" in str(ex.value)
+    assert f'File "{__file__}"' in str(ex.value)
+    assert not batch_ops.batching
+
+
+def test_coalesce_writes_executes_datamodel_writes_immediately(monkeypatch):
+    monkeypatch.setattr(BatchOps, "_instance", staticmethod(lambda: None))
+    service = _FakeBatchOpsService()
+    session = SimpleNamespace(_batch_ops_service=service)
+    details = SimpleNamespace(method="/grpcRemoting.DataModel/setState")
+    response = SimpleNamespace(state="updated", deletedpaths=[])
+    with BatchOps(session, coalesce=True, timeout=None) as batch_ops:
+        _add_op(batch_ops, "SetVar")
+        # The response updates the datamodel cache, so the write is not queued.
+        assert (
+            BatchInterceptor()._intercept_call(
+                lambda details, request: response, details, _FakeRequest()
+            )
+            is response
+        )
+        assert service.executed == [["SetVar"]]
+
+
+def test_coalesce_writes_flushes_before_streaming_calls(monkeypatch):
+    monkeypatch.setattr(BatchOps, "_instance", staticmethod(lambda: None))
+    service = _FakeBatchOpsService()
+    session = SimpleNamespace(_batch_ops_service=service)
+    details = SimpleNamespace(
+        method="/ansys.api.fluent.v1.field_data.FieldData/GetFields"
+    )
+
+    def continuation(details, request):
+        executed.append(list(service.executed))
+        return iter(())
+
+    executed = []
+    with BatchOps(session, coalesce=True, timeout=None) as batch_ops:
+        _add_op(batch_ops, "SetVar")
+        BatchInterceptor().intercept_unary_stream(continuation, details, _FakeRequest())
+        _add_op(batch_ops, "Rename")
+        BatchInterceptor().intercept_stream_unary(continuation, details, iter(()))
+    assert executed == [[["SetVar"]], [["SetVar"], ["Rename"]]]
+
+
+def test_coalesce_writes_drops_queue_on_exception(monkeypatch):
+    monkeypatch.setattr(BatchOps, "_instance", staticmethod(lambda: None))
+    service = _FakeBatchOpsService(failing_methods=("SetVar",))
+    session = SimpleNamespace(_batch_ops_service=service)
+    with pytest.raises(KeyError):
+        with BatchOps(session, coalesce=True, timeout=None) as batch_ops:
+            _add_op(batch_ops, "SetVar")
+            raise KeyError("mesh-1")
+    assert service.executed == []
+    assert not batch_ops.batching
+    assert batch_ops._ops == []
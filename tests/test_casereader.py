@@ -26,6 +26,8 @@ from pathlib import Path
 import shutil
 
 import defusedxml.ElementTree as ET
+import h5py
+import numpy as np
 import pytest
 
 from ansys.fluent.core import examples
@@ -33,6 +35,7 @@ from ansys.fluent.core.filereader import lispy
 from ansys.fluent.core.filereader.case_file import (
     InputParameter,
     InputParameterOld,
+    Mesh,
     MeshType,
     _get_processed_string,
 )
@@ -350,6 +353,46 @@ def test_mesh_reader():
     assert case_reader.precision() == 2
 
 
+def _write_surface_mesh(file_name):
+    # Two surfaces: a quad and a triangle (id 3), then a far triangle (id 7).
+    with h5py.File(file_name, "w") as mesh_file:
+        faces = mesh_file.create_group("meshes/1/faces")
+        faces["zoneTopology/id"] = np.array([3, 7], dtype=np.int32)
+        faces["zoneTopology/minId"] = np.array([1, 3], dtype=np.int64)
+        faces["zoneTopology/maxId"] = np.array([2, 3], dtype=np.int64)
+        faces["zoneTopology/name"] = np.array([b"inlet;outlet"])
+        faces["nodes/1/nnodes"] = np.array([4, 3, 3], dtype=np.int16)
+        faces["nodes/1/nodes"] = np.array(
+            [1, 2, 5, 4, 2, 3, 5, 20, 19, 10], dtype=np.uint32
+        )
+        mesh_file["meshes/1/nodes/coords/1"] = np.arange(60.0).reshape(20, 3)
+
+
+def test_mesh_reader_reads_surface_slices(tmp_path):
+    file_name = tmp_path / "surface.msh.h5"
+    _write_surface_mesh(file_name)
+    with h5py.File(file_name) as mesh_file:
+        mesh = Mesh(mesh_file)
+        assert mesh.get_surface_ids() == [3, 7]
+        assert mesh.get_surface_names() == ["inlet", "outlet"]
+        assert mesh.get_surface_locs(7) == (2, 2)
+        assert mesh.get_connectivity(3).tolist() == [4, 0, 1, 4, 3, 3, 1, 2, 4]
+        assert mesh.get_connectivity(7).tolist() == [3, 2, 1, 0]
+        coords = np.arange(60.0).reshape(20, 3)
+        np.testing.assert_array_equal(
+            mesh.get_vertices(3), coords[[0, 1, 2, 3, 4]].flatten()
+        )
+        np.testing.assert_array_equal(
+            mesh.get_vertices(7), coords[[9, 18, 19]].flatten()
+        )
+        assert mesh._get_face_node_offsets().tolist() == [0, 4, 7, 10]
+        # Scattered nodes are read with a fancy-index selection.
+        mesh._VERTICES_SLAB_RATIO = 1
+        np.testing.assert_array_equal(
+            mesh.get_vertices(7), coords[[9, 18, 19]].flatten()
+        )
+
+
 def test_preprocessor():
     content = """
     <Project type="object" class="PFolder">
@@ -0,0 +1,291 @@
+# Copyright (C) 2021 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from multiprocessing import shared_memory
+import time
+
+import numpy as np
+import pytest
+
+from ansys.api.fluent.v0 import field_data_pb2 as field_data_pb2_v0
+from ansys.api.fluent.v1 import field_data_pb2
+from ansys.fluent.core._grpc_services import _shared_memory
+from ansys.fluent.core._grpc_services._chunk_parser import ChunkParser, ChunkParserV0
+from ansys.fluent.core.fields.field_data_interfaces import VectorFieldDataRequest
+from ansys.fluent.core.fields.live_field_data import LiveFieldData, _FieldInfo
+
+_CHUNK_SIZE = 256 * 1024
+_VECTOR_FIELD_TAG = (("type", "vector-field"),)
+
+
+def _header(surface_id, field_name, field_size, field_type):
+    return field_data_pb2.GetFieldsResponse(
+        payload_info=field_data_pb2.PayloadInfo(
+            surface_id=surface_id,
+            field_name=field_name,
+            field_type=field_type,
+            field_size=field_size,
+            field_request_info=field_data_pb2.FieldRequestInfo(
+                vector_field_request=field_data_pb2.VectorFieldRequest(
+                    surface_id=surface_id
+                )
+            ),
+        )
+    )
+
+
+def _byte_payload_chunks(array):
+    data = array.tobytes()
+    for i in range(0, len(data), _CHUNK_SIZE):
+        yield field_data_pb2.GetFieldsResponse(byte_payload=data[i : i + _CHUNK_SIZE])
+
+
+def _chunk_stream(payloads):
+    """Replay a field stream of ``(surface_id, field_name, array)`` payloads."""
+    for surface_id, field_name, array in payloads:
+        yield _header(
+            surface_id,
+            field_name,
+            len(array),
+            field_data_pb2.FieldType.FIELD_TYPE_DOUBLE_ARRAY,
+        )
+        yield from _byte_payload_chunks(array)
+
+
+def test_extract_fields_assembles_payloads_in_place():
+    first = np.arange(100_000, dtype=np.float64)
+    second = -np.arange(50_000, dtype=np.float64)
+    other = np.linspace(0.0, 1.0, 7)
+    fields = ChunkParser().extract_fields(
+        _chunk_stream(
+            [
+                (3, "velocity", first),
+                (4, "velocity", other),
+                (3, "velocity", second),
+                (3, "velocity", first[:3]),
+            ]
+        )
+    )
+    assert list(fields) == [_VECTOR_FIELD_TAG]
+    assert list(fields[_VECTOR_FIELD_TAG]) == [3, 4]
+    surface_3 = fields[_VECTOR_FIELD_TAG][3]["velocity"]
+    np.testing.assert_array_equal(surface_3, np.concatenate((first, second, first[:3])))
+    assert surface_3.flags.owndata and surface_3.flags.writeable
+    np.testing.assert_array_equal(fields[_VECTOR_FIELD_TAG][4]["velocity"], other)
+
+
+def test_extract_fields_from_repeated_payloads():
+    def stream():
+        yield _header(1, "faces", 5, field_data_pb2.FieldType.FIELD_TYPE_INT_ARRAY)
+        yield field_data_pb2.GetFieldsResponse(
+            int_payload=field_data_pb2.IntPayload(payloads=[1, 2, 3])
+        )
+        yield field_data_pb2.GetFieldsResponse(
+            int_payload=field_data_pb2.IntPayload(payloads=[4, 5])
+        )
+
+    fields = ChunkParser().extract_fields(stream())
+    faces = fields[_VECTOR_FIELD_TAG][1]["faces"]
+    assert faces.dtype == np.int32
+    assert faces.tolist() == [1, 2, 3, 4, 5]
+
+
+def test_iter_fields_yields_each_payload():
+    first = np.arange(100_000, dtype=np.float64)
+    other = np.linspace(0.0, 1.0, 7)
+    fields = ChunkParser().iter_fields(
+        _chunk_stream([(3, "velocity", first), (4, "velocity", other)])
+    )
+    payload_tag_id, surface_id, field_name, field = next(fields)
+    assert (payload_tag_id, surface_id, field_name) == (
+        _VECTOR_FIELD_TAG,
+        3,
+        "velocity",
+    )
+    np.testing.assert_array_equal(field, first)
+    assert [item[1] for item in fields] == [4]
+
+
+class _StreamedFieldDataService:
+    """Field data stand-in that parses a replayed chunk stream."""
+
+    def __init__(self, payloads):
+        self.payloads = payloads
+
+    def is_data_valid(self):
+        return True
+
+    def get_surfaces_info(self):
+        return {
+            f"wall-{i}": {
+                "surface_id": [i],
+                "zone_id": i,
+                "zone_type": "wall",
+                "type": "zone-surf",
+            }
+            for i in (3, 4)
+        }
+
+    def get_scalar_fields_info(self):
+        return {}
+
+    def get_vector_fields_info(self):
+        return {"velocity": {"x-component": "x-velocity"}}
+
+    def _add_vector_fields_request(self, field_name, surfaces):
+        pass
+
+    def get_batched_fields(self):
+        return _chunk_stream(self.payloads)
+
+    def iter_fields(self, chunk_iterator):
+        return ChunkParser().iter_fields(chunk_iterator)
+
+
+def test_batch_iter_responses_concatenates_payloads():
+    first = np.arange(30, dtype=np.float64)
+    second = -np.arange(30, dtype=np.float64)
+    other = np.linspace(0.0, 1.0, 9)
+    service = _StreamedFieldDataService(
+        [
+            (3, "velocity", first),
+            (3, "velocity", second),
+            (4, "velocity", other),
+        ]
+    )
+    field_data = LiveFieldData(service, _FieldInfo(service), None)
+    request = VectorFieldDataRequest(field_name="velocity", surfaces=[3, 4])
+    batch = field_data.new_batch().add_requests(request)
+
+    responses = batch.iter_responses()
+    _, surface, data = next(responses)
+    assert surface == 3
+    assert data.shape == (20, 3)
+    np.testing.assert_array_equal(data.ravel(), np.concatenate((first, second)))
+    _, surface, data = next(responses)
+    assert surface == 4
+    assert data.shape == (3, 3)
+    assert next(responses, None) is None
+
+
+class _Call:
+    def __init__(self, responses, initial_metadata):
+        self._responses = responses
+        self._initial_metadata = initial_metadata
+
+    def initial_metadata(self):
+        return self._initial_metadata
+
+    def __iter__(self):
+        return iter(self._responses)
+
+
+def test_extract_fields_from_shared_memory():
+    first = np.arange(100_000, dtype=np.float64)
+    other = np.linspace(0.0, 1.0, 7)
+    region = shared_memory.SharedMemory(create=True, size=first.nbytes + other.nbytes)
+    region.buf[: first.nbytes] = first.view(np.uint8)
+    region.buf[first.nbytes :] = other.view(np.uint8)
+    double_type = field_data_pb2.FieldType.FIELD_TYPE_DOUBLE_ARRAY
+    call = _Call(
+        [
+            _header(3, "velocity", len(first), double_type),
+            field_data_pb2.GetFieldsResponse(
+                byte_payload=_shared_memory.pack_descriptor(0, first.nbytes)
+            ),
+            _header(4, "velocity", len(other), double_type),
+            field_data_pb2.GetFieldsResponse(
+                byte_payload=_shared_memory.pack_descriptor(first.nbytes, other.nbytes)
+            ),
+        ],
+        [(_shared_memory.SHARED_MEMORY_KEY, region.name)],
+    )
+    # The region belongs to the client once its name is sent.
+    region.close()
+    fields = ChunkParser().extract_fields(_shared_memory.read_call(call))
+    np.testing.assert_array_equal(fields[_VECTOR_FIELD_TAG][3]["velocity"], first)
+    np.testing.assert_array_equal(fields[_VECTOR_FIELD_TAG][4]["velocity"], other)
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=region.name)
+
+
+def test_extract_fields_v0_with_empty_field():
+    def stream():
+        yield field_data_pb2_v0.GetFieldsResponse(
+            payloadInfo=field_data_pb2_v0.PayloadInfo(
+                surfaceId=2,
+                fieldName="temperature",
+                fieldSize=0,
+                fieldRequestInfo=field_data_pb2_v0.FieldRequestInfo(
+                    vectorFieldRequest=field_data_pb2_v0.VectorFieldRequest(surfaceId=2)
+                ),
+            )
+        )
+        yield field_data_pb2_v0.GetFieldsResponse(
+            payloadInfo=field_data_pb2_v0.PayloadInfo(
+                surfaceId=2,
+                fieldName="temperature",
+                fieldType=field_data_pb2_v0.FieldType.FLOAT_ARRAY,
+                fieldSize=2,
+                fieldRequestInfo=field_data_pb2_v0.FieldRequestInfo(
+                    vectorFieldRequest=field_data_pb2_v0.VectorFieldRequest(surfaceId=2)
+                ),
+            )
+        )
+        yield field_data_pb2_v0.GetFieldsResponse(
+            bytePayload=np.array([1.5, 2.5], dtype=np.float32).tobytes()
+        )
+
+    with pytest.warns(UserWarning, match="Field data is not available"):
+        fields = ChunkParserV0().extract_fields(stream())
+    assert fields[_VECTOR_FIELD_TAG][2]["temperature"].tolist() == [1.5, 2.5]
+
+
+@pytest.mark.nightly
+def test_extract_fields_benchmark():
+    payload_size = 1024 * 1024
+    payload = np.random.default_rng(0).random(payload_size)
+    header = _header(
+        1, "velocity", payload_size, field_data_pb2.FieldType.FIELD_TYPE_DOUBLE_ARRAY
+    )
+    chunks = list(_byte_payload_chunks(payload))
+
+    def replay(payload_count):
+        # Several payloads per surface, as when a large field is split by Fluent.
+        for _ in range(payload_count):
+            yield header
+            yield from chunks
+
+    def parse(payload_count):
+        start = time.perf_counter()
+        fields = ChunkParser().extract_fields(replay(payload_count))
+        elapsed = time.perf_counter() - start
+        field = fields[_VECTOR_FIELD_TAG][1]["velocity"]
+        assert len(field) == payload_count * payload_size
+        np.testing.assert_array_equal(field[-payload_size:], payload)
+        return elapsed
+
+    # 128 and 256 payloads of 8 MiB replay 1 GiB and 2 GiB streams.
+    small, large = parse(128), parse(256)
+    # Assembly must stay linear in the number of payloads per surface.
+    assert large < 3 * small
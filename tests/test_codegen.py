@@ -35,6 +35,7 @@ import ansys.fluent.core as pyfluent
 from ansys.fluent.core.codegen import StaticInfoType, allapigen
 from ansys.fluent.core.codegen.api_tree import get_api_tree_file_name
 from ansys.fluent.core.codegen.datamodelgen import datamodel_file_name_map
+from ansys.fluent.core.solver import flobject
 from ansys.fluent.core.utils.fluent_version import get_version_for_file_name
 
 
@@ -516,7 +517,7 @@ _settings_static_info = {
 }
 
 
-_expected_settings_api_output = '''#
+_expected_settings_api_header = """#
 # This is an auto-generated file.  DO NOT EDIT!
 #
 
@@ -532,9 +533,76 @@ from ansys.fluent.core.solver.flobject import (
     _FlStringConstant,
 )
 
+"""
+
+_expected_settings_api_output = {
+    "__init__.py": _expected_settings_api_header
+    + '''from ansys.fluent.core.solver.flobject import (
+    _ImportedChildClasses,
+    _LazyChild,
+    _import_settings_class,
+)
+
 SHASH = "855b05953087d440471b35817227cb48708938415a9d3cc7eaa5ae71fb305d19"
 
-class P3(Integer):
+_CLASS_MODULES = {
+    'P3': '_G1',
+    'G2': '_G1',
+    'P2': '_G1',
+    'A2': '_G1',
+    'C2': '_G1',
+    'Q2': '_G1',
+    'G1': '_G1',
+    'P1': '_P1',
+    'P4': '_N1',
+    'N1_child': '_N1',
+    'N1': '_N1',
+    'A1': '_common',
+    'C1': '_C1',
+    'Q1': '_Q1',
+}
+
+
+def __getattr__(name):
+    module = _CLASS_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return _import_settings_class(__name__, module, name)
+
+
+def __dir__():
+    return sorted(set(globals()) | _CLASS_MODULES.keys())
+
+
+class root(Group):
+    """
+    'root' object.
+    """
+    _version = '251'
+    exposure_level = ExposureLevel.STABLE
+    fluent_name = ''
+    _python_name = 'root'
+    child_names = ['G1', 'P1', 'N1']
+    command_names = ['C1']
+    query_names = ['Q1']
+    _child_classes = _ImportedChildClasses(
+        __name__,
+        dict(
+            G1=('_G1', 'G1'),
+            P1=('_P1', 'P1'),
+            N1=('_N1', 'N1'),
+            C1=('_C1', 'C1'),
+            Q1=('_Q1', 'Q1'),
+        ),
+    )
+    G1 = _LazyChild('G1')
+    P1 = _LazyChild('P1')
+    N1 = _LazyChild('N1')
+    C1 = _LazyChild('C1')
+    Q1 = _LazyChild('Q1')
+''',  # noqa: W293
+    "_G1.py": _expected_settings_api_header
+    + '''class P3(Integer):
     """
     P3 help.
     """
@@ -627,8 +695,9 @@ class G1(Group):
         C2=C2,
         Q2=Q2,
     )
-
-class P1(String):
+''',  # noqa: W293
+    "_P1.py": _expected_settings_api_header
+    + '''class P1(String):
     """
     P1 help.
     """
@@ -636,8 +705,9 @@ class P1(String):
     exposure_level = ExposureLevel.STABLE
     fluent_name = 'P1'
     _python_name = 'P1'
-
-class P4(String):
+''',  # noqa: W293
+    "_N1.py": _expected_settings_api_header
+    + '''class P4(String):
     """
     P4 help.
     """
@@ -668,15 +738,11 @@ class N1(NamedObject[N1_child], _NonCreatableNamedObjectMixin[N1_child]):
         P4=P4,
     )
     child_object_type = N1_child
-
-class A1(String):
-    """
-    A1 help.
-    """
-    _version = '251'
-    exposure_level = ExposureLevel.STABLE
-    fluent_name = 'A1'
-    _python_name = 'A1'
+''',  # noqa: W293
+    "_C1.py": _expected_settings_api_header
+    + '''from ._common import (
+    A1,
+)
 
 class C1(Command):
     """
@@ -695,6 +761,11 @@ class C1(Command):
     _child_classes = dict(
         A1=A1,
     )
+''',  # noqa: W293
+    "_Q1.py": _expected_settings_api_header
+    + '''from ._common import (
+    A1,
+)
 
 class Q1(Query):
     """
@@ -713,25 +784,18 @@ class Q1(Query):
     _child_classes = dict(
         A1=A1,
     )
-
-class root(Group):
+''',  # noqa: W293
+    "_common.py": _expected_settings_api_header
+    + '''class A1(String):
     """
-    'root' object.
+    A1 help.
     """
     _version = '251'
     exposure_level = ExposureLevel.STABLE
-    fluent_name = ''
-    _python_name = 'root'
-    child_names = ['G1', 'P1', 'N1']
-    command_names = ['C1']
-    query_names = ['Q1']
-    _child_classes = dict(
-        G1=G1,
-        P1=P1,
-        N1=N1,
-        C1=C1,
-        Q1=Q1,
-    )'''  # noqa: W293
+    fluent_name = 'A1'
+    _python_name = 'A1'
+''',  # noqa: W293
+}
 
 
 def test_codegen_with_settings_static_info(monkeypatch):
@@ -747,18 +811,25 @@ def test_codegen_with_settings_static_info(monkeypatch):
         f"api_tree_{version}.pickle",
         "solver",
     }
-    assert {p.name for p in (codegen_outdir / "solver").glob("*.py*")} == {
-        f"settings_{version}.py",
-        f"settings_{version}.pyi",
+    settings_dir = codegen_outdir / "solver" / f"settings_{version}"
+    assert [p.name for p in (codegen_outdir / "solver").iterdir()] == [
+        settings_dir.name
+    ]
+    assert {p.name for p in settings_dir.iterdir()} == {
+        *_expected_settings_api_output,
+        "__init__.pyi",
     }
-    with open(codegen_outdir / "solver" / f"settings_{version}.py", "r") as f:
-        expected_settings_api_output = _expected_settings_api_output
+    for (
+        file_name,
+        expected_settings_api_output,
+    ) in _expected_settings_api_output.items():
         if sys.version_info >= (3, 14):
             expected_settings_api_output = expected_settings_api_output.replace(
                 'SHASH = "3e6d76a4601701388ea8258912d145b7b7c436699a50b6c7fe9a29f41eeff194"',
                 'SHASH = "54828595751f83d80abe11673952397862edb1f6f1ff3c23b2c133b483561345"',
             )
-        assert f.read().strip() == expected_settings_api_output
+        with open(settings_dir / file_name, "r") as f:
+            assert f.read().strip() == expected_settings_api_output.strip()
     api_tree_file = get_api_tree_file_name(version)
     with open(api_tree_file, "rb") as f:
         api_tree = pickle.load(f)
@@ -880,11 +951,46 @@ def test_codegen_with_settings_static_info_edge_cases(
     static_infos = {}
     static_infos[StaticInfoType.SETTINGS] = settings_static_info
     allapigen.generate(version, static_infos)
-    with open(codegen_outdir / "solver" / f"settings_{version}.py", "r") as f:
-        module_def = ast.parse(f.read())
-        class_names_from_file = [
-            x.name for x in module_def.body if isinstance(x, ast.ClassDef)
-        ]
-        # The order of classes is important.
-        assert class_names_from_file == class_names
+    settings_dir = codegen_outdir / "solver" / f"settings_{version}"
+    class_names_from_file = []
+    for file_name in ("_G1.py", "__init__.py"):
+        with open(settings_dir / file_name, "r") as f:
+            module_def = ast.parse(f.read())
+            class_names_from_file += [
+                x.name for x in module_def.body if isinstance(x, ast.ClassDef)
+            ]
+    # The order of classes is important.
+    assert class_names_from_file == class_names
+    shutil.rmtree(str(codegen_outdir))
+
+
+def test_codegen_settings_branches_are_imported_lazily(monkeypatch):
+    codegen_outdir = Path(tempfile.mkdtemp())
+    monkeypatch.setattr(pyfluent.config, "codegen_outdir", codegen_outdir)
+    version = "251"
+    allapigen.generate(version, {StaticInfoType.SETTINGS: _settings_static_info})
+
+    class StaticProxy:
+        def get_attrs(self, path, attrs, recursive=False):
+            return {"active?": True}
+
+    def imported_modules():
+        return {name for name in sys.modules if name.startswith(f"settings_{version}.")}
+
+    root = flobject.get_root(StaticProxy(), version=version)
+    assert imported_modules() == set()
+    assert root.P1.fluent_name == "P1"
+    assert imported_modules() == {f"settings_{version}._P1"}
+    settings = sys.modules[f"settings_{version}"]
+    # Classes which are used by several branches are in a common submodule.
+    assert settings.A1.__module__ == f"settings_{version}._common"
+    assert settings.C1._child_classes["A1"] is settings.A1
+    assert imported_modules() == {
+        f"settings_{version}._P1",
+        f"settings_{version}._common",
+        f"settings_{version}._C1",
+    }
+    assert root.C1.A1.fluent_name == "A1"
+    with pytest.raises(AttributeError):
+        settings.unknown_class
     shutil.rmtree(str(codegen_outdir))
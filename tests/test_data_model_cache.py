@@ -21,6 +21,11 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import copy
+import sys
+import threading
+import time
+
 import pytest
 
 from ansys.api.fluent.v0.variant_pb2 import Variant
@@ -445,6 +450,237 @@ def test_cache_set_state(
     assert final_cache == cache_rules[rules]
 
 
+def test_update_cache_named_object_indexes():
+    cache = DataModelCache()
+    rules = "r1"
+    cache.set_config(rules, "name_key", NameKey.DISPLAY)
+
+    def update(state, deleted_paths=()):
+        var = Variant()
+        _convert_value_to_variant(state, var)
+        cache.update_cache(rules, var, list(deleted_paths))
+
+    update({"A": {"B:B1": {"_name_": "B-1", "C": 1}, "B:B2": {"_name_": "B-2"}}})
+    assert cache.get_state(rules, Fake("A/B:B1"), NameKey.INTERNAL) == {
+        "__iname__": "B1",
+        "_name_": "B-1",
+        "C": 1,
+    }
+    update({"A": {"B:B1": {"_name_": "B-3", "C": 2}}})
+    assert cache.rules_str_to_cache[rules]["A"]["B:B-1"]["C"] == 2
+    assert cache.get_state(rules, Fake("A/B:B1"), NameKey.INTERNAL)["_name_"] == "B-3"
+    update({}, ["A/B:B1"])
+    assert cache.get_state(rules, Fake("A/B:B1"), NameKey.INTERNAL) is (
+        DataModelCache.Empty
+    )
+    update({"A": {"B:B1": {"_name_": "B-1", "C": 3}}})
+    assert cache.rules_str_to_cache[rules]["A"] == {
+        "B:B-2": {"__iname__": "B2", "_name_": "B-2"},
+        "B:B-1": {"__iname__": "B1", "_name_": "B-1", "C": 3},
+    }
+
+    cache.set_config(rules, "name_key", NameKey.INTERNAL)
+    cache.rules_str_to_cache[rules] = {"A": {"B:B1": {"_name_": "B-1", "C": 1}}}
+    assert cache.get_state(rules, Fake("A/B:B-1"), NameKey.DISPLAY) == {
+        "_name_": "B-1",
+        "C": 1,
+    }
+    update({"A": {"B:B1": {"_name_": "B-2"}}})
+    assert cache.get_state(rules, Fake("A/B:B-2"), NameKey.DISPLAY)["C"] == 1
+    assert cache.get_state(rules, Fake("A/B:B-1"), NameKey.DISPLAY) is (
+        DataModelCache.Empty
+    )
+
+
+def test_cache_snapshots_are_immutable():
+    cache = DataModelCache()
+    rules = "r1"
+    cache.set_config(rules, "name_key", NameKey.DISPLAY)
+
+    def update(state, deleted_paths=()):
+        var = Variant()
+        _convert_value_to_variant(state, var)
+        cache.update_cache(rules, var, list(deleted_paths))
+
+    update({"A": {"B:B1": {"_name_": "B-1", "C": 1}}, "E": {"F": 1}})
+    version, state = cache.get_snapshot(rules)
+    expected = copy.deepcopy(state)
+    update({"A": {"B:B1": {"C": 2}, "B:B2": {"_name_": "B-2"}}})
+    update({}, ["A/B:B1"])
+    cache.set_state(rules, Fake("E/F"), 3)
+    assert state == expected
+    new_version, new_state = cache.get_snapshot(rules)
+    assert new_version == version + 3
+    assert new_state == {
+        "A": {"B:B-2": {"__iname__": "B2", "_name_": "B-2"}},
+        "E": {"F": 3},
+    }
+
+    # Writes between two snapshots keep the name indexes of the containers
+    # they share up to date.
+    update({"A": {"B:B3": {"_name_": "B-3"}}})
+    cache.set_state(rules, Fake("A"), {"B:B4": {"_name_": "B-4"}})
+    update({}, ["A/B:B4"])
+    assert cache.get_state(rules, Fake("A"), NameKey.INTERNAL) == {
+        "B:B2": {"__iname__": "B2", "_name_": "B-2"},
+        "B:B3": {"__iname__": "B3", "_name_": "B-3"},
+    }
+    assert new_state == {
+        "A": {"B:B-2": {"__iname__": "B2", "_name_": "B-2"}},
+        "E": {"F": 3},
+    }
+
+    # Readers do not wait for the writers.
+    with cache._with_lock(rules):
+        reader = threading.Thread(
+            target=lambda: cache.get_state(rules, Fake("A/B:B2"), NameKey.INTERNAL)
+        )
+        reader.start()
+        reader.join(timeout=5)
+        assert not reader.is_alive()
+
+
+def test_cache_writer_does_not_retain_deleted_objects():
+    cache = DataModelCache()
+    rules = "r1"
+    cache.set_config(rules, "name_key", NameKey.DISPLAY)
+
+    def update(state, deleted_paths=()):
+        var = Variant()
+        _convert_value_to_variant(state, var)
+        cache.update_cache(rules, var, list(deleted_paths))
+
+    cache.get_snapshot(rules)
+    update({"A": {"B:B1": {"_name_": "B-1", "C": {"D": 1}}}})
+    deleted = cache.rules_str_to_cache[rules]["A"]["B:B-1"]
+    update({}, ["A/B:B1"])
+    for i in range(100):
+        update({"A": {f"B:B{i}": {"_name_": f"B-{i}"}}})
+        update({}, [f"A/B:B{i}"])
+    assert cache.rules_str_to_cache[rules] == {"A": {}}
+    # Only the local variable and the argument refer to the deleted object.
+    assert sys.getrefcount(deleted) == 2
+
+
+@pytest.mark.nightly
+def test_update_cache_named_objects_benchmark():
+    def stream(object_count):
+        cache = DataModelCache()
+        objects = {
+            f"Obj:obj{i}": {"_name_": f"Object {i}", "Value": float(i)}
+            for i in range(object_count)
+        }
+        created, updated = Variant(), Variant()
+        _convert_value_to_variant({"Root": objects}, created)
+        _convert_value_to_variant(
+            {"Root": {k: {"Value": -1.0} for k in objects}}, updated
+        )
+        start = time.perf_counter()
+        cache.update_cache("r1", created, [])
+        cache.update_cache("r1", updated, [])
+        cache.update_cache("r1", Variant(), [f"Root/{k}" for k in objects])
+        elapsed = time.perf_counter() - start
+        assert cache.rules_str_to_cache["r1"]["Root"] == {}
+        return elapsed
+
+    small, large = stream(5_000), stream(10_000)
+    # Updates must stay linear in the number of named objects.
+    assert large < 3 * small
+
+    def stream_single_updates(object_count):
+        cache = DataModelCache()
+        created = Variant()
+        _convert_value_to_variant(
+            {
+                "Root": {
+                    f"Obj:obj{i}": {"_name_": f"Object {i}", "Value": float(i)}
+                    for i in range(object_count)
+                }
+            },
+            created,
+        )
+        cache.update_cache("r1", created, [])
+        cache.get_snapshot("r1")
+        updates = []
+        for i in range(1_000):
+            updated = Variant()
+            _convert_value_to_variant(
+                {"Root": {f"Obj:obj{i}": {"Value": -1.0}}}, updated
+            )
+            updates.append(updated)
+        start = time.perf_counter()
+        for updated in updates:
+            cache.update_cache("r1", updated, [])
+        elapsed = time.perf_counter() - start
+        assert cache.get_state("r1", Fake("Root/Obj:Object 999/Value")) == -1.0
+        return elapsed
+
+    # Streamed single-object updates must not copy the whole container each.
+    small, large = stream_single_updates(2_000), stream_single_updates(20_000)
+    assert large < 3 * small
+
+
+_datamodel_module = """
+from ansys.fluent.core.services.object_model import (
+    PyDictionary,
+    PyMenu,
+    PyNamedObjectContainer,
+    PyTextual,
+)
+
+
+class Root(PyMenu):
+    class A(PyNamedObjectContainer):
+        class _A(PyMenu):
+            class D(PyDictionary):
+                pass
+
+            class T(PyTextual):
+                pass
+
+    class D(PyDictionary):
+        pass
+"""
+
+
+def test_is_dict_parameter_type_is_memoized(tmp_path, monkeypatch):
+    from pathlib import Path
+
+    from ansys.fluent.core import data_model_cache, utils
+    from ansys.fluent.core.utils.fluent_version import FluentVersion
+
+    monkeypatch.setattr(pyfluent.config, "codegen_outdir", tmp_path)
+    monkeypatch.setattr(data_model_cache, "_dict_parameter_paths", {})
+    version = FluentVersion.v261
+    assert not data_model_cache._is_dict_parameter_type(version, "dm_test", "D")
+    module_path = tmp_path / f"datamodel_{version.number}" / "dm_test.py"
+    module_path.parent.mkdir()
+    module_path.write_text(_datamodel_module)
+    # The lookup table is kept until the module is generated or loaded again.
+    assert not data_model_cache._is_dict_parameter_type(version, "dm_test", "D")
+    data_model_cache._clear_dict_parameter_paths(str(version.number), "dm_test")
+    loaded = []
+    load_module = utils.load_module
+    monkeypatch.setattr(
+        utils, "load_module", lambda *args: loaded.append(args) or load_module(*args)
+    )
+    assert data_model_cache._is_dict_parameter_type(version, "dm_test", "D")
+    # The lookups do not touch the file system.
+    with monkeypatch.context() as m:
+        m.setattr(Path, "stat", None)
+        for _ in range(2):
+            assert data_model_cache._is_dict_parameter_type(version, "dm_test", "D")
+            assert data_model_cache._is_dict_parameter_type(version, "dm_test", "A/D")
+            assert not data_model_cache._is_dict_parameter_type(
+                version, "dm_test", "A/D/x"
+            )
+            assert not data_model_cache._is_dict_parameter_type(
+                version, "dm_test", "A/T"
+            )
+            assert not data_model_cache._is_dict_parameter_type(version, "dm_test", "A")
+    assert len(loaded) == 1
+
+
 def test_cache_per_session():
     grpc_kwds = get_grpc_launcher_args_for_gh_runs()
     with (
@@ -21,6 +21,12 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import time
+
+import h5py
+import numpy as np
+import pytest
+
 from ansys.fluent.core import examples
 from ansys.fluent.core.filereader.case_file import CaseFile
 from ansys.fluent.core.filereader.data_file import DataFile
@@ -69,7 +75,7 @@ def test_data_reader_for_single_phase():
 
     assert len(reader.get_face_scalar_field_data("phase-1", "SV_DENSITY", 3)) == 3630
 
-    assert len(reader.get_face_vector_field_data("phase-1", 3)) == 10890
+    assert reader.get_face_vector_field_data("phase-1", 3).shape == (3630, 3)
 
 
 def test_data_reader_for_multi_phase():
@@ -124,3 +130,74 @@ def test_data_reader_for_multi_phase():
     ]
 
     assert len(reader.get_face_scalar_field_data("phase-1", "SV_DENSITY", 33)) == 268
+
+
+class _SurfaceMesh:
+    def __init__(self, surface_locs):
+        self._surface_locs = surface_locs
+
+    def get_mesh(self):
+        return self
+
+    def get_surface_locs(self, surface_id):
+        return self._surface_locs[surface_id]
+
+
+def _write_data_file(file_name, face_count, array_count=2):
+    """Write face fields of ``face_count`` faces split into ``array_count`` arrays."""
+    bounds = np.linspace(0, face_count, array_count + 1).astype(int)
+    with h5py.File(file_name, "w") as data_file:
+        data_file["settings/Case File"] = np.array([b"synthetic.cas.h5"])
+        faces = data_file.create_group("results/1/phase-1/faces")
+        for offset, field_name in enumerate(["SV_U", "SV_V", "SV_W", "SV_P"]):
+            for i in range(array_count):
+                field_array = faces.create_dataset(
+                    f"{field_name}/{i + 1}",
+                    data=np.arange(bounds[i], bounds[i + 1], dtype=np.float64)
+                    + offset * face_count,
+                )
+                field_array.attrs["minId"] = [bounds[i] + 1]
+                field_array.attrs["maxId"] = [bounds[i + 1]]
+
+
+def test_data_reader_face_field_data(tmp_path):
+    file_name = tmp_path / "synthetic.dat.h5"
+    _write_data_file(file_name, face_count=10)
+    reader = DataFile(
+        data_file_name=file_name,
+        case_file_handle=_SurfaceMesh({3: (0, 2), 4: (6, 9), 5: (3, 6)}),
+    )
+    field_data = reader.get_face_field_data("phase-1", ["SV_P", "SV_U"], [3, 4, 5])
+    assert field_data[3]["SV_P"].tolist() == [30.0, 31.0, 32.0]
+    assert field_data[4]["SV_U"].tolist() == [6.0, 7.0, 8.0, 9.0]
+    # Surface 5 straddles the two arrays of the field.
+    assert field_data[5]["SV_U"].tolist() == [0.0, 0.0, 0.0, 0.0]
+
+    vector_data = reader.get_face_vector_field_data("phase-1", 4)
+    assert vector_data.shape == (4, 3)
+    assert vector_data[0].tolist() == [6.0, 16.0, 26.0]
+    np.testing.assert_array_equal(
+        reader.get_face_scalar_field_data("phase-1", "SV_P", 3),
+        field_data[3]["SV_P"],
+    )
+
+
+@pytest.mark.nightly
+def test_data_reader_face_vector_field_data_benchmark(tmp_path):
+    face_count = 4_000_000
+    file_name = tmp_path / "synthetic.dat.h5"
+    _write_data_file(file_name, face_count)
+    reader = DataFile(
+        data_file_name=file_name,
+        case_file_handle=_SurfaceMesh({1: (0, face_count // 2 - 1)}),
+    )
+    start = time.perf_counter()
+    vector_data = reader.get_face_vector_field_data("phase-1", 1)
+    elapsed = time.perf_counter() - start
+    assert vector_data.shape == (face_count // 2, 3)
+    assert vector_data[-1].tolist() == [
+        face_count // 2 - 1,
+        face_count * 3 // 2 - 1,
+        face_count * 5 // 2 - 1,
+    ]
+    assert elapsed < 5
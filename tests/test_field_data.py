@@ -21,6 +21,7 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import threading
 import warnings
 
 from conftest import SKIP_INVESTIGATING
@@ -28,6 +29,7 @@ import numpy as np
 import pytest
 from test_utils import pytest_approx
 
+from ansys.api.fluent.v1 import field_data_pb2
 from ansys.fluent.core import (
     PathlinesFieldDataRequest,
     ScalarFieldDataRequest,
@@ -38,15 +40,26 @@ from ansys.fluent.core import (
 )
 from ansys.fluent.core.examples.downloads import download_file
 from ansys.fluent.core.exceptions import DisallowedValuesError
+from ansys.fluent.core.fields.field_data_cache import FieldDataCache
 from ansys.fluent.core.fields.field_data_interfaces import (
+    FaceConnectivity,
     FieldUnavailableError,
     _Fields,
+    _ReturnFieldData,
 )
 from ansys.fluent.core.fields.live_field_data import (
     CellElementType,
+    LiveFieldData,
+    Mesh,
+    ZoneInfo,
     ZoneType,
+    _build_mesh_arrays,
+    _FieldInfo,
 )
+from ansys.fluent.core.pyfluent_warnings import PyFluentDeprecationWarning
+from ansys.fluent.core.services.field_data import _split_fields_request
 from ansys.fluent.core.solver import VelocityInlet, VelocityInlets, WallBoundaries
+from ansys.fluent.core.streaming_services.events_streaming import SolverEvent
 from ansys.fluent.core.utils.execution import timeout_loop
 from ansys.units.variable_descriptor import VariableCatalog
 
@@ -560,6 +573,519 @@ def test_fields_allowed_variables_no_warning_when_all_mapped() -> None:
     assert len(caught) == 0
 
 
+def test_mesh_arrays_from_streamed_chunks() -> None:
+    nested_nodes = [
+        [field_data_pb2.NodeDouble(id=i + 10, x=i, y=2 * i, z=3 * i) for i in range(5)],
+        [
+            field_data_pb2.NodeDouble(id=i + 10, x=i, y=2 * i, z=3 * i)
+            for i in (7, 6, 5)
+        ],
+    ]
+    nested_elements = [
+        [
+            field_data_pb2.Element(id=1, element_type=2, node_ids=[10, 11, 12, 13]),
+            field_data_pb2.Element(
+                id=2,
+                element_type=7,
+                facets=[
+                    field_data_pb2.Facet(nodes=[10, 11, 12]),
+                    field_data_pb2.Facet(nodes=[13, 14, 15, 17]),
+                ],
+            ),
+        ],
+        [field_data_pb2.Element(id=3, element_type=1, node_ids=[17, 16, 15])],
+    ]
+    mesh = Mesh.from_arrays(_build_mesh_arrays(nested_nodes, nested_elements))
+    arrays = mesh.arrays
+    assert arrays.node_ids.tolist() == [10, 11, 12, 13, 14, 17, 16, 15]
+    assert arrays.node_coords.shape == (8, 3)
+    assert arrays.element_types.tolist() == [2, 7, 1]
+    assert arrays.element_offsets.tolist() == [0, 4, 4, 7]
+    assert arrays.element_connectivity.tolist() == [0, 1, 2, 3, 5, 6, 7]
+    assert arrays.element_facet_offsets.tolist() == [0, 0, 2, 2]
+    assert arrays.facet_offsets.tolist() == [0, 3, 7]
+    assert arrays.facet_connectivity.tolist() == [0, 1, 2, 3, 4, 7, 5]
+
+    assert len(mesh.nodes) == 8
+    assert mesh.nodes[5]._id == 17
+    assert max(mesh.nodes, key=lambda x: x.x).x == 7.0
+    assert len(mesh.elements) == 3
+    assert mesh.elements[0].node_indices == [0, 1, 2, 3]
+    assert mesh.elements[1].element_type == CellElementType.POLYHEDRON
+    assert mesh.elements[1].node_indices == []
+    assert [f.node_indices for f in mesh.elements[1].facets] == [
+        [0, 1, 2],
+        [3, 4, 7, 5],
+    ]
+    assert mesh.elements[-1].node_indices == [5, 6, 7]
+    # The keyword constructor of the former dataclass still builds the mesh.
+    rebuilt = Mesh(nodes=list(mesh.nodes), elements=list(mesh.elements))
+    assert rebuilt == mesh
+    np.testing.assert_array_equal(
+        rebuilt.arrays.facet_connectivity, arrays.facet_connectivity
+    )
+
+
+def test_mesh_arrays_with_unknown_node_id() -> None:
+    nested_nodes = [[field_data_pb2.NodeDouble(id=1, x=0.0, y=0.0, z=0.0)]]
+    nested_elements = [[field_data_pb2.Element(id=1, element_type=1, node_ids=[2])]]
+    with pytest.raises(ValueError):
+        _build_mesh_arrays(nested_nodes, nested_elements)
+
+
+def test_iter_mesh_yields_compact_chunks() -> None:
+    class _FieldDataService:
+        def iter_solver_mesh_nodes_double(self, domain_id, thread_id):
+            yield [field_data_pb2.NodeDouble(id=i, x=i) for i in range(5)]
+            yield [field_data_pb2.NodeDouble(id=i, x=i) for i in range(5, 9)]
+
+        def iter_solver_mesh_elements(self, domain_id, thread_id):
+            yield [
+                field_data_pb2.Element(id=1, element_type=2, node_ids=[0, 1, 2, 3]),
+                field_data_pb2.Element(id=2, element_type=2, node_ids=[5, 6, 7, 8]),
+            ]
+            yield [
+                field_data_pb2.Element(
+                    id=3,
+                    element_type=7,
+                    facets=[field_data_pb2.Facet(nodes=[8, 4, 0])],
+                )
+            ]
+
+    class _Scheme:
+        def eval(self, expr):
+            return True
+
+    field_data = LiveFieldData.__new__(LiveFieldData)
+    field_data._field_data = _FieldDataService()
+    field_data.scheme = _Scheme()
+    field_data.get_zones_info = lambda: [
+        ZoneInfo(1, "fluid", ZoneType.CELL),
+        ZoneInfo(2, "wall", ZoneType.FACE),
+    ]
+
+    chunks = list(field_data.iter_mesh())
+    assert [zone.name for zone, _ in chunks] == ["fluid", "fluid"]
+    assert chunks[0][1].node_ids.tolist() == [0, 1, 2, 3, 5, 6, 7, 8]
+    assert chunks[1][1].node_ids.tolist() == [0, 4, 8]
+    assert chunks[1][1].facet_connectivity.tolist() == [2, 1, 0]
+
+    chunks = list(field_data.iter_mesh(zones=["fluid"], chunk_cells=1))
+    assert [arrays.element_ids.tolist() for _, arrays in chunks] == [[1], [2], [3]]
+    assert chunks[1][1].node_ids.tolist() == [5, 6, 7, 8]
+    assert chunks[1][1].element_connectivity.tolist() == [0, 1, 2, 3]
+
+    with pytest.raises(NotImplementedError):
+        next(field_data.iter_mesh(zones=["wall"]))
+    with pytest.raises(ValueError):
+        next(field_data.iter_mesh(chunk_cells=0))
+
+
+def test_get_meshes_fetches_zones_concurrently() -> None:
+    barrier = threading.Barrier(4, timeout=5)
+
+    class _FieldDataService:
+        def get_solver_mesh_nodes_float(self, domain_id, thread_id):
+            barrier.wait()
+            return [[field_data_pb2.NodeFloat(id=i, x=thread_id) for i in range(4)]]
+
+        def get_solver_mesh_elements(self, domain_id, thread_id):
+            barrier.wait()
+            return [
+                [
+                    field_data_pb2.Element(
+                        id=thread_id, element_type=2, node_ids=[3, 2, 1, 0]
+                    )
+                ]
+            ]
+
+    class _Scheme:
+        def eval(self, expr):
+            return False
+
+    field_data = LiveFieldData.__new__(LiveFieldData)
+    field_data._field_data = _FieldDataService()
+    field_data.scheme = _Scheme()
+    field_data.get_zones_info = lambda: [
+        ZoneInfo(1, "fluid-1", ZoneType.CELL),
+        ZoneInfo(2, "fluid-2", ZoneType.CELL),
+        ZoneInfo(3, "wall", ZoneType.FACE),
+    ]
+
+    # All four requests must be in flight together to pass the barrier.
+    meshes = field_data.get_meshes(max_workers=4)
+    assert list(meshes) == ["fluid-1", "fluid-2"]
+    assert meshes["fluid-2"].arrays.node_coords.dtype == np.float32
+    assert meshes["fluid-2"].nodes[0].x == 2.0
+    assert meshes["fluid-2"].elements[0].node_indices == [3, 2, 1, 0]
+
+    barrier = threading.Barrier(2, timeout=5)
+    mesh = field_data.get_mesh("fluid-1")
+    assert mesh.elements[0]._id == 1
+
+
+def test_face_connectivity() -> None:
+    data = np.array([4, 4, 5, 12, 11, 3, 1, 2, 3, 2, 7, 8], dtype=np.int32)
+    connectivity = FaceConnectivity(data)
+    assert len(connectivity) == 3
+    assert connectivity.counts.tolist() == [4, 3, 2]
+    assert connectivity.offsets.tolist() == [0, 4, 7, 9]
+    assert connectivity.indices.tolist() == [4, 5, 12, 11, 1, 2, 3, 7, 8]
+    assert [face.tolist() for face in connectivity] == [
+        [4, 5, 12, 11],
+        [1, 2, 3],
+        [7, 8],
+    ]
+    assert connectivity[-1].tolist() == [7, 8]
+    assert [face.tolist() for face in connectivity[1:]] == [[1, 2, 3], [7, 8]]
+    assert np.shares_memory(connectivity[1], data)
+    assert connectivity.data is data
+
+    lines = FaceConnectivity(np.array([2, 0, 1, 2, 1, 2, 2, 2, 3], dtype=np.int32))
+    assert lines.offsets.tolist() == [0, 2, 4, 6]
+    assert lines[2].tolist() == [2, 3]
+    assert len(FaceConnectivity(np.array([], dtype=np.int32))) == 0
+
+    with pytest.warns(PyFluentDeprecationWarning):
+        surface_data = _ReturnFieldData._surface_data(
+            [SurfaceDataType.FacesConnectivity],
+            ["inlet"],
+            [3],
+            {3: {"faces": data}},
+        )
+    assert isinstance(surface_data["inlet"].connectivity, FaceConnectivity)
+    assert surface_data["inlet"].connectivity[0].tolist() == [4, 5, 12, 11]
+
+
+def test_field_data_cache_evicts_least_recently_used() -> None:
+    cache = FieldDataCache(max_bytes=200)
+    cache.put("a", {1: {"x": np.zeros(10)}})
+    cache.put("b", {1: {"x": np.zeros(10)}}, geometry=True)
+    assert cache.nbytes == 160
+    assert cache.get("a") is not None
+    cache.put("c", {1: {"x": np.zeros(6)}})
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+    cache.put("d", {1: {"x": np.zeros(100)}})
+    assert cache.get("d") is None
+    cache.put("e", {1: {"x": np.zeros(1)}}, geometry=True)
+    cache.invalidate()
+    assert len(cache) == 1 and cache.get("e") is not None
+    cache.clear()
+    assert len(cache) == 0 and cache.nbytes == 0
+
+    # Cached arrays are read-only.
+    cache.put("f", {1: {"x": np.zeros(1)}})
+    with pytest.raises(ValueError):
+        cache.get("f")[1]["x"][0] = 1.0
+    # A value fetched before an invalidation is not cached.
+    generation = cache.generation
+    cache.invalidate()
+    cache.put("g", {1: {"x": np.zeros(1)}}, generation=generation)
+    assert cache.get("g") is None
+
+
+def test_field_data_cache_invalidated_by_events() -> None:
+    class _FieldDataService:
+        def __init__(self):
+            self.calls = 0
+
+        def is_data_valid(self):
+            return True
+
+        def get_surfaces_info(self):
+            return {
+                "inlet": {
+                    "surface_id": [3],
+                    "zone_id": 5,
+                    "zone_type": "",
+                    "type": "zone-surf",
+                }
+            }
+
+        def get_scalar_fields_info(self):
+            return {
+                "temperature": {
+                    "display_name": "Static Temperature",
+                    "section": "Temperature...",
+                    "domain": "mixture",
+                    "quantity_name": "",
+                }
+            }
+
+        def _get_scalar_field_data(self, field_name, surface_ids, *args):
+            self.calls += 1
+            return {"scalar": {3: {field_name: np.arange(4.0)}}}
+
+        def _get_surface_data(self, data_types, surface_ids, overset_mesh):
+            self.calls += 1
+            return {"surface": {3: {"vertices": np.arange(6.0)}}}
+
+        def extract_fields(self, fields):
+            return fields
+
+    class _EventsManager:
+        def __init__(self):
+            self.callbacks = {}
+
+        def register_callback(self, event, callback):
+            callback_id = f"{event}-{len(self.callbacks)}"
+            self.callbacks[callback_id] = (event, callback)
+            return callback_id
+
+        def unregister_callback(self, callback_id):
+            del self.callbacks[callback_id]
+
+        def fire(self, event):
+            for registered_event, callback in list(self.callbacks.values()):
+                if registered_event == event:
+                    callback(session=None, event_info=None)
+
+    service = _FieldDataService()
+    events = _EventsManager()
+    field_data = LiveFieldData(
+        service, _FieldInfo(service), None, events_manager=events
+    )
+    scalar_request = ScalarFieldDataRequest(
+        field_name="temperature", surfaces=["inlet"]
+    )
+    surface_request = SurfaceFieldDataRequest(
+        data_types=[SurfaceDataType.Vertices], surfaces=["inlet"]
+    )
+
+    field_data.get_field_data(scalar_request)
+    field_data.get_field_data(scalar_request)
+    assert service.calls == 2
+    assert field_data.cache is None
+
+    field_data.enable_cache()
+    for _ in range(2):
+        temperature = field_data.get_field_data(scalar_request)["inlet"]
+        field_data.get_field_data(surface_request)
+    assert service.calls == 4
+    assert temperature.tolist() == [0.0, 1.0, 2.0, 3.0]
+
+    # Solution data is not cached while the solver runs.
+    assert SolverEvent.ITERATION_ENDED not in {
+        event for event, _ in events.callbacks.values()
+    }
+    events.fire(SolverEvent.CALCULATIONS_STARTED)
+    for _ in range(2):
+        field_data.get_field_data(scalar_request)
+        field_data.get_field_data(surface_request)
+    assert service.calls == 6
+    events.fire(SolverEvent.CALCULATIONS_ENDED)
+    for _ in range(2):
+        field_data.get_field_data(scalar_request)
+        field_data.get_field_data(surface_request)
+    assert service.calls == 7
+    events.fire(SolverEvent.DATA_LOADED)
+    field_data.get_field_data(scalar_request)
+    field_data.get_field_data(surface_request)
+    assert service.calls == 8
+
+    events.fire(SolverEvent.CASE_LOADED)
+    field_data.get_field_data(surface_request)
+    assert service.calls == 9
+
+    field_data.disable_cache()
+    assert events.callbacks == {}
+    field_data.get_field_data(surface_request)
+    assert service.calls == 10
+
+
+def test_surface_ids_validated_in_bulk() -> None:
+    class _FieldDataService:
+        def __init__(self):
+            self.surfaces_info_calls = 0
+            self.batched_surface_ids = []
+
+        def is_data_valid(self):
+            return True
+
+        def get_surfaces_info(self):
+            self.surfaces_info_calls += 1
+            return {
+                f"wall-{i}": {
+                    "surface_id": [i],
+                    "zone_id": i,
+                    "zone_type": "wall",
+                    "type": "zone-surf",
+                }
+                for i in range(500)
+            }
+
+        def get_vector_fields_info(self):
+            return {"velocity": {"x-component": "x-velocity"}}
+
+        def _get_vector_field_data(self, field_name, surface_ids):
+            return {
+                "vector": {
+                    surface_id: {field_name: np.arange(3.0)}
+                    for surface_id in surface_ids
+                }
+            }
+
+        def _add_vector_fields_request(self, field_name, surfaces):
+            self.batched_surface_ids.extend(surfaces)
+
+        def extract_fields(self, fields):
+            return fields
+
+    class _Scheme:
+        def string_eval(self, *args):
+            raise AssertionError("Unexpected scheme query.")
+
+    service = _FieldDataService()
+    field_data = LiveFieldData(service, _FieldInfo(service), _Scheme())
+
+    data = field_data.get_field_data(
+        VectorFieldDataRequest(field_name="velocity", surfaces=list(range(500)))
+    )
+    assert len(data) == 500
+    assert service.surfaces_info_calls == 1
+
+    assert field_data.get_surface_ids(["wall-3", 7, "wall-9"]) == [3, 7, 9]
+    assert service.surfaces_info_calls == 2
+    with pytest.raises(DisallowedValuesError):
+        field_data.get_surface_ids([1000])
+    with pytest.raises(DisallowedValuesError):
+        field_data.get_surface_ids(["no-such-surface"])
+
+    service.surfaces_info_calls = 0
+    batch = field_data.new_batch(validate_surface_ids=False)
+    batch.add_requests(
+        VectorFieldDataRequest(field_name="velocity", surfaces=[1000, 1001])
+    )
+    assert service.batched_surface_ids == [1000, 1001]
+    assert service.surfaces_info_calls == 0
+
+
+class _BatchFieldDataService:
+    """Field data stand-in that streams batched requests back per surface."""
+
+    def __init__(self, surface_count):
+        self.surface_count = surface_count
+        self.requests = []
+        self.barrier = None
+
+    def is_data_valid(self):
+        return True
+
+    def get_surfaces_info(self):
+        return {
+            f"wall-{i}": {
+                "surface_id": [i],
+                "zone_id": i,
+                "zone_type": "wall",
+                "type": "zone-surf",
+            }
+            for i in range(self.surface_count)
+        }
+
+    def get_scalar_fields_info(self):
+        return {
+            "temperature": {
+                "display_name": "Static Temperature",
+                "section": "Temperature...",
+                "domain": "mixture",
+                "quantity_name": "",
+            }
+        }
+
+    def get_vector_fields_info(self):
+        return {"velocity": {"x-component": "x-velocity"}}
+
+    def _add_scalar_fields_request(self, field_name, surfaces, **kwargs):
+        self.requests.extend(
+            (
+                (
+                    ("type", "scalar-field"),
+                    ("dataLocation", 1),
+                    ("boundaryValues", True),
+                ),
+                surface_id,
+                field_name,
+            )
+            for surface_id in surfaces
+        )
+
+    def _add_surfaces_request(self, data_types, surfaces, overset_mesh):
+        self.requests.extend(
+            ((("type", "surface-data"),), surface_id, data_type.value)
+            for surface_id in surfaces
+            for data_type in data_types
+        )
+
+    def get_batched_fields(self):
+        return self.requests
+
+    def get_batched_fields_streams(self, streams):
+        return [self.requests[i::streams] for i in range(streams)]
+
+    def iter_fields(self, requests):
+        if self.barrier is not None:
+            self.barrier.wait(timeout=5)
+        for payload_tag_id, surface_id, field_name in requests:
+            size = 3 if field_name == "faces" else 6
+            yield payload_tag_id, surface_id, field_name, np.full(size, surface_id)
+
+
+def test_batch_iter_responses() -> None:
+    service = _BatchFieldDataService(surface_count=4)
+    field_data = LiveFieldData(service, _FieldInfo(service), None)
+    temperature_request = ScalarFieldDataRequest(
+        field_name="temperature", surfaces=["wall-1", 2]
+    )
+    surface_request = SurfaceFieldDataRequest(
+        data_types=[SurfaceDataType.Vertices, SurfaceDataType.FacesConnectivity],
+        surfaces=[3],
+        flatten_connectivity=True,
+    )
+    batch = field_data.new_batch().add_requests(temperature_request, surface_request)
+
+    responses = list(batch.iter_responses())
+    assert [(request, surface) for request, surface, _ in responses] == [
+        (temperature_request, "wall-1"),
+        (temperature_request, 2),
+        (surface_request, 3),
+    ]
+    assert responses[0][2].tolist() == [1] * 6
+    assert responses[2][2].vertices.shape == (2, 3)
+    assert responses[2][2].connectivity.tolist() == [3, 3, 3]
+
+    service.barrier = threading.Barrier(2)
+    responses = list(batch.iter_responses(streams=2))
+    assert len(responses) == 3
+    assert {surface for _, surface, _ in responses} == {"wall-1", 2, 3}
+
+    with pytest.raises(ValueError):
+        next(batch.iter_responses(streams=0))
+
+
+def test_split_fields_request() -> None:
+    request = field_data_pb2.GetFieldsRequest(provide_bytes_stream=True, chunk_size=7)
+    request.scalar_field_requests.extend(
+        field_data_pb2.ScalarFieldRequest(surface_id=i) for i in range(3)
+    )
+    request.vector_field_requests.extend(
+        field_data_pb2.VectorFieldRequest(surface_id=i) for i in range(2)
+    )
+    parts = _split_fields_request(request, 2)
+    assert len(parts) == 2
+    assert all(part.chunk_size == 7 and part.provide_bytes_stream for part in parts)
+    assert [[r.surface_id for r in part.scalar_field_requests] for part in parts] == [
+        [0, 2],
+        [1],
+    ]
+    assert [[r.surface_id for r in part.vector_field_requests] for part in parts] == [
+        [1],
+        [0],
+    ]
+    assert len(_split_fields_request(request, 10)) == 5
+    assert len(_split_fields_request(field_data_pb2.GetFieldsRequest(), 3)) == 1
+
+
 @pytest.mark.skip(reason=SKIP_INVESTIGATING)
 # https://github.com/ansys/pyfluent/issues/2404
 def test_field_data_does_not_modify_case(new_solver_session):
@@ -632,6 +1158,11 @@ def test_mesh_data_2d_standard(disk_case_session):
     mesh = solver.fields.field_data.get_mesh(zone="fluid-7")
     assert len(mesh.nodes) == 6351
     assert len(mesh.elements) == 6192
+    assert mesh.arrays.node_coords.shape == (6351, 3)
+    assert mesh.arrays.element_offsets[-1] == len(mesh.arrays.element_connectivity)
+    chunks = list(solver.fields.field_data.iter_mesh(chunk_cells=1000))
+    assert all(len(arrays.element_ids) <= 1000 for _, arrays in chunks)
+    assert sum(len(arrays.element_ids) for _, arrays in chunks) == 6192
     assert mesh.elements[0].element_type == CellElementType.QUADRILATERAL
     assert len(mesh.elements[0].node_indices) == 4
     assert min(mesh.nodes, key=lambda x: x.x).x == pytest_approx(0.0)
@@ -653,6 +1184,8 @@ def test_mesh_data_3d_poly(static_mixer_case_session):
     mesh = solver.fields.field_data.get_mesh(zone="fluid")
     assert len(mesh.nodes) == 82247
     assert len(mesh.elements) == 22771
+    assert mesh.arrays.element_facet_offsets[1] == 9
+    assert mesh.arrays.facet_offsets[-1] == len(mesh.arrays.facet_connectivity)
     assert mesh.elements[0].element_type == CellElementType.POLYHEDRON
     assert len(mesh.elements[0].node_indices) == 0
     assert len(mesh.elements[0].facets) == 9
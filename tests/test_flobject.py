@@ -24,15 +24,18 @@
 """Unit tests for flobject module."""
 
 from collections.abc import MutableMapping
+from contextlib import nullcontext
 import io
 import weakref
 
+import numpy as np
 import pytest
 from test_utils import MockTracingInterceptor, count_key_recursive
 
 from ansys.fluent.core import ExposureLevel
 from ansys.fluent.core.examples import download_file
 from ansys.fluent.core.services.interceptors import TracingInterceptor
+from ansys.fluent.core.services.settings import Settings
 from ansys.fluent.core.solver import flobject
 from ansys.fluent.core.solver.flobject import (
     InactiveObjectError,
@@ -423,7 +426,7 @@ class Proxy:
                 obj = obj.get_command(c)
         return obj
 
-    def get_var(self, path):
+    def get_var(self, path, as_array=False):
         return self.get_obj(path).get_state()
 
     def set_var(self, path, value):
@@ -527,6 +530,51 @@ def test_named_object():
     assert r.n_1["n5"]() == {"rl_1": [4.3, 2.1], "sl_1": ["oof", "rab"]}
 
 
+def test_diff_and_apply_diff():
+    set_vars = []
+
+    class RecordingProxy(Proxy):
+        def set_var(self, path, value):
+            set_vars.append((path, value))
+            return super().set_var(path, value)
+
+    r = flobject.get_root(RecordingProxy())
+    r.g_1 = {"r_1": 1.5, "i_2": 3, "b_3": False, "s_4": "foo"}
+    r.n_1["n1"] = {"rl_1": [1.2, 3.4], "sl_1": ["foo", "bar"]}
+    state = r.get_state()
+    state["g_1"]["r_1"] = 2.5
+    state["n_1"]["n1"]["rl_1"] = (1.2, 3.4)
+    state["n_1"]["n1"]["sl_1"] = ["baz"]
+    state["n_1"]["n2"] = {"rl_1": [0.5]}
+    assert r.diff(state) == {
+        "g_1.r_1": (1.5, 2.5),
+        'n_1["n1"].sl_1': (["foo", "bar"], ["baz"]),
+        'n_1["n2"]': (None, {"rl_1": [0.5]}),
+    }
+    assert r.g_1.r_1.diff(2.5) == {"": (1.5, 2.5)}
+
+    set_vars.clear()
+    changes = r.apply_diff(state)
+    assert list(changes) == ["g_1.r_1", 'n_1["n1"].sl_1', 'n_1["n2"]']
+    assert set_vars == [
+        (
+            "",
+            {
+                "g-1": {"r-1": 2.5},
+                "n-1": {"n1": {"sl-1": ["baz"]}, "n2": {"rl-1": [0.5]}},
+            },
+        )
+    ]
+    assert r.g_1.r_1() == 2.5
+    assert r.n_1["n2"].rl_1() == [0.5]
+
+    # Nothing is sent when the states already match.
+    set_vars.clear()
+    assert r.apply_diff(state) == {}
+    assert r.g_1.apply_diff({"r_1": 3.5}, current={"r_1": 3.5}) == {}
+    assert set_vars == []
+
+
 def test_list_object():
     r = flobject.get_root(Proxy())
     assert r.l_1.get_size() == 0
@@ -575,6 +623,15 @@ def test_list_object_set_state_with_quantity_values():
     assert r.l_1() == pytest.approx([0.0254, 0.0508, 0.8636])
 
 
+def test_numerical_list_as_array():
+    r = flobject.get_root(Proxy())
+    r.n_1["foo"] = {}
+    r.n_1["foo"].rl_1 = [1.0, 2.5]
+    array = r.n_1["foo"].rl_1.as_array()
+    assert isinstance(array, np.ndarray)
+    assert array.tolist() == [1.0, 2.5]
+
+
 def test_command():
     r = flobject.get_root(Proxy())
     r.g_1.r_1 = 2.4
@@ -608,6 +665,200 @@ def test_attrs():
         r.g_1.s_4.get_attr("allowed-values")
 
 
+class _CountingProxy(Proxy):
+    def __init__(self):
+        super().__init__()
+        self.get_attrs_calls = 0
+        self.recursive_get_attrs_calls = 0
+
+    def get_attrs(self, path, attrs, recursive=False):
+        self.get_attrs_calls += 1
+        if recursive:
+            self.recursive_get_attrs_calls += 1
+            return self._get_attrs_recursive(self.get_obj(path), attrs)
+        return super().get_attrs(path, attrs, recursive)
+
+    def _get_attrs_recursive(self, obj, attrs):
+        ret = {"attrs": obj.get_attrs(attrs)}
+        if getattr(obj, "objs", None):
+            ret["group_children"] = {
+                name: self._get_attrs_recursive(child, attrs)
+                for name, child in obj.objs.items()
+            }
+        return ret
+
+    def is_wildcard(self, input=None):
+        return False
+
+
+def test_attrs_cache():
+    proxy = _CountingProxy()
+    settings_service = Settings(proxy)
+    settings_service.enable_attrs_cache()
+    r = flobject.get_root(settings_service)
+    r._setattr("_version", "251")
+    s_4 = r.g_1.s_4
+    proxy.get_attrs_calls = 0
+    assert s_4.is_active()
+    assert s_4.get_attr("allowed-values") == ["foo", "bar"]
+    calls = proxy.get_attrs_calls
+    assert s_4.is_active()
+    assert s_4.get_attr("allowed-values") == ["foo", "bar"]
+    assert proxy.get_attrs_calls == calls
+
+    # A write through this client invalidates the cache.
+    r.g_1.b_3 = True
+    assert not s_4.is_active()
+    with pytest.raises(InactiveObjectError):
+        s_4.get_attr("allowed-values")
+
+    # So does a server event.
+    proxy.r.objs["g-1"].objs["b-3"].set_state(False)
+    assert not s_4.is_active()
+    settings_service._on_settings_changed(session=None, event_info=None)
+    assert s_4.is_active()
+
+    # Other attributes are not cached.
+    calls = proxy.get_attrs_calls
+    s_4.get_attr("deprecated-version")
+    s_4.get_attr("deprecated-version")
+    assert proxy.get_attrs_calls == calls + 2
+
+    settings_service.disable_attrs_cache()
+    calls = proxy.get_attrs_calls
+    s_4.is_active()
+    assert proxy.get_attrs_calls == calls + 1
+
+
+def test_prefetch_attrs(monkeypatch):
+    proxy = _CountingProxy()
+    r = flobject.get_root(Settings(proxy))
+    r._setattr("_version", "251")
+    g_1 = r.g_1
+    s_4 = g_1.s_4
+    proxy.get_attrs_calls = 0
+    with g_1.prefetch(attrs=["active?"]):
+        assert proxy.get_attrs_calls == 1
+        assert g_1.is_active()
+        assert all(getattr(g_1, name).is_active() for name in g_1.child_names)
+        assert proxy.get_attrs_calls == 1
+        # Attributes which were not prefetched are still fetched.
+        assert s_4.get_attr("allowed-values") == ["foo", "bar"]
+        assert proxy.get_attrs_calls == 2
+    # The snapshot is dropped on exit.
+    s_4.is_active()
+    assert proxy.get_attrs_calls == 3
+
+    # Without the context manager, the snapshot lives until the next write.
+    g_1.prefetch(attrs=["active?"], depth=1)
+    calls = proxy.get_attrs_calls
+    assert s_4.is_active()
+    assert proxy.get_attrs_calls == calls
+    g_1.b_3 = True
+    assert not s_4.is_active()
+    assert proxy.get_attrs_calls == calls + 1
+
+    # Only the object itself is fetched for depth 0.
+    proxy.recursive_get_attrs_calls = 0
+    with r.prefetch(attrs=["active?"], depth=0):
+        calls = proxy.get_attrs_calls
+        assert r.is_active()
+        assert proxy.get_attrs_calls == calls
+    assert proxy.recursive_get_attrs_calls == 0
+
+    # Completion only prefetches groups whose children are all leaves.
+    assert flobject._has_leaf_children(g_1)
+    assert not flobject._has_leaf_children(r)
+    prefetched = []
+    monkeypatch.setattr(
+        r.flproxy,
+        "prefetch_attrs",
+        lambda path, attrs, depth: prefetched.append(path) or nullcontext(),
+    )
+    monkeypatch.setattr(flobject, "_is_deprecated", lambda obj: False)
+    g_1._setattr("_version", "251")
+    g_1.get_completer_info()
+    r.get_completer_info()
+    assert prefetched == [g_1.path]
+
+
+def test_lazy_classes_and_static_info_cache(tmp_path, monkeypatch):
+    from ansys.fluent.core.module_config import config
+
+    monkeypatch.setattr(config, "settings_static_info_cache_dir", tmp_path)
+
+    class StaticInfoProxy(Proxy):
+        static_info_calls = 0
+
+        def get_static_info(self):
+            StaticInfoProxy.static_info_calls += 1
+            return super().get_static_info()
+
+    r = flobject.get_root(StaticInfoProxy(), build_id="build-1")
+    assert StaticInfoProxy.static_info_calls == 1
+    # Child classes and objects are built on first access.
+    child_classes = type(r)._child_classes
+    assert set(r.child_names) <= set(child_classes)
+    assert not child_classes._classes
+    assert "g_1" not in vars(r)
+    r.g_1.r_1 = 3.2
+    assert set(child_classes._classes) == {"g_1"}
+    assert r.g_1 is r.g_1
+    assert r.g_1.r_1() == 3.2
+
+    r = flobject.get_root(StaticInfoProxy(), build_id="build-1")
+    assert StaticInfoProxy.static_info_calls == 1
+    assert r.g_1.child_names == ["r_1", "i_2", "b_3", "s_4"]
+    flobject.get_root(StaticInfoProxy(), build_id="build-2")
+    assert StaticInfoProxy.static_info_calls == 2
+
+    # A corrupt cache file is ignored and rewritten.
+    cache_file = flobject._get_static_info_cache_file("", "build-1")
+    assert cache_file.parent == tmp_path
+    cache_file.write_bytes(cache_file.read_bytes()[:-8])
+    flobject.get_root(StaticInfoProxy(), build_id="build-1")
+    assert StaticInfoProxy.static_info_calls == 3
+    flobject.get_root(StaticInfoProxy(), build_id="build-1")
+    assert StaticInfoProxy.static_info_calls == 3
+
+    # The build id is only queried when the on-disk cache is looked up.
+    build_id_calls = []
+
+    def get_build_id():
+        build_id_calls.append(None)
+        return "build-1"
+
+    flobject.get_root(StaticInfoProxy(), build_id=get_build_id)
+    assert StaticInfoProxy.static_info_calls == 3
+    assert len(build_id_calls) == 1
+    monkeypatch.setattr(config, "settings_use_static_info_cache", False)
+    flobject.get_root(StaticInfoProxy(), build_id=get_build_id)
+    assert StaticInfoProxy.static_info_calls == 4
+    assert len(build_id_calls) == 1
+
+
+def test_lazy_class_names_do_not_depend_on_access_order(monkeypatch):
+    info = {
+        "type": "group",
+        "children": {
+            "a": {
+                "type": "group",
+                "children": {"f": {"type": "string", "file_purpose": "input"}},
+            },
+            "f": {"type": "string", "file_purpose": "output"},
+        },
+    }
+    monkeypatch.setattr(flobject, "_bases_by_class", {})
+    cls, _ = flobject.get_cls("", info, version="251")
+    # Access the classes in the reverse order of a depth-first construction.
+    f_cls = cls._child_classes["f"]
+    a_f_cls = cls._child_classes["a"]._child_classes["f"]
+    # The names are those of a depth-first construction.
+    assert a_f_cls.__name__ == "f"
+    assert f_cls.__name__ == "f_1"
+    assert cls.child_names == ["a", "f"]
+
+
 def test_exposure_level_filtering(monkeypatch):
     """Test that beta/alpha objects are hidden by default and revealed by activation."""
     from ansys.fluent.core.module_config import config
@@ -0,0 +1,127 @@
+# Copyright (C) 2021 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import time
+
+import numpy as np
+import pytest
+
+from ansys.api.fluent.v0 import settings_pb2 as settings_pb2_v0
+from ansys.api.fluent.v1 import settings_pb2
+from ansys.fluent.core._grpc_services._packed_values import (
+    pack_value_list,
+    unpack_value_list,
+)
+from ansys.fluent.core._grpc_services.settings_service import SettingsService
+from ansys.fluent.core._grpc_services.settings_service_v0 import (
+    SettingsService as SettingsServiceV0,
+)
+
+
+def _generic_value_list(values):
+    """Encode ``values`` one nested ``Value`` per item, as the generic path does."""
+    state = settings_pb2.Value()
+    for v in values:
+        item = state.value_list.lsts.add()
+        if isinstance(v, bool):
+            item.boolean = v
+        elif isinstance(v, int):
+            item.integer = v
+        else:
+            item.real = v
+    return state.value_list
+
+
+_SAMPLES = [
+    [float(i) / 3 for i in range(-100, 100)] + [float("inf"), -0.0],
+    [0, 1, -1, 127, 128, -128, 2**31, -(2**31), 2**63 - 1, -(2**63)] * 20,
+    [True, False, False, True] * 30,
+]
+
+
+@pytest.mark.parametrize("values", _SAMPLES)
+def test_pack_value_list_matches_generic_encoding(values):
+    expected = _generic_value_list(values)
+    assert pack_value_list(values) == expected.SerializeToString()
+    assert pack_value_list(np.array(values)) == expected.SerializeToString()
+
+
+@pytest.mark.parametrize("values", _SAMPLES)
+def test_unpack_value_list(values):
+    value_list = _generic_value_list(values)
+    decoded = unpack_value_list(value_list, value_list.lsts)
+    assert isinstance(decoded, np.ndarray)
+    assert decoded.tolist() == values
+
+
+def test_packed_values_fall_back_to_generic_path():
+    # Short, heterogeneous and nested lists are not packed.
+    assert pack_value_list([1.0] * 10) is None
+    assert pack_value_list([1.0] * 100 + [1]) is None
+    assert pack_value_list([1.0] * 100 + ["x"]) is None
+    assert pack_value_list(np.ones((100, 3))) is None
+    assert pack_value_list([2**64] * 100) is None
+    value_list = _generic_value_list([1.0] * 100 + [1])
+    assert unpack_value_list(value_list, value_list.lsts) is None
+    state = settings_pb2.Value()
+    for i in range(100):
+        state.value_list.lsts.add().string = str(i)
+    assert unpack_value_list(state.value_list, state.value_list.lsts) is None
+
+
+@pytest.mark.parametrize(
+    "service_class, value_class",
+    [(SettingsService, settings_pb2.Value), (SettingsServiceV0, settings_pb2_v0.Value)],
+)
+def test_settings_service_round_trips_numeric_lists(service_class, value_class):
+    service = service_class.__new__(service_class)
+    value = {
+        "reals": np.linspace(0.0, 1.0, 1000),
+        "integers": list(range(-500, 500)),
+        "mixed": [1, 2.5] * 50,
+        "short": [1, 2, 3],
+    }
+    state = value_class()
+    service._set_state_from_value(state, value)
+    wire_state = value_class.FromString(state.SerializeToString())
+    as_list = service._get_state_from_value(wire_state)
+    assert as_list == {k: list(v) for k, v in value.items()}
+    assert isinstance(as_list["reals"], list)
+    as_array = service._get_state_from_value(wire_state, as_array=True)
+    assert isinstance(as_array["reals"], np.ndarray)
+    assert isinstance(as_array["integers"], np.ndarray)
+    assert np.array_equal(as_array["reals"], value["reals"])
+    assert as_array["mixed"] == value["mixed"]
+
+
+@pytest.mark.nightly
+def test_settings_service_numeric_list_benchmark():
+    service = SettingsService.__new__(SettingsService)
+    values = np.random.rand(1_000_000)
+    start = time.perf_counter()
+    state = settings_pb2.Value()
+    service._set_state_from_value(state, values)
+    wire_state = settings_pb2.Value.FromString(state.SerializeToString())
+    decoded = service._get_state_from_value(wire_state, as_array=True)
+    assert time.perf_counter() - start < 1.0
+    assert np.array_equal(decoded, values)
@@ -21,14 +21,298 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+from concurrent import futures
+import inspect
+from multiprocessing import shared_memory
+
+import grpc
 import numpy as np
 import pytest
 
+from ansys.api.fluent.v1 import solution_variable_pb2, solution_variable_pb2_grpc
 from ansys.fluent.core import examples
+from ansys.fluent.core._grpc_services import _shared_memory, solution_variable_service
+from ansys.fluent.core._grpc_services.field_data_service import _FieldDataConstants
 from ansys.fluent.core.examples.downloads import download_file
+from ansys.fluent.core.module_config import config
+from ansys.fluent.core.utils.networking import get_free_port
 from ansys.units.variable_descriptor import VariableCatalog
 
 
+class _ValidNames:
+    def __init__(self, names=None):
+        self._names = names or {}
+
+    def valid_name(self, name, *args):
+        return self._names.get(name, name)
+
+
+class _Call:
+    def __init__(self, responses):
+        self._responses = responses
+        self.cancelled = False
+
+    def __iter__(self):
+        return iter(self._responses)
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class _GetDataStub:
+    def __init__(self, data):
+        self.data = data
+        self.started_calls = []
+        self.calls = []
+
+    def GetSolutionVariableData(self, request, metadata):
+        self.started_calls.append((request.domain_id, request.name))
+        service = _set_data_service()
+        service.set_data(
+            request.name,
+            {zone: self.data[request.name][zone] for zone in request.zones},
+            "mixture",
+            _ValidNames(),
+            _ValidNames({"mixture": request.domain_id}),
+            _ValidNames(),
+        )
+        requests = service._stub.requests
+        call = _Call(
+            solution_variable_pb2.GetSolutionVariableDataResponse(
+                **{r.WhichOneof("array"): getattr(r, r.WhichOneof("array"))}
+            )
+            for r in requests[1:]
+        )
+        self.calls.append(call)
+        return call
+
+
+def _set_data_service():
+    service = solution_variable_service.SolutionVariableService.__new__(
+        solution_variable_service.SolutionVariableService
+    )
+    service._stub = _SetDataStub()
+    service._metadata = []
+    return service
+
+
+def test_solution_variable_get_data_many_reuses_out_arrays():
+    data = {
+        name: {3: np.random.rand(1000), 4: np.random.rand(10)}
+        for name in ["SV_P", "SV_T"]
+    }
+    service = solution_variable_service.SolutionVariableService.__new__(
+        solution_variable_service.SolutionVariableService
+    )
+    service._stub = _GetDataStub(data)
+    service._metadata = []
+    allowed_names = _ValidNames()
+    allowed_names.valid_names = lambda names, zones, domain: list(names)
+
+    def get_data_many(out):
+        return service.get_data_many(
+            ["SV_P", "SV_T"],
+            ["wall", "inlet"],
+            ["mixture", "phase-1"],
+            allowed_names,
+            _ValidNames({"mixture": 1, "phase-1": 2}),
+            _ValidNames({"wall": 3, "inlet": 4}),
+            out=out,
+        )
+
+    out = {}
+    zone_id_name_map, svar_data = get_data_many(out)
+    assert zone_id_name_map == {3: "wall", 4: "inlet"}
+    assert service._stub.started_calls == [
+        (1, "SV_P"),
+        (1, "SV_T"),
+        (2, "SV_P"),
+        (2, "SV_T"),
+    ]
+    for domain_name in ["mixture", "phase-1"]:
+        for name in ["SV_P", "SV_T"]:
+            for zone_id, zone_name in zone_id_name_map.items():
+                zone_array = out[domain_name][name][zone_name]
+                assert svar_data[domain_name][name][zone_id] is zone_array
+                np.testing.assert_array_equal(zone_array, data[name][zone_id])
+    wall_pressure = out["mixture"]["SV_P"]["wall"]
+    data["SV_P"][3][:] = 5.0
+    _, svar_data = get_data_many(out)
+    assert svar_data["mixture"]["SV_P"][3] is wall_pressure
+    assert (wall_pressure == 5.0).all()
+
+    out["mixture"]["SV_P"]["wall"] = np.empty(10)
+    service._stub.calls = []
+    with pytest.raises(ValueError):
+        get_data_many(out)
+    # The calls started before the error are cancelled.
+    assert len(service._stub.calls) == 4
+    assert all(call.cancelled for call in service._stub.calls)
+
+
+class _SetDataStub:
+    def __init__(self):
+        self.requests = None
+
+    def SetSolutionVariableData(self, requests, metadata):
+        # The requests are streamed from a generator, not built up front.
+        assert inspect.isgenerator(requests)
+        self.requests = list(requests)
+
+
+@pytest.mark.parametrize("bytes_stream", [True, False])
+def test_solution_variable_set_data_streams_chunks(bytes_stream, monkeypatch):
+    monkeypatch.setattr(_FieldDataConstants, "bytes_stream", bytes_stream)
+    monkeypatch.setattr(_FieldDataConstants, "chunk_size", 1024)
+    service = _set_data_service()
+    data = {
+        "wall": np.random.rand(1000),
+        "inlet": np.arange(300, dtype=np.int32)[::-1],
+        "outlet": np.arange(5, dtype=np.float32),
+    }
+    service.set_data(
+        "SV_T",
+        data,
+        "mixture",
+        _ValidNames(),
+        _ValidNames({"mixture": 1}),
+        _ValidNames({"wall": 3, "inlet": 4, "outlet": 5}),
+    )
+    requests = service._stub.requests
+    assert requests[0].header.name == "SV_T" and requests[0].header.domain_id == 1
+    payloads = [r.payload for r in requests if r.WhichOneof("array") == "payload"]
+    # 1000 doubles, 300 ints and 5 floats in chunks of 1024 bytes
+    assert len(payloads) == 8 + 2 + 1
+    assert all(bool(p.byte_payload) == bytes_stream for p in payloads)
+    svars = solution_variable_service.extract_svars(iter(requests[1:]))
+    for zone_id, zone_name in [(3, "wall"), (4, "inlet"), (5, "outlet")]:
+        assert svars[zone_id].dtype == data[zone_name].dtype
+        np.testing.assert_array_equal(svars[zone_id], data[zone_name])
+
+
+class _SharedMemorySolutionVariableServicer(
+    solution_variable_pb2_grpc.SolutionVariableServicer
+):
+    """Stand-in for Fluent implementing the shared-memory transport."""
+
+    def __init__(self):
+        self.data = {}
+        self.set_data_regions = []
+
+    def GetSolutionVariableData(self, request, context):
+        metadata = [(m.key, m.value) for m in context.invocation_metadata()]
+        assert (
+            _shared_memory.SHARED_MEMORY_KEY,
+            _shared_memory.SHARED_MEMORY_OFFER,
+        ) in metadata
+        arrays = [self.data[zone] for zone in request.zones]
+        region = shared_memory.SharedMemory(
+            create=True, size=sum(array.nbytes for array in arrays)
+        )
+        context.send_initial_metadata([(_shared_memory.SHARED_MEMORY_KEY, region.name)])
+        offset = 0
+        for zone, array in zip(request.zones, arrays):
+            region.buf[offset : offset + array.nbytes] = array.view(np.uint8)
+            yield solution_variable_pb2.GetSolutionVariableDataResponse(
+                payload_info=solution_variable_pb2.Info(
+                    field_type=_FieldDataConstants.np_data_type_to_proto_field_type[
+                        array.dtype.type
+                    ],
+                    field_size=array.size,
+                    zone=zone,
+                )
+            )
+            yield solution_variable_pb2.GetSolutionVariableDataResponse(
+                payload=solution_variable_pb2.Payload(
+                    byte_payload=_shared_memory.pack_descriptor(offset, array.nbytes)
+                )
+            )
+            offset += array.nbytes
+        region.close()
+
+    def SetSolutionVariableData(self, request_iterator, context):
+        region_name = _shared_memory.get_region_name(
+            (m.key, m.value) for m in context.invocation_metadata()
+        )
+        self.set_data_regions.append(region_name)
+        region = region_name and shared_memory.SharedMemory(name=region_name)
+        for request in request_iterator:
+            if request.WhichOneof("array") == "payload_info":
+                zone = request.payload_info.zone
+                dtype = _FieldDataConstants.proto_field_type_to_np_data_type[
+                    request.payload_info.field_type
+                ]
+                self.data[zone] = np.empty(0, dtype=dtype)
+            elif request.WhichOneof("array") == "payload":
+                data = request.payload.byte_payload
+                if region:
+                    offset, size = _shared_memory.unpack_descriptor(data)
+                    data = bytes(region.buf[offset : offset + size])
+                self.data[zone] = np.concatenate(
+                    (self.data[zone], np.frombuffer(data, dtype))
+                )
+        if region:
+            region.close()
+        return solution_variable_pb2.SetSolutionVariableDataResponse()
+
+
+def test_solution_variable_shared_memory_transport(monkeypatch):
+    monkeypatch.setattr(config, "use_shared_memory_transport", True)
+    servicer = _SharedMemorySolutionVariableServicer()
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=1))
+    port = get_free_port()
+    server.add_insecure_port(f"127.0.0.1:{port}")
+    solution_variable_pb2_grpc.add_SolutionVariableServicer_to_server(servicer, server)
+    server.start()
+    zone_names = _ValidNames({"wall": 3, "inlet": 4})
+    try:
+        with grpc.insecure_channel(f"127.0.0.1:{port}") as channel:
+            service = solution_variable_service.SolutionVariableService(
+                channel, [], None
+            )
+            data = {
+                "wall": np.random.rand(100_000),
+                "inlet": np.arange(7, dtype=np.int32),
+            }
+
+            def set_data():
+                service.set_data(
+                    "SV_T",
+                    data,
+                    "mixture",
+                    _ValidNames(),
+                    _ValidNames({"mixture": 1}),
+                    zone_names,
+                )
+
+            # The arrays are streamed until Fluent accepts the transport.
+            set_data()
+            assert servicer.set_data_regions == [None]
+            zone_id_name_map, svars = service.get_data(
+                "SV_T",
+                ["wall", "inlet"],
+                "mixture",
+                _ValidNames(),
+                _ValidNames({"mixture": 1}),
+                zone_names,
+            )
+            assert zone_id_name_map == {3: "wall", 4: "inlet"}
+            for zone_id, zone_name in zone_id_name_map.items():
+                assert svars[zone_id].dtype == data[zone_name].dtype
+                np.testing.assert_array_equal(svars[zone_id], data[zone_name])
+
+            data["wall"] = np.random.rand(100_000)
+            set_data()
+            region_name = servicer.set_data_regions[-1]
+            assert region_name is not None
+            np.testing.assert_array_equal(servicer.data[3], data["wall"])
+            np.testing.assert_array_equal(servicer.data[4], data["inlet"])
+            with pytest.raises(FileNotFoundError):
+                shared_memory.SharedMemory(name=region_name)
+    finally:
+        server.stop(None)
+
+
 def test_solution_variables(new_solver_session):
     solver = new_solver_session
     import_file_name = examples.download_file(
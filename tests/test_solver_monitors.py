@@ -21,10 +21,128 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import numpy as np
+import pytest
+
 from ansys.fluent.core import examples
+from ansys.fluent.core.streaming_services.monitor_streaming import MonitorsManager
 from ansys.fluent.core.utils.execution import timeout_loop
 
 
+class _MonitorsService:
+    def get_monitors_info(self):
+        return {
+            "residual": {"title": "Residuals", "monitors": ["continuity", "energy"]},
+            "mass-rplot": {"title": "Mass", "monitors": ["mass-in"]},
+            "empty": {"title": "Empty"},
+        }
+
+
+def _monitors_manager():
+    monitors = MonitorsManager("session", _MonitorsService())
+    monitors._prepare()
+    return monitors
+
+
+def _stream(monitors, start, stop):
+    for i in range(start, stop):
+        sample = {"xvalues": i, "continuity": 1.0 / (i + 1), "energy": float(i)}
+        if i % 2:
+            sample["mass-in"] = -float(i)
+        monitors._populate_dataframes(sample)
+
+
+def test_monitors_manager_columnar_store():
+    monitors = _monitors_manager()
+    assert monitors.get_monitor_set_names() == ["residual", "mass-rplot"]
+    xvalues, yvalues = monitors.get_monitor_set_data("residual")
+    assert len(xvalues) == 0 and yvalues == {}
+    assert monitors.get_monitor_set_plot("residual") is None
+
+    callback_calls = []
+    monitors.register_callback(lambda: callback_calls.append(None))
+    _stream(monitors, 0, 3000)
+    assert len(callback_calls) == 3000 + 1500
+
+    first_x, first_y = monitors.get_monitor_set_data("residual", 10, 20)
+    assert first_x.tolist() == list(range(10, 20))
+    np.testing.assert_array_equal(first_y["energy"], np.arange(10.0, 20.0))
+    xvalues, yvalues = monitors.get_monitor_set_data("residual", -5)
+    assert xvalues.tolist() == list(range(2995, 3000))
+    # Slices are read-only views of the store, not copies.
+    assert np.shares_memory(xvalues, monitors.get_monitor_set_data("residual")[0])
+    with pytest.raises(ValueError):
+        yvalues["continuity"][0] = 0.0
+    xvalues, yvalues = monitors.get_monitor_set_data("mass-rplot")
+    assert xvalues.tolist() == list(range(1, 3000, 2))
+    np.testing.assert_array_equal(yvalues["mass-in"], -xvalues)
+
+    df = monitors.to_dataframe("residual")
+    assert monitors.to_dataframe("residual") is df
+    assert list(df.columns) == ["continuity", "energy"]
+    assert df.index.name == "xvalues"
+    np.testing.assert_array_equal(df.index.to_numpy(), np.arange(3000))
+
+    _stream(monitors, 3000, 5000)
+    # Data returned earlier is unaffected by the store growing.
+    assert first_x.tolist() == list(range(10, 20))
+    np.testing.assert_array_equal(first_y["energy"], np.arange(10.0, 20.0))
+    assert len(df) == 3000
+    assert len(monitors.to_dataframe("residual")) == 5000
+
+
+def test_monitors_manager_downsampling_and_rolling_window():
+    monitors = _monitors_manager()
+    energy = np.arange(1000.0)
+    energy[123] = 1e6
+    energy[877] = -1e6
+    for i, value in enumerate(energy):
+        monitors._populate_dataframes(
+            {"xvalues": i, "continuity": 1.0, "energy": value}
+        )
+
+    xvalues, yvalues = monitors.get_monitor_set_data("residual", max_points=100)
+    assert len(xvalues) <= 100
+    assert xvalues[0] == 0 and xvalues[-1] == 999
+    assert (np.diff(xvalues) >= 0).all()
+    # The extrema of every bucket are kept.
+    assert yvalues["energy"].max() == 1e6 and yvalues["energy"].min() == -1e6
+    assert set(yvalues["energy"]) <= set(energy)
+
+    xvalues, yvalues = monitors.get_monitor_set_data("residual", 500, 510, window=4)
+    assert xvalues.tolist() == list(range(500, 510))
+    expected = [energy[i - 3 : i + 1].mean() for i in range(500, 510)]
+    np.testing.assert_allclose(yvalues["energy"], expected)
+    xvalues, yvalues = monitors.get_monitor_set_data("residual", 0, 3, window=10)
+    np.testing.assert_allclose(yvalues["energy"], [0.0, 0.5, 1.0])
+
+    # Samples streamed after a query are folded into the aggregates.
+    _stream(monitors, 1000, 1500)
+    xvalues, yvalues = monitors.get_monitor_set_data(
+        "residual", -300, max_points=50, window=100
+    )
+    assert len(xvalues) <= 50 and xvalues[-1] == 1499
+    np.testing.assert_allclose(yvalues["energy"][-1], np.arange(1400.0, 1500.0).mean())
+
+    with pytest.raises(ValueError):
+        monitors.get_monitor_set_data("residual", max_points=1)
+    with pytest.raises(ValueError):
+        monitors.get_monitor_set_data("residual", window=0)
+
+
+@pytest.mark.nightly
+def test_monitors_manager_streaming_benchmark():
+    monitors = _monitors_manager()
+    _stream(monitors, 0, 100_000)
+    xvalues, yvalues = monitors.get_monitor_set_data("residual")
+    assert len(xvalues) == 100_000
+    assert len(monitors.to_dataframe("mass-rplot")) == 50_000
+    xvalues, yvalues = monitors.get_monitor_set_data(
+        "residual", max_points=2000, window=100
+    )
+    assert len(xvalues) <= 2000
+
+
 def test_solver_monitors(new_solver_session):
 
     solver = new_solver_session